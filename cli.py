@@ -0,0 +1,123 @@
+import argparse
+import csv
+import json
+import math
+import sys
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, List
+
+# Add the project root to the Python path
+file_path = Path(__file__).parent.resolve()
+sys.path.append(str(file_path))
+
+# Headless entry point: only NumPy is imported, never Streamlit, matplotlib or pandas
+from src.strategies import PiecewiseLinearPayoff, solve_payoff_profile
+from src.strategies.price_grid import UNIFORM, GRID_MODES
+from src.utils.strategy_registry import STRATEGY_REGISTRY
+
+def load_spec(path: str) -> List[Dict]:
+    # JSON: one scenario object or a list of them. CSV: one scenario per row.
+    # Each scenario has a 'strategy' name, the fields of its *Inputs dataclass and an optional 'grid_mode'
+    with open(path, newline='') as spec_file:
+        if path.lower().endswith('.csv'):
+            return list(csv.DictReader(spec_file))
+        spec = json.load(spec_file)
+    return spec if isinstance(spec, list) else [spec]
+
+def _finite_or_none(value: float):
+    # JSON has no infinity, unbounded profit/loss is written as null
+    return value if abs(value) != float('inf') else None
+
+def _invalid(strategy, message: str, inputs: Dict = None) -> Dict:
+    result = {'strategy': strategy} if inputs is None else {'strategy': strategy, 'inputs': inputs}
+    return {**result, 'valid': False, 'message': message}
+
+def evaluate_scenario(scenario: Dict) -> Dict:
+    # A malformed row is reported as an invalid result, it never stops the rest of the batch
+    definition = STRATEGY_REGISTRY.get(str(scenario.get('strategy', '')))
+    if definition is None:
+        return _invalid(scenario.get('strategy'), "Unknown strategy selected.")
+    name = definition.key
+
+    values = {}
+    for field in fields(definition.inputs_class):
+        if scenario.get(field.name) in (None, ''):
+            return _invalid(name, f"Missing value for '{field.name}'")
+        try:
+            values[field.name] = float(scenario[field.name])
+        except (TypeError, ValueError):
+            return _invalid(name, f"'{field.name}' must be a number, got {scenario[field.name]!r}")
+        # float() also parses 'nan' and 'inf', neither is a usable strike, premium or grid bound
+        if not math.isfinite(values[field.name]):
+            return _invalid(name, f"'{field.name}' must be finite, got {scenario[field.name]!r}")
+    if values['step_size'] <= 0:
+        return _invalid(name, "Step size must be positive", values)
+    grid_mode = scenario.get('grid_mode') or UNIFORM
+    if grid_mode not in GRID_MODES:
+        return _invalid(name, f"Unknown grid mode '{grid_mode}', expected one of {GRID_MODES}", values)
+
+    inputs = definition.inputs_class(**values)
+    validation_result = definition.validator(inputs)
+    if not validation_result.is_valid:
+        return _invalid(name, validation_result.message, inputs.__dict__)
+
+    try:
+        strategy = definition.strategy_class(**inputs.__dict__, grid_mode=grid_mode)
+        profile = solve_payoff_profile(strategy.position.legs)
+    except ValueError as error:
+        # e.g. a price range the grid cannot be built from
+        return _invalid(name, str(error), inputs.__dict__)
+    return {
+        'strategy': name,
+        'inputs': inputs.__dict__,
+        'valid': True,
+        'break_even_points': definition.break_even_rule(strategy.position.legs).tolist(),
+        'max_profit': _finite_or_none(profile.max_profit),
+        'max_loss': _finite_or_none(profile.max_loss),
+        # Breakpoints and slopes, expands losslessly to any grid
+        'payoff_function': PiecewiseLinearPayoff.from_legs(strategy.position.legs).to_dict(),
+        'expiration_prices': strategy.expiration_prices.tolist(),
+        'net_payoff': strategy.position.payoff(strategy.expiration_prices).tolist()
+    }
+
+def write_results(results: List[Dict], output: str):
+    if output is None:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    with open(output, 'w', newline='') as output_file:
+        if output.lower().endswith('.csv'):
+            # Long format, one row per scenario and expiration price
+            writer = csv.writer(output_file)
+            writer.writerow(['scenario', 'strategy', 'expiration_price', 'net_payoff'])
+            for scenario_id, result in enumerate(results):
+                if result['valid']:
+                    for price, payoff in zip(result['expiration_prices'], result['net_payoff']):
+                        writer.writerow([scenario_id, result['strategy'], price, payoff])
+        else:
+            json.dump(results, output_file, indent=2)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Evaluate options strategy payoffs without the Streamlit app")
+    parser.add_argument("spec", help="JSON or CSV file describing the strategies to evaluate")
+    parser.add_argument("-o", "--output",
+                        help="Write results to this file (.csv for payoff rows, otherwise JSON); defaults to stdout")
+    parser.add_argument("--grid-mode", choices=GRID_MODES,
+                        help="Price grid for scenarios that do not set their own grid_mode")
+    args = parser.parse_args(argv)
+
+    results = []
+    for scenario in load_spec(args.spec):
+        if args.grid_mode and not scenario.get('grid_mode'):
+            scenario = {**scenario, 'grid_mode': args.grid_mode}
+        results.append(evaluate_scenario(scenario))
+    write_results(results, args.output)
+
+    invalid = [result for result in results if not result['valid']]
+    for result in invalid:
+        print(f"{result['strategy']}: {result['message']}", file=sys.stderr)
+    return 1 if invalid else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
+import importlib
+
 from .strategies import (
     BaseOptionsStrategy,
     LongCall,
@@ -12,19 +14,27 @@ from .strategies import (
     Strap,
     LongButterfly
 )
-from .utils import DataFormatter, StrategyValidator
-from .visualisations import (
-    Basic_Payoff_Plotter,
-    ComplexPayoffPlotter,
-    BullCallSpreadPlotter,
-    BearPutSpreadPlotter,
-    LongStraddlePlotter,
-    LongStranglePlotter,
-    StripPlotter,
-    StrapPlotter,
-    LongButterflyPlotter
-)
-from .visualisations.styling import render_header
+from .utils import StrategyValidator
+
+# The formatter (pandas), plotting (matplotlib) and styling (Streamlit) are imported on first access
+_LAZY_IMPORTS = {
+    'DataFormatter': '.utils',
+    'Basic_Payoff_Plotter': '.visualisations',
+    'ComplexPayoffPlotter': '.visualisations',
+    'BullCallSpreadPlotter': '.visualisations',
+    'BearPutSpreadPlotter': '.visualisations',
+    'LongStraddlePlotter': '.visualisations',
+    'LongStranglePlotter': '.visualisations',
+    'StripPlotter': '.visualisations',
+    'StrapPlotter': '.visualisations',
+    'LongButterflyPlotter': '.visualisations',
+    'render_header': '.visualisations.styling',
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     # Base and Single Options Strategies
@@ -60,4 +70,4 @@ __all__ = [
     
     # Styling
     'render_header'
-]
\ No newline at end of file
+]
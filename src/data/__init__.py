@@ -0,0 +1,36 @@
+from .result_store import ResultStore, save_batch_result
+from .option_chain import (
+    BID,
+    ASK,
+    MID,
+    NATURAL,
+    OptionChain,
+    load_option_chain,
+    fill_premiums_from_chain
+)
+from .scanner import (
+    REWARD_RISK,
+    BREAK_EVEN_DISTANCE,
+    PROBABILITY_OF_PROFIT,
+    ScanResult,
+    scan_strategy,
+    scan_chain
+)
+
+__all__ = [
+    'BID',
+    'ASK',
+    'MID',
+    'NATURAL',
+    'OptionChain',
+    'load_option_chain',
+    'fill_premiums_from_chain',
+    'REWARD_RISK',
+    'BREAK_EVEN_DISTANCE',
+    'PROBABILITY_OF_PROFIT',
+    'ScanResult',
+    'scan_strategy',
+    'scan_chain',
+    'ResultStore',
+    'save_batch_result'
+]
@@ -0,0 +1,178 @@
+import numpy as np
+from dataclasses import replace
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+from ..strategies.payoff_engine import CALL, PUT
+from ..strategies.legs import LONG
+
+# Quote used to fill a premium
+BID = 'bid'
+ASK = 'ask'
+MID = 'mid'
+NATURAL = 'natural'  # Ask for long legs, bid for short legs (the price you would actually trade at)
+
+QUOTE_SIDES = (BID, ASK, MID, NATURAL)
+
+# Column names of a snapshot; mid is optional and derived from bid/ask when missing
+CHAIN_COLUMNS = ('underlying', 'expiry', 'strike', 'type', 'bid', 'ask')
+
+DEFAULT_CHUNK_SIZE = 500_000
+
+ChainKey = Tuple[str, str, float, str]
+
+def _option_types(values) -> np.ndarray:
+    # 'C', 'call', 'Call' -> CALL and 'P', 'put' -> PUT
+    first_letters = np.char.lower(np.asarray(values, dtype=str).astype('<U1'))
+    if not np.isin(first_letters, ['c', 'p']).all():
+        raise ValueError("Option type must be a call or a put")
+    return np.where(first_letters == 'c', CALL, PUT).astype(object)
+
+# Normalised arrays of a chain, in OptionChain attribute order
+CHAIN_ARRAYS = ('underlying', 'expiry', 'strike', 'option_type', 'bid', 'ask', 'mid')
+
+def _chain_arrays(underlying, expiry, strike, option_type, bid, ask, mid=None) -> Dict[str, np.ndarray]:
+    arrays = {
+        'underlying': np.asarray(underlying, dtype=str).astype(object),
+        'expiry': np.asarray(expiry, dtype=str).astype(object),
+        'strike': np.asarray(strike, dtype=float),
+        'option_type': _option_types(option_type),
+        'bid': np.asarray(bid, dtype=float),
+        'ask': np.asarray(ask, dtype=float)
+    }
+    arrays['mid'] = (arrays['bid'] + arrays['ask']) / 2 if mid is None else np.asarray(mid, dtype=float)
+    if len({len(array) for array in arrays.values()}) > 1:
+        raise ValueError("All chain columns must have the same length")
+    return arrays
+
+def _index_entries(arrays: Mapping[str, np.ndarray], first_row: int = 0):
+    # (key, row) pairs for the hash index; a repeated key keeps its last row
+    keys = zip(arrays['underlying'].tolist(), arrays['expiry'].tolist(), arrays['strike'].tolist(),
+               arrays['option_type'].tolist())
+    return zip(keys, range(first_row, first_row + len(arrays['strike'])))
+
+class OptionChain:
+    # Columnar option-chain snapshot with a hash index on (underlying, expiry, strike, type)
+    def __init__(self, underlying, expiry, strike, option_type, bid, ask, mid=None):
+        arrays = _chain_arrays(underlying, expiry, strike, option_type, bid, ask, mid)
+        self._attach(arrays, dict(_index_entries(arrays)))
+
+    @classmethod
+    def _from_arrays(cls, arrays: Mapping[str, np.ndarray], index: Dict[ChainKey, int]) -> 'OptionChain':
+        # Normalised arrays and an index built alongside them (see _ChainBuilder)
+        chain = cls.__new__(cls)
+        chain._attach(arrays, index)
+        return chain
+
+    def _attach(self, arrays: Mapping[str, np.ndarray], index: Dict[ChainKey, int]):
+        for name in CHAIN_ARRAYS:
+            setattr(self, name, arrays[name])
+        # Every lookup is a dict access
+        self._index = index
+        self._expiry_rows: Dict[Tuple[str, str], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    def __contains__(self, key: ChainKey) -> bool:
+        return key in self._index
+
+    def row(self, underlying: str, expiry: str, strike: float, option_type: str) -> int:
+        return self._index[(underlying, expiry, float(strike), option_type)]
+
+    def quote(self, underlying: str, expiry: str, strike: float, option_type: str, side: str = MID) -> float:
+        if side not in (BID, ASK, MID):
+            raise ValueError(f"Quote side must be one of {(BID, ASK, MID)}")
+        return float(getattr(self, side)[self.row(underlying, expiry, strike, option_type)])
+
+    def expiry_rows(self, underlying: str, expiry: str) -> np.ndarray:
+        # Rows of one expiry sorted by strike, grouped lazily and kept for later calls
+        if (underlying, expiry) not in self._expiry_rows:
+            rows = np.flatnonzero((self.underlying == underlying) & (self.expiry == expiry))
+            self._expiry_rows[(underlying, expiry)] = rows[np.argsort(self.strike[rows], kind='stable')]
+        return self._expiry_rows[(underlying, expiry)]
+
+class _ChainBuilder:
+    # Column buffers filled one chunk at a time (capacity doubles when full), with the index extended
+    # as each chunk arrives, so no chunk is kept around once it has been copied in
+    def __init__(self, capacity: int):
+        self.size = 0
+        self.index: Dict[ChainKey, int] = {}
+        self.buffers = {name: np.empty(capacity, dtype=object if name in ('underlying', 'expiry', 'option_type')
+                                       else float) for name in CHAIN_ARRAYS}
+
+    def append(self, chunk: Mapping[str, np.ndarray]):
+        missing = [name for name in CHAIN_COLUMNS if name not in chunk]
+        if missing:
+            raise ValueError(f"Option chain is missing the columns {missing}")
+        arrays = _chain_arrays(chunk['underlying'], chunk['expiry'], chunk['strike'], chunk['type'],
+                               chunk['bid'], chunk['ask'], chunk.get('mid'))
+        end = self.size + len(arrays['strike'])
+        capacity = len(self.buffers['strike'])
+        if end > capacity:
+            capacity = max(2 * capacity, end)
+            for name, buffer in self.buffers.items():
+                grown = np.empty(capacity, dtype=buffer.dtype)
+                grown[:self.size] = buffer[:self.size]
+                self.buffers[name] = grown
+        for name, array in arrays.items():
+            self.buffers[name][self.size:end] = array
+        self.index.update(_index_entries(arrays, self.size))
+        self.size = end
+
+    def build(self) -> OptionChain:
+        # Unused capacity is trimmed one column at a time
+        arrays = {name: buffer if len(buffer) == self.size else buffer[:self.size].copy()
+                  for name, buffer in self.buffers.items()}
+        return OptionChain._from_arrays(arrays, self.index)
+
+# Readers yield one dict of column arrays (standard names) per chunk
+def _read_csv_chunks(path: str, chunk_size: int, columns: Mapping[str, str]) -> Iterator[Dict[str, np.ndarray]]:
+    import pandas as pd
+    renames = {source: target for target, source in columns.items()}
+    # The file is memory-mapped, so each chunk is parsed straight from the page cache
+    reader = pd.read_csv(path, chunksize=chunk_size, memory_map=True,
+                         usecols=lambda name: renames.get(name, name) in CHAIN_COLUMNS + ('mid',))
+    for frame in reader:
+        frame = frame.rename(columns=renames)
+        yield {name: frame[name].to_numpy() for name in frame.columns}
+
+def _read_parquet_chunks(path: str, chunk_size: int,
+                         columns: Mapping[str, str]) -> Iterator[Dict[str, np.ndarray]]:
+    # pyarrow is optional, only Parquet snapshots need it
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError("Reading Parquet option chains requires pyarrow (pip install pyarrow)") from error
+    # Memory-mapped, batches decode from the mapped column chunks instead of buffered reads
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    sources = {name: columns.get(name, name) for name in CHAIN_COLUMNS + ('mid',)}
+    sources = {name: source for name, source in sources.items() if source in parquet_file.schema_arrow.names}
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=list(sources.values())):
+        yield {name: batch.column(source).to_numpy(zero_copy_only=False) for name, source in sources.items()}
+
+def load_option_chain(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      columns: Optional[Mapping[str, str]] = None) -> OptionChain:
+    # Streams a CSV or Parquet snapshot chunk by chunk into one indexed chain; only one raw chunk is held
+    # at a time. `columns` maps the standard names in CHAIN_COLUMNS (and 'mid') to the file's own column names
+    columns = dict(columns or {})
+    reader = _read_parquet_chunks if str(path).lower().endswith(('.parquet', '.pq')) else _read_csv_chunks
+    builder = _ChainBuilder(chunk_size)
+    for chunk in reader(str(path), chunk_size, columns):
+        builder.append(chunk)
+    return builder.build()
+
+def leg_quote_side(side: str, leg_side: str) -> str:
+    # The quote a leg trades at; NATURAL resolves per leg, the other sides apply to every leg
+    if side not in QUOTE_SIDES:
+        raise ValueError(f"Quote side must be one of {QUOTE_SIDES}")
+    if side != NATURAL:
+        return side
+    return ASK if leg_side == LONG else BID
+
+def fill_premiums_from_chain(inputs, strategy_class, chain: OptionChain, underlying: str, expiry: str,
+                             side: str = MID):
+    # Copy of a frozen *Inputs dataclass with every premium_* field taken from the chain quote of its leg
+    premiums = {}
+    for leg in strategy_class.LEG_SPEC:
+        premiums[leg.premium_field] = chain.quote(underlying, expiry, getattr(inputs, leg.strike_field),
+                                                  leg.option_type, leg_quote_side(side, leg.side))
+    return replace(inputs, **premiums)
@@ -0,0 +1,91 @@
+import json
+import numpy as np
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Union
+from ..strategies.batch import BatchResult, broadcast_columns
+
+MANIFEST_FILE = 'manifest.json'
+FORMAT_VERSION = 1
+
+# BatchResult fields stored as one .npy file each
+RESULT_ARRAYS = ('expiration_prices', 'payoffs', 'break_even_points', 'max_profit', 'max_loss')
+
+def _describe(array: np.ndarray, file_name: str) -> Dict:
+    return {'file': file_name, 'shape': list(array.shape), 'dtype': array.dtype.str}
+
+def save_batch_result(path: Union[str, Path], result: BatchResult, inputs: Mapping[str, np.ndarray],
+                      strategy: Optional[str] = None) -> Path:
+    # A result set is a directory of raw .npy arrays (scenario inputs and payoff matrices) plus a
+    # JSON manifest; the manifest is written last so a half-written directory never looks complete
+    path = Path(path)
+    (path / 'inputs').mkdir(parents=True, exist_ok=True)
+    manifest = {'format_version': FORMAT_VERSION, 'strategy': strategy,
+                'n_scenarios': int(len(result.max_profit)), 'arrays': {}, 'inputs': {}}
+
+    for name in RESULT_ARRAYS:
+        array = np.ascontiguousarray(getattr(result, name))
+        np.save(path / f'{name}.npy', array)
+        manifest['arrays'][name] = _describe(array, f'{name}.npy')
+    # Scalar columns (fields held fixed, as evaluate_batch and run_sweep accept them) are stored repeated
+    n_scenarios = manifest['n_scenarios']
+    for name, values in broadcast_columns(inputs).items():
+        if len(values) not in (1, n_scenarios):
+            raise ValueError(f"Input '{name}' has {len(values)} values for {n_scenarios} scenarios")
+        array = np.ascontiguousarray(np.broadcast_to(values, (n_scenarios,)))
+        np.save(path / 'inputs' / f'{name}.npy', array)
+        manifest['inputs'][name] = _describe(array, f'inputs/{name}.npy')
+
+    with open(path / MANIFEST_FILE, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return path
+
+class ResultStore:
+    # Read side of save_batch_result: every array is memory-mapped on first access, so opening a
+    # multi-GB result set reads only the manifest and slicing a scenario touches only its rows
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path / MANIFEST_FILE) as manifest_file:
+            self.manifest = json.load(manifest_file)
+        if self.manifest.get('format_version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported result store version {self.manifest.get('format_version')}")
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def _open(self, entry: Dict) -> np.ndarray:
+        file_name = entry['file']
+        if file_name not in self._arrays:
+            self._arrays[file_name] = np.load(self.path / file_name, mmap_mode='r')
+        return self._arrays[file_name]
+
+    def __len__(self) -> int:
+        return self.manifest['n_scenarios']
+
+    @property
+    def strategy(self) -> Optional[str]:
+        return self.manifest['strategy']
+
+    @property
+    def input_names(self):
+        return list(self.manifest['inputs'])
+
+    def array(self, name: str) -> np.ndarray:
+        # Read-only memory map of one of RESULT_ARRAYS
+        return self._open(self.manifest['arrays'][name])
+
+    def inputs(self, name: str) -> np.ndarray:
+        return self._open(self.manifest['inputs'][name])
+
+    def to_batch_result(self) -> BatchResult:
+        # Zero-copy, the fields are the memory maps themselves
+        return BatchResult(**{name: self.array(name) for name in RESULT_ARRAYS})
+
+    def scenario(self, index: int) -> Dict:
+        # Inputs, payoff row and risk numbers of a single scenario
+        break_even_points = self.array('break_even_points')[index]
+        return {
+            'inputs': {name: float(self.inputs(name)[index]) for name in self.input_names},
+            'expiration_prices': self.array('expiration_prices'),
+            'payoffs': self.array('payoffs')[index],
+            'break_even_points': np.asarray(break_even_points[~np.isnan(break_even_points)]),
+            'max_profit': float(self.array('max_profit')[index]),
+            'max_loss': float(self.array('max_loss')[index])
+        }
@@ -0,0 +1,207 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence
+from ..strategies.payoff_engine import CALL, PUT
+from ..strategies.batch import batch_leg_arrays
+from ..strategies.breakeven import solve_kinks, solve_break_even_points, solve_extremes
+from ..pricing.black_scholes import norm_cdf
+from ..utils.strategy_registry import STRATEGY_REGISTRY, StrategyDefinition
+from ..utils.validators import validate_batch
+from .option_chain import MID, OptionChain, leg_quote_side
+
+# Ranking metrics; break-even distance ranks ascending, the others descending
+REWARD_RISK = 'reward_risk'
+BREAK_EVEN_DISTANCE = 'break_even_distance'
+PROBABILITY_OF_PROFIT = 'probability_of_profit'
+RANKING_METRICS = (REWARD_RISK, BREAK_EVEN_DISTANCE, PROBABILITY_OF_PROFIT)
+
+DEFAULT_TOP_K = 20
+
+# Smallest max loss (per share) a reward/risk ratio is computed for. Below a few ticks of risk the ratio
+# measures quote rounding rather than the trade, e.g. deep out-of-the-money spreads priced at the tick
+DEFAULT_MIN_RISK = 0.05
+
+# Same tolerance as the strike_spacing rule of LONG_BUTTERFLY_RULES
+BUTTERFLY_SPACING_TOLERANCE = 0.01
+
+# Rules not applied to chain candidates: the price range rules check the chart window rather than the
+# trade, and the butterfly premium order rules expect premiums rising with strike, which a call chain
+# never quotes
+SCAN_SKIPPED_RULES = frozenset({'start_price_range', 'end_price_range',
+                                'lower_premium_order', 'upper_premium_order'})
+
+# A generator turns one expiry's rows (split by option type, each sorted by strike) into candidate
+# combinations: chain rows for every strike field of the strategy's *Inputs dataclass
+CandidateGenerator = Callable[[Dict[str, np.ndarray], np.ndarray], Dict[str, np.ndarray]]
+
+def _vertical_pairs(option_type: str) -> CandidateGenerator:
+    def generate(rows_by_type, strikes):
+        rows = rows_by_type[option_type]
+        low, high = np.triu_indices(len(rows), k=1)
+        return {'strike_price_low': rows[low], 'strike_price_high': rows[high]}
+    return generate
+
+def _strangle_pairs(rows_by_type, strikes):
+    # Put below call
+    puts, calls = rows_by_type[PUT], rows_by_type[CALL]
+    put_index, call_index = np.nonzero(strikes[puts][:, np.newaxis] < strikes[calls][np.newaxis, :])
+    return {'strike_price_low': puts[put_index], 'strike_price_high': calls[call_index]}
+
+def _butterfly_triples(rows_by_type, strikes):
+    # Only equally spaced wings exist, so each (low, middle) pair has at most one upper strike:
+    # O(n^2 log n) through searchsorted instead of all n^3 triples
+    calls = rows_by_type[CALL]
+    call_strikes = strikes[calls]
+    low, middle = np.triu_indices(len(calls), k=1)
+    target = 2 * call_strikes[middle] - call_strikes[low]
+    high = np.minimum(np.searchsorted(call_strikes, target - BUTTERFLY_SPACING_TOLERANCE), len(calls) - 1)
+    found = np.abs(call_strikes[high] - target) <= BUTTERFLY_SPACING_TOLERANCE
+    return {'strike_price_low': calls[low[found]], 'strike_price_middle': calls[middle[found]],
+            'strike_price_high': calls[high[found]]}
+
+# Registry name -> candidate generator
+SCANNERS: Dict[str, CandidateGenerator] = {
+    'Bull Call Spread': _vertical_pairs(CALL),
+    'Bear Put Spread': _vertical_pairs(PUT),
+    'Long Strangle': _strangle_pairs,
+    'Long Butterfly': _butterfly_triples,
+}
+
+# Top candidates of one strategy in one expiry, best first; every array has one entry per candidate
+@dataclass(frozen=True)
+class ScanResult:
+    strategy: str
+    candidates: int                     # Combinations generated
+    valid: int                          # Combinations that passed the rules and have quotes on every leg
+    inputs: Dict[str, np.ndarray]       # Strike and premium fields of the strategy's *Inputs dataclass
+    rows: Dict[str, np.ndarray]         # Chain row of each strike field
+    max_profit: np.ndarray              # np.inf when unbounded
+    max_loss: np.ndarray                # -np.inf when unbounded
+    break_even_points: np.ndarray       # (n, max BEPs), NaN padded
+    reward_risk: np.ndarray             # max_profit / -max_loss, NaN when the max loss is under min_risk
+    break_even_distance: np.ndarray     # Nearest BEP to spot as a fraction of spot, NaN without a spot
+    probability_of_profit: np.ndarray   # Lognormal, NaN without spot, volatility and time to expiry
+
+    def __len__(self) -> int:
+        return len(self.max_profit)
+
+    def to_inputs(self, index: int, start_price: float, end_price: float, step_size: float):
+        # The *Inputs dataclass of one candidate, ready for the strategy class or the app
+        definition = STRATEGY_REGISTRY.get(self.strategy)
+        values = {name: float(column[index]) for name, column in self.inputs.items()}
+        return definition.inputs_class(start_price=start_price, end_price=end_price, step_size=step_size,
+                                       **values)
+
+def _lognormal_cdf(prices, spot, volatility, time_to_expiry, drift, dividend_yield) -> np.ndarray:
+    with np.errstate(divide='ignore'):
+        log_moneyness = np.log(prices / spot)
+    centre = (drift - dividend_yield - 0.5 * volatility ** 2) * time_to_expiry
+    return norm_cdf((log_moneyness - centre) / (volatility * np.sqrt(time_to_expiry)))
+
+def _profit_probability(kink_prices, kink_payoffs, slopes, spot, volatility, time_to_expiry,
+                        drift=0.0, dividend_yield=0.0) -> np.ndarray:
+    # The payoff is linear between kinks, so where it is positive on a segment is a single interval
+    start, end = kink_prices[..., :-1], kink_prices[..., 1:]
+    left, right = kink_payoffs[..., :-1], kink_payoffs[..., 1:]
+    last, tail_slope, last_kink = kink_payoffs[..., -1], slopes[..., -1], kink_prices[..., -1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        root = start - left * (end - start) / (right - left)
+        tail_root = last_kink - last / tail_slope
+    lower = np.concatenate([np.where(left > 0, start, root),
+                            np.where(last > 0, last_kink, tail_root)[..., np.newaxis]], axis=-1)
+    upper = np.concatenate([np.where(right > 0, end, root),
+                            np.where(tail_slope >= 0, np.inf, tail_root)[..., np.newaxis]], axis=-1)
+    positive = np.concatenate([(left > 0) | (right > 0), ((last > 0) | (tail_slope > 0))[..., np.newaxis]],
+                              axis=-1)
+    lower, upper = np.where(positive, lower, 0.0), np.where(positive, upper, 0.0)
+    distribution = (spot, volatility, time_to_expiry, drift, dividend_yield)
+    return (_lognormal_cdf(upper, *distribution) - _lognormal_cdf(lower, *distribution)).sum(axis=-1)
+
+def _top_k(score: np.ndarray, top_k: int, descending: bool) -> np.ndarray:
+    # argpartition picks the k best in O(n), only those k are sorted; NaN scores rank last
+    key = np.where(np.isnan(score), np.inf, -score if descending else score)
+    if top_k < len(key):
+        best = np.argpartition(key, top_k - 1)[:top_k]
+    else:
+        best = np.arange(len(key))
+    return best[np.argsort(key[best], kind='stable')]
+
+def scan_strategy(chain: OptionChain, underlying: str, expiry: str, strategy: str, side: str = MID,
+                  spot: Optional[float] = None, volatility: Optional[float] = None,
+                  time_to_expiry: Optional[float] = None, drift: float = 0.0, dividend_yield: float = 0.0,
+                  rank_by: str = REWARD_RISK, top_k: int = DEFAULT_TOP_K,
+                  min_risk: float = DEFAULT_MIN_RISK) -> ScanResult:
+    # Every combination of one strategy in one expiry, priced at `side`, checked against the strategy's
+    # rule table (see SCAN_SKIPPED_RULES) and ranked. Legs without a bid are skipped, and reward/risk is
+    # NaN (ranked last) when the max loss is under `min_risk`. Break-even distance needs a spot,
+    # probability of profit needs spot, volatility and time to expiry (`drift` as in simulate_pnl)
+    definition: StrategyDefinition = STRATEGY_REGISTRY.get(strategy)
+    if definition is None or definition.name not in SCANNERS:
+        raise ValueError(f"Strategy must be one of {list(SCANNERS)}")
+    if rank_by not in RANKING_METRICS:
+        raise ValueError(f"Ranking metric must be one of {RANKING_METRICS}")
+    if rank_by == BREAK_EVEN_DISTANCE and spot is None:
+        raise ValueError("Ranking by break-even distance requires a spot price")
+    if rank_by == PROBABILITY_OF_PROFIT and None in (spot, volatility, time_to_expiry):
+        raise ValueError("Ranking by probability of profit requires spot, volatility and time to expiry")
+
+    expiry_rows = chain.expiry_rows(underlying, expiry)
+    rows_by_type = {option_type: expiry_rows[chain.option_type[expiry_rows] == option_type]
+                    for option_type in (CALL, PUT)}
+    rows = SCANNERS[definition.name](rows_by_type, chain.strike)
+    leg_spec = definition.strategy_class.LEG_SPEC
+
+    columns = {name: chain.strike[field_rows] for name, field_rows in rows.items()}
+    for leg in leg_spec:
+        quotes = getattr(chain, leg_quote_side(side, leg.side))
+        columns[leg.premium_field] = quotes[rows[leg.strike_field]]
+    candidates = len(next(iter(columns.values())))
+
+    # Prune before any payoff work: missing quotes and legs nobody bids for, then the rule table as one
+    # vectorized pass
+    rules = [rule for rule in definition.rules if rule.code not in SCAN_SKIPPED_RULES]
+    keep = validate_batch(rules, columns).is_valid
+    for leg in leg_spec:
+        keep &= np.isfinite(columns[leg.premium_field]) & (chain.bid[rows[leg.strike_field]] > 0)
+    columns = {name: column[keep] for name, column in columns.items()}
+    rows = {name: field_rows[keep] for name, field_rows in rows.items()}
+
+    strikes, premiums, is_call, signed_quantities = batch_leg_arrays(leg_spec, columns)
+    kink_prices, kink_payoffs, slopes = solve_kinks(strikes, is_call, signed_quantities,
+                                                    premiums @ signed_quantities)
+    max_profit, max_loss = solve_extremes(kink_payoffs, slopes)
+    break_even_points = solve_break_even_points(kink_prices, kink_payoffs, slopes)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        reward_risk = np.where(-max_loss >= min_risk, max_profit / -max_loss, np.nan)
+
+    break_even_distance = np.full(len(max_profit), np.nan)
+    probability_of_profit = np.full(len(max_profit), np.nan)
+    if spot is not None:
+        distances = np.abs(break_even_points - spot) / spot
+        break_even_distance = np.min(np.where(np.isnan(distances), np.inf, distances), axis=-1, initial=np.inf)
+        break_even_distance[np.isinf(break_even_distance)] = np.nan
+        if volatility is not None and time_to_expiry is not None:
+            probability_of_profit = _profit_probability(kink_prices, kink_payoffs, slopes, spot, volatility,
+                                                        time_to_expiry, drift, dividend_yield)
+
+    metrics = {REWARD_RISK: reward_risk, BREAK_EVEN_DISTANCE: break_even_distance,
+               PROBABILITY_OF_PROFIT: probability_of_profit}
+    best = _top_k(metrics[rank_by], top_k, descending=rank_by != BREAK_EVEN_DISTANCE)
+    return ScanResult(
+        strategy=definition.name,
+        candidates=candidates,
+        valid=int(keep.sum()),
+        inputs={name: column[best] for name, column in columns.items()},
+        rows={name: field_rows[best] for name, field_rows in rows.items()},
+        max_profit=max_profit[best],
+        max_loss=max_loss[best],
+        break_even_points=break_even_points[best],
+        reward_risk=reward_risk[best],
+        break_even_distance=break_even_distance[best],
+        probability_of_profit=probability_of_profit[best]
+    )
+
+def scan_chain(chain: OptionChain, underlying: str, expiry: str,
+               strategies: Sequence[str] = tuple(SCANNERS), **options) -> Dict[str, ScanResult]:
+    # scan_strategy for several strategies with the same options, keyed by strategy name
+    return {strategy: scan_strategy(chain, underlying, expiry, strategy, **options) for strategy in strategies}
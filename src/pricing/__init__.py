@@ -0,0 +1,31 @@
+from .black_scholes import (
+    norm_cdf,
+    norm_pdf,
+    black_scholes_price,
+    position_pnl,
+    pnl_surface,
+    fill_premiums
+)
+from .greeks import Greeks, option_greeks, position_greeks, greeks_surface
+from .implied_vol import implied_volatility, leg_implied_volatilities
+from .vol_surface import VolSurface
+from .monte_carlo import SimulationResult, simulate_terminal_prices, simulate_pnl
+
+__all__ = [
+    'norm_cdf',
+    'norm_pdf',
+    'black_scholes_price',
+    'position_pnl',
+    'pnl_surface',
+    'fill_premiums',
+    'Greeks',
+    'option_greeks',
+    'position_greeks',
+    'greeks_surface',
+    'implied_volatility',
+    'leg_implied_volatilities',
+    'VolSurface',
+    'SimulationResult',
+    'simulate_terminal_prices',
+    'simulate_pnl'
+]
@@ -0,0 +1,87 @@
+import numpy as np
+from dataclasses import replace
+from ..strategies.payoff_engine import CALL
+from ..strategies.legs import LegTable
+
+_SQRT_2PI = np.sqrt(2 * np.pi)
+
+def norm_pdf(x) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+def norm_cdf(x) -> np.ndarray:
+    # Hart's double precision rational approximation (as given by West, 2005), NumPy-only so no SciPy dependency
+    x = np.asarray(x, dtype=float)
+    z = np.abs(x)
+    # Infinite d1/d2 (zero spot, zero time) resolve to 0 or 1 through the z > 37 branch below
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        exponential = np.exp(-0.5 * z * z)
+        numerator = ((((((3.52624965998911e-02 * z + 0.700383064443688) * z + 6.37396220353165) * z
+                        + 33.912866078383) * z + 112.079291497871) * z + 221.213596169931) * z + 220.206867912376)
+        denominator = (((((((8.83883476483184e-02 * z + 1.75566716318264) * z + 16.064177579207) * z
+                           + 86.7807322029461) * z + 296.564248779674) * z + 637.333633378831) * z
+                         + 793.826512519948) * z + 440.413735824752)
+        # Continued fraction for the far tail
+        tail = exponential / (z + 1 / (z + 2 / (z + 3 / (z + 4 / (z + 0.65))))) / _SQRT_2PI
+        lower_tail = np.where(z < 7.07106781186547, exponential * numerator / denominator, tail)
+    lower_tail = np.where(z > 37, 0.0, lower_tail)
+    return np.where(x > 0, 1 - lower_tail, lower_tail)
+
+def d1_d2(spot, strike, time_to_expiry, volatility, rate=0.0, dividend_yield=0.0):
+    spot, strike, time_to_expiry, volatility = (np.asarray(value, dtype=float)
+                                                for value in (spot, strike, time_to_expiry, volatility))
+    vol_sqrt_t = volatility * np.sqrt(time_to_expiry)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = (np.log(spot / strike) + (rate - dividend_yield + 0.5 * volatility ** 2) * time_to_expiry) / vol_sqrt_t
+    return d1, d1 - vol_sqrt_t
+
+def black_scholes_price(is_call, spot, strike, time_to_expiry, volatility, rate=0.0, dividend_yield=0.0) -> np.ndarray:
+    # Black-Scholes-Merton value, every argument broadcasts (e.g. price x time x vol grids in one pass)
+    is_call = np.asarray(is_call, dtype=bool)
+    spot, strike, time_to_expiry, volatility = (np.asarray(value, dtype=float)
+                                                for value in (spot, strike, time_to_expiry, volatility))
+    discounted_spot = spot * np.exp(-dividend_yield * time_to_expiry)
+    discounted_strike = strike * np.exp(-rate * time_to_expiry)
+
+    d1, d2 = d1_d2(spot, strike, time_to_expiry, volatility, rate, dividend_yield)
+    call = discounted_spot * norm_cdf(d1) - discounted_strike * norm_cdf(d2)
+    put = discounted_strike * norm_cdf(-d2) - discounted_spot * norm_cdf(-d1)
+    value = np.where(is_call, call, put)
+
+    # At expiry or with zero vol the option is worth its discounted forward intrinsic value
+    forward_intrinsic = np.maximum(np.where(is_call, discounted_spot - discounted_strike,
+                                            discounted_strike - discounted_spot), 0.0)
+    return np.where(volatility * np.sqrt(time_to_expiry) > 0, value, forward_intrinsic)
+
+def position_pnl(legs: LegTable, spot_prices, time_to_expiry, volatility, rate=0.0, dividend_yield=0.0,
+                 leg_volatilities=None) -> np.ndarray:
+    # Mark-to-market P/L of a position: signed leg values less the net premium paid.
+    # The market arguments broadcast against each other, legs are summed over a leading axis.
+    # `leg_volatilities` (n_legs,), e.g. implied from each leg's premium, replaces the single `volatility`
+    grid_shape = np.broadcast_shapes(np.shape(spot_prices), np.shape(time_to_expiry), np.shape(volatility),
+                                     np.shape(rate), np.shape(dividend_yield))
+    leg_axis = (slice(None),) + (np.newaxis,) * len(grid_shape)
+    if leg_volatilities is not None:
+        volatility = np.asarray(leg_volatilities, dtype=float)[leg_axis]
+    values = black_scholes_price(
+        (legs.option_types == CALL)[leg_axis], spot_prices, legs.strike_prices[leg_axis],
+        time_to_expiry, volatility, rate, dividend_yield
+    )
+    return np.tensordot(legs.signed_quantities, values, axes=1) - legs.net_premium
+
+def pnl_surface(legs: LegTable, spot_prices, times_to_expiry, volatilities, rate=0.0, dividend_yield=0.0) -> np.ndarray:
+    # P/L over the full (vol x time x price) mesh, shape (n_vols, n_times, n_prices)
+    spot_prices = np.asarray(spot_prices, dtype=float)[np.newaxis, np.newaxis, :]
+    times_to_expiry = np.asarray(times_to_expiry, dtype=float)[np.newaxis, :, np.newaxis]
+    volatilities = np.asarray(volatilities, dtype=float)[:, np.newaxis, np.newaxis]
+    return position_pnl(legs, spot_prices, times_to_expiry, volatilities, rate, dividend_yield)
+
+def fill_premiums(inputs, strategy_class, spot: float, volatility: float, time_to_expiry: float,
+                  rate: float = 0.0, dividend_yield: float = 0.0):
+    # Copy of a frozen *Inputs dataclass with every premium_* field priced by Black-Scholes
+    premiums = {
+        leg.premium_field: float(black_scholes_price(leg.option_type == CALL, spot, getattr(inputs, leg.strike_field),
+                                                     time_to_expiry, volatility, rate, dividend_yield))
+        for leg in strategy_class.LEG_SPEC
+    }
+    return replace(inputs, **premiums)
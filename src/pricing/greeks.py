@@ -0,0 +1,71 @@
+import numpy as np
+from dataclasses import dataclass
+from ..strategies.payoff_engine import CALL
+from ..strategies.legs import LegTable
+from .black_scholes import norm_cdf, norm_pdf, d1_d2
+
+# Black-Scholes-Merton sensitivities. Vega and rho are per 1.00 change in vol / rate,
+# theta is per year of calendar time (divide by 365 for a daily figure)
+@dataclass(frozen=True)
+class Greeks:
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
+    rho: np.ndarray
+
+GREEK_NAMES = ('delta', 'gamma', 'vega', 'theta', 'rho')
+
+def option_greeks(is_call, spot, strike, time_to_expiry, volatility, rate=0.0, dividend_yield=0.0) -> Greeks:
+    # Closed-form Greeks per contract, every argument broadcasts
+    is_call = np.asarray(is_call, dtype=bool)
+    spot, strike, time_to_expiry, volatility = (np.asarray(value, dtype=float)
+                                                for value in (spot, strike, time_to_expiry, volatility))
+    sqrt_t = np.sqrt(time_to_expiry)
+    live = volatility * sqrt_t > 0
+    dividend_discount = np.exp(-dividend_yield * time_to_expiry)
+    rate_discount = np.exp(-rate * time_to_expiry)
+
+    d1, d2 = d1_d2(spot, strike, time_to_expiry, volatility, rate, dividend_yield)
+    # At expiry (or zero vol) N(d1), N(d2) collapse to the in-the-money indicator of the forward
+    in_the_money_call = (spot * dividend_discount > strike * rate_discount).astype(float)
+    cdf_d1 = np.where(live, norm_cdf(d1), in_the_money_call)
+    cdf_d2 = np.where(live, norm_cdf(d2), in_the_money_call)
+    pdf_d1 = np.where(live, norm_pdf(np.where(live, d1, 0.0)), 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gamma = np.where(live, dividend_discount * pdf_d1 / (spot * volatility * sqrt_t), 0.0)
+        time_decay = np.where(live, -spot * dividend_discount * pdf_d1 * volatility / (2 * sqrt_t), 0.0)
+    vega = spot * dividend_discount * pdf_d1 * sqrt_t
+
+    delta = np.where(is_call, dividend_discount * cdf_d1, dividend_discount * (cdf_d1 - 1))
+    theta = np.where(
+        is_call,
+        time_decay - rate * strike * rate_discount * cdf_d2 + dividend_yield * spot * dividend_discount * cdf_d1,
+        time_decay + rate * strike * rate_discount * (1 - cdf_d2) - dividend_yield * spot * dividend_discount * (1 - cdf_d1)
+    )
+    rho = np.where(is_call, strike * time_to_expiry * rate_discount * cdf_d2,
+                   -strike * time_to_expiry * rate_discount * (1 - cdf_d2))
+    return Greeks(delta=delta, gamma=gamma, vega=vega, theta=theta, rho=rho)
+
+def position_greeks(legs: LegTable, spot_prices, time_to_expiry, volatility, rate=0.0, dividend_yield=0.0,
+                    leg_volatilities=None) -> Greeks:
+    # Aggregate Greeks of a position, legs are summed over a leading axis weighted by signed quantity.
+    # `leg_volatilities` works as in position_pnl
+    grid_shape = np.broadcast_shapes(np.shape(spot_prices), np.shape(time_to_expiry), np.shape(volatility),
+                                     np.shape(rate), np.shape(dividend_yield))
+    leg_axis = (slice(None),) + (np.newaxis,) * len(grid_shape)
+    if leg_volatilities is not None:
+        volatility = np.asarray(leg_volatilities, dtype=float)[leg_axis]
+    per_leg = option_greeks((legs.option_types == CALL)[leg_axis], spot_prices, legs.strike_prices[leg_axis],
+                            time_to_expiry, volatility, rate, dividend_yield)
+    return Greeks(**{name: np.tensordot(legs.signed_quantities, np.broadcast_to(getattr(per_leg, name),
+                                                                                (len(legs),) + grid_shape), axes=1)
+                     for name in GREEK_NAMES})
+
+def greeks_surface(legs: LegTable, spot_prices, times_to_expiry, volatility, rate=0.0, dividend_yield=0.0,
+                   leg_volatilities=None) -> Greeks:
+    # Aggregate Greeks over the (time x price) mesh, each array shaped (n_times, n_prices)
+    spot_prices = np.asarray(spot_prices, dtype=float)[np.newaxis, :]
+    times_to_expiry = np.asarray(times_to_expiry, dtype=float)[:, np.newaxis]
+    return position_greeks(legs, spot_prices, times_to_expiry, volatility, rate, dividend_yield, leg_volatilities)
@@ -0,0 +1,69 @@
+import numpy as np
+from ..strategies.legs import LegTable
+from ..strategies.payoff_engine import CALL
+from .black_scholes import black_scholes_price, d1_d2, norm_pdf
+
+# Search range of the solver; quotes that need a vol above the cap come back as NaN
+MAX_VOLATILITY = 10.0
+
+# Every quote gets the same number of array passes, converged or not, so the cost is fixed per call
+DEFAULT_PASSES = 16
+
+# Largest price error accepted at the end, as a fraction of the discounted spot
+DEFAULT_TOLERANCE = 1e-10
+
+def implied_volatility(is_call, price, spot, strike, time_to_expiry, rate=0.0, dividend_yield=0.0,
+                       passes: int = DEFAULT_PASSES, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    # Black-Scholes-Merton vol that reprices each quote, every argument broadcasts (a whole chain in one call).
+    # NaN where the price is outside the no-arbitrage bounds (at or below intrinsic, at or above the
+    # discounted spot for calls / strike for puts), at expiry, or where the solver did not converge
+    is_call, price, spot, strike, time_to_expiry = np.broadcast_arrays(
+        np.asarray(is_call, dtype=bool), *(np.asarray(value, dtype=float)
+                                           for value in (price, spot, strike, time_to_expiry)))
+    discounted_spot = spot * np.exp(-dividend_yield * time_to_expiry)
+    discounted_strike = strike * np.exp(-rate * time_to_expiry)
+
+    # Solve on the out-of-the-money side (put-call parity): its price is all time value, so deep
+    # in-the-money quotes do not lose their precision to the intrinsic part
+    call_price = np.where(is_call, price, price + discounted_spot - discounted_strike)
+    otm_is_call = discounted_spot <= discounted_strike
+    target = np.where(otm_is_call, call_price, call_price - discounted_spot + discounted_strike)
+    arbitrage_free = ((call_price > np.maximum(discounted_spot - discounted_strike, 0.0))
+                      & (call_price < discounted_spot) & (time_to_expiry > 0))
+    target = np.where(arbitrage_free, target, np.nan)
+
+    # Start from the inflection point of the price in vol, sqrt(2 |ln(F / K)| / T), from which Newton
+    # converges monotonically; near the money that is ~0, so Brenner-Subrahmanyam's ATM estimate is the floor
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sqrt_t = np.sqrt(time_to_expiry)
+        inflection = np.sqrt(2 * np.abs(np.log(discounted_spot / discounted_strike))) / sqrt_t
+        at_the_money = np.sqrt(2 * np.pi) * target / (discounted_spot * sqrt_t)
+    volatility = np.clip(np.fmax(inflection, at_the_money), 1e-4, MAX_VOLATILITY / 2)
+    lower = np.zeros_like(target)
+    upper = np.full_like(target, MAX_VOLATILITY)
+    arbitrage_free &= black_scholes_price(otm_is_call, spot, strike, time_to_expiry, upper,
+                                          rate, dividend_yield) > target
+
+    for _ in range(passes):
+        error = black_scholes_price(otm_is_call, spot, strike, time_to_expiry, volatility,
+                                    rate, dividend_yield) - target
+        # The price rises with vol, so the sign of the error shrinks the bracket around the root
+        lower = np.where(error < 0, volatility, lower)
+        upper = np.where(error > 0, volatility, upper)
+        d1, _ = d1_d2(spot, strike, time_to_expiry, volatility, rate, dividend_yield)
+        vega = discounted_spot * norm_pdf(d1) * sqrt_t
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = volatility - error / vega
+        # Bisection whenever the Newton step leaves the bracket (flat vega in the wings)
+        volatility = np.where((newton >= lower) & (newton <= upper), newton, 0.5 * (lower + upper))
+
+    error = black_scholes_price(otm_is_call, spot, strike, time_to_expiry, volatility,
+                                rate, dividend_yield) - target
+    converged = np.abs(error) <= tolerance * discounted_spot
+    return np.where(arbitrage_free & converged, volatility, np.nan)
+
+def leg_implied_volatilities(legs: LegTable, spot: float, time_to_expiry: float, rate: float = 0.0,
+                             dividend_yield: float = 0.0) -> np.ndarray:
+    # (n_legs,) vols implied by each leg's own premium, e.g. for position_pnl(..., leg_volatilities=...)
+    return implied_volatility(legs.option_types == CALL, legs.premiums, spot, legs.strike_prices,
+                              time_to_expiry, rate, dividend_yield)
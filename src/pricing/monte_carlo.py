@@ -0,0 +1,118 @@
+import numpy as np
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import Optional
+from ..strategies.legs import LegTable
+from ..strategies.piecewise import PiecewiseLinearPayoff
+
+# Terminal prices beyond this many standard deviations of the log return are folded into the edge
+# histogram bins (they still count exactly towards the mean and probability of profit)
+_GBM_RANGE_SIGMAS = 9.0
+
+# Distribution of the expiry P/L of a position over simulated terminal prices. Losses are reported
+# as positive numbers in value_at_risk / conditional_value_at_risk, everything else keeps its sign
+@dataclass(frozen=True)
+class SimulationResult:
+    n_paths: int
+    expected_pnl: float
+    pnl_std: float
+    probability_of_profit: float
+    confidence: float
+    value_at_risk: float              # Loss not exceeded with probability `confidence`, to within one bin
+    conditional_value_at_risk: float  # Mean loss in the worst (1 - confidence) of paths
+    min_pnl: float
+    max_pnl: float
+    histogram_counts: np.ndarray      # (bins,)
+    histogram_sums: np.ndarray        # (bins,) total P/L of the paths in each bin
+    histogram_edges: np.ndarray       # (bins + 1,)
+
+def simulate_terminal_prices(rng: np.random.Generator, n_paths: int, spot: float, time_to_expiry: float,
+                             volatility: Optional[float] = None, drift: float = 0.0, dividend_yield: float = 0.0,
+                             returns: Optional[np.ndarray] = None) -> np.ndarray:
+    # Geometric Brownian motion, or resampling (with replacement) of simple returns over the whole horizon
+    if returns is not None:
+        return spot * (1.0 + rng.choice(np.asarray(returns, dtype=float), size=n_paths))
+    log_drift = (drift - dividend_yield - 0.5 * volatility ** 2) * time_to_expiry
+    return spot * np.exp(log_drift + volatility * np.sqrt(time_to_expiry) * rng.standard_normal(n_paths))
+
+def _price_bounds(spot, time_to_expiry, volatility, drift, dividend_yield, returns):
+    if returns is not None:
+        returns = np.asarray(returns, dtype=float)
+        return spot * (1.0 + returns.min()), spot * (1.0 + returns.max())
+    centre = (drift - dividend_yield - 0.5 * volatility ** 2) * time_to_expiry
+    spread = _GBM_RANGE_SIGMAS * volatility * np.sqrt(time_to_expiry)
+    return spot * np.exp(centre - spread), spot * np.exp(centre + spread)
+
+def _simulate_chunk(task):
+    # Worker: one independent stream per chunk, so results do not depend on how chunks are scheduled
+    (payoff, seed_sequence, n_paths, spot, time_to_expiry, volatility, drift, dividend_yield, returns,
+     lowest_pnl, bin_width, bins) = task
+    rng = np.random.default_rng(seed_sequence)
+    prices = simulate_terminal_prices(rng, n_paths, spot, time_to_expiry, volatility, drift, dividend_yield, returns)
+    pnl = payoff(prices)
+    index = np.clip(((pnl - lowest_pnl) / bin_width).astype(np.int64), 0, bins - 1)
+    return (np.bincount(index, minlength=bins), np.bincount(index, weights=pnl, minlength=bins),
+            float(pnl @ pnl), int((pnl > 0).sum()), float(pnl.min()), float(pnl.max()))
+
+def simulate_pnl(legs: LegTable, spot: float, time_to_expiry: float, volatility: Optional[float] = None,
+                 drift: float = 0.0, dividend_yield: float = 0.0, returns: Optional[np.ndarray] = None,
+                 n_paths: int = 1_000_000, chunk_size: int = 1_000_000, seed=None, confidence: float = 0.95,
+                 bins: int = 4096, processes: int = 1) -> SimulationResult:
+    # Expiry P/L of a position on simulated terminal prices, in chunks of `chunk_size` paths so memory
+    # stays bounded for any n_paths. `drift` is the annual drift of GBM (the risk-free rate for
+    # risk-neutral paths); pass `returns` instead of `volatility` to resample empirical returns.
+    # The same seed gives the same result for any number of processes
+    if returns is None and volatility is None:
+        raise ValueError("Either a volatility (GBM) or an array of empirical returns is required")
+    for name, value in (('n_paths', n_paths), ('chunk_size', chunk_size), ('bins', bins)):
+        if value <= 0:
+            raise ValueError(f"{name} must be positive, got {value}")
+    payoff = PiecewiseLinearPayoff.from_legs(legs)
+
+    # P/L histogram range: the payoff is piecewise linear, so its extremes over the plausible price
+    # range sit on the range ends or on breakpoints inside it
+    low_price, high_price = _price_bounds(spot, time_to_expiry, volatility, drift, dividend_yield, returns)
+    breakpoints = payoff.breakpoints[(payoff.breakpoints > low_price) & (payoff.breakpoints < high_price)]
+    bound_pnl = payoff(np.concatenate([[max(low_price, 0.0), high_price], breakpoints]))
+    lowest_pnl = float(bound_pnl.min())
+    bin_width = (float(bound_pnl.max()) - lowest_pnl) / bins or 1.0
+
+    chunk_sizes = [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    tasks = [(payoff, chunk_seed, size, spot, time_to_expiry, volatility, drift, dividend_yield, returns,
+              lowest_pnl, bin_width, bins) for chunk_seed, size in zip(seeds, chunk_sizes)]
+    if processes > 1 and len(tasks) > 1:
+        with get_context().Pool(min(processes, len(tasks))) as pool:
+            partials = pool.map(_simulate_chunk, tasks)
+    else:
+        partials = [_simulate_chunk(task) for task in tasks]
+
+    # Combined in chunk order, so floating point sums are reproducible
+    counts = np.sum([partial[0] for partial in partials], axis=0)
+    sums = np.sum([partial[1] for partial in partials], axis=0)
+    sum_of_squares = sum(partial[2] for partial in partials)
+    profitable = sum(partial[3] for partial in partials)
+    expected_pnl = sums.sum() / n_paths
+
+    # Tail from the histogram: whole bins below the quantile bin, plus part of the quantile bin at its mean
+    tail_paths = max(int(np.ceil((1 - confidence) * n_paths)), 1)
+    cumulative = np.cumsum(counts)
+    quantile_bin = int(np.searchsorted(cumulative, tail_paths))
+    quantile_pnl = sums[quantile_bin] / counts[quantile_bin]
+    paths_before = cumulative[quantile_bin - 1] if quantile_bin else 0
+    tail_sum = sums[:quantile_bin].sum() + (tail_paths - paths_before) * quantile_pnl
+
+    return SimulationResult(
+        n_paths=n_paths,
+        expected_pnl=float(expected_pnl),
+        pnl_std=float(np.sqrt(max(sum_of_squares / n_paths - expected_pnl ** 2, 0.0))),
+        probability_of_profit=profitable / n_paths,
+        confidence=confidence,
+        value_at_risk=float(-quantile_pnl),
+        conditional_value_at_risk=float(-tail_sum / tail_paths),
+        min_pnl=min(partial[4] for partial in partials),
+        max_pnl=max(partial[5] for partial in partials),
+        histogram_counts=counts,
+        histogram_sums=sums,
+        histogram_edges=lowest_pnl + bin_width * np.arange(bins + 1)
+    )
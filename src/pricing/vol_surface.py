@@ -0,0 +1,108 @@
+import numpy as np
+from typing import Tuple
+from ..strategies.legs import LegTable
+from .implied_vol import implied_volatility
+
+def _axis_weights(axis: np.ndarray, inverse_steps: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Left node and weight of the right node for each value, clamped to the axis ends (flat extrapolation)
+    if len(axis) == 1:
+        return np.zeros(values.shape, dtype=np.intp), np.zeros(values.shape)
+    values = np.clip(values, axis[0], axis[-1])
+    left = np.minimum(np.searchsorted(axis, values, side='right') - 1, len(axis) - 2)
+    return left, (values - axis[left]) * inverse_steps[left]
+
+class VolSurface:
+    # Implied vols on a (expiry x strike) node grid, stored as total variance (vol^2 * T) and interpolated
+    # bilinearly in strike and time. Strikes an expiry does not quote are filled linearly along strike
+    # from the ones it does. Outside the grid the vol is held flat in strike and constant in time
+    def __init__(self, strikes, times_to_expiry, volatilities):
+        strikes, times_to_expiry, volatilities = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float).ravel() for value in (strikes, times_to_expiry, volatilities)))
+        quoted = np.isfinite(volatilities) & (times_to_expiry > 0)
+        if not quoted.any():
+            raise ValueError("A vol surface needs at least one finite implied vol")
+        strikes, times_to_expiry, volatilities = strikes[quoted], times_to_expiry[quoted], volatilities[quoted]
+
+        # The interpolation index: sorted node axes and the reciprocal node spacing, built once
+        self.strikes = np.unique(strikes)
+        self.times_to_expiry = np.unique(times_to_expiry)
+        self._inverse_strike_steps = 1.0 / np.diff(self.strikes)
+        self._inverse_time_steps = 1.0 / np.diff(self.times_to_expiry)
+
+        # Quoted total variance per node (NaN where nothing is quoted) and the filled grid served to lookups
+        self._quoted_variance = np.full((len(self.times_to_expiry), len(self.strikes)), np.nan)
+        self.total_variance = np.empty_like(self._quoted_variance)
+        self._set_nodes(self._quoted_variance, strikes, times_to_expiry, volatilities)
+        self._fill_rows(self._quoted_variance, self.total_variance, np.arange(len(self.times_to_expiry)))
+
+    @classmethod
+    def from_quotes(cls, is_call, prices, spot: float, strikes, times_to_expiry, rate: float = 0.0,
+                    dividend_yield: float = 0.0) -> 'VolSurface':
+        # Solves the implied vol of every quote (see implied_volatility) and drops the ones without a solution
+        volatilities = implied_volatility(is_call, prices, spot, strikes, times_to_expiry, rate, dividend_yield)
+        return cls(strikes, times_to_expiry, volatilities)
+
+    def _node_index(self, strikes: np.ndarray, times_to_expiry: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        rows = np.searchsorted(self.times_to_expiry, times_to_expiry)
+        columns = np.searchsorted(self.strikes, strikes)
+        on_grid = ((rows < len(self.times_to_expiry)) & (columns < len(self.strikes)))
+        on_grid[on_grid] = ((self.times_to_expiry[rows[on_grid]] == times_to_expiry[on_grid])
+                            & (self.strikes[columns[on_grid]] == strikes[on_grid]))
+        if not on_grid.all():
+            raise KeyError("Updated quotes must sit on existing (strike, expiry) nodes; build a new surface "
+                           "to add strikes or expiries")
+        return rows, columns
+
+    def _set_nodes(self, quoted_variance: np.ndarray, strikes: np.ndarray, times_to_expiry: np.ndarray,
+                   volatilities: np.ndarray) -> np.ndarray:
+        # Several quotes on one node (a call and a put) are averaged in variance; returns the touched rows
+        rows, columns = self._node_index(strikes, times_to_expiry)
+        sums = np.zeros_like(quoted_variance)
+        counts = np.zeros_like(quoted_variance)
+        np.add.at(sums, (rows, columns), volatilities ** 2 * times_to_expiry)
+        np.add.at(counts, (rows, columns), 1)
+        touched = counts > 0
+        quoted_variance[touched] = sums[touched] / counts[touched]
+        return np.unique(rows)
+
+    def _fill_rows(self, quoted_variance: np.ndarray, total_variance: np.ndarray, rows: np.ndarray):
+        for row in rows:
+            quoted = np.isfinite(quoted_variance[row])
+            if not quoted.any():
+                raise ValueError(f"Expiry {self.times_to_expiry[row]} has no quoted vol left")
+            total_variance[row] = np.interp(self.strikes, self.strikes[quoted], quoted_variance[row, quoted])
+
+    def update(self, strikes, times_to_expiry, volatilities):
+        # Re-quotes existing nodes and refills only the expiries they belong to. A NaN vol removes
+        # the node's quote, which is then filled from its neighbours like any unquoted strike
+        strikes, times_to_expiry, volatilities = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float).ravel() for value in (strikes, times_to_expiry, volatilities)))
+        # Applied to copies and swapped in only once every touched expiry refilled, so a rejected update
+        # (unknown node, an expiry left without quotes) leaves the surface as it was
+        quoted_variance = self._quoted_variance.copy()
+        total_variance = self.total_variance.copy()
+        self._fill_rows(quoted_variance, total_variance,
+                        self._set_nodes(quoted_variance, strikes, times_to_expiry, volatilities))
+        self._quoted_variance, self.total_variance = quoted_variance, total_variance
+
+    def __call__(self, strikes, times_to_expiry) -> np.ndarray:
+        # Vol at any (strike, expiry) pairs, arguments broadcast
+        strikes, times_to_expiry = np.broadcast_arrays(np.asarray(strikes, dtype=float),
+                                                       np.asarray(times_to_expiry, dtype=float))
+        column, strike_weight = _axis_weights(self.strikes, self._inverse_strike_steps, strikes)
+        row, time_weight = _axis_weights(self.times_to_expiry, self._inverse_time_steps, times_to_expiry)
+        next_column = np.minimum(column + 1, len(self.strikes) - 1)
+        next_row = np.minimum(row + 1, len(self.times_to_expiry) - 1)
+
+        grid = self.total_variance
+        near = grid[row, column] + strike_weight * (grid[row, next_column] - grid[row, column])
+        far = grid[next_row, column] + strike_weight * (grid[next_row, next_column] - grid[next_row, column])
+        variance = near + time_weight * (far - near)
+        # Vol at the clamped expiry, i.e. constant vol before the first and after the last expiry
+        clamped_time = self.times_to_expiry[row] + time_weight * (self.times_to_expiry[next_row]
+                                                                  - self.times_to_expiry[row])
+        return np.sqrt(np.maximum(variance, 0.0) / clamped_time)
+
+    def leg_volatilities(self, legs: LegTable, time_to_expiry: float) -> np.ndarray:
+        # (n_legs,) vols at each leg's strike, for position_pnl / position_greeks(..., leg_volatilities=...)
+        return self(legs.strike_prices, time_to_expiry)
@@ -1,3 +1,10 @@
+from .legs import Leg, LegSpec, LegTable, Position
+from .breakeven import PayoffProfile, solve_payoff_profile
+from .piecewise import PiecewiseLinearPayoff
+from .results import PayoffResult
+from .batch import BatchResult, evaluate_batch
+from .portfolio import Portfolio
+from .sweep import run_sweep, sweep_grid
 from .base_strategy import BaseOptionsStrategy, LongCall, ShortCall, LongPut, ShortPut
 from .complex_strategy import (
     ComplexOptionsStrategies,
@@ -11,6 +18,19 @@ from .complex_strategy import (
 )
 
 __all__ = [
+    'Leg',
+    'LegSpec',
+    'LegTable',
+    'Position',
+    'PayoffProfile',
+    'solve_payoff_profile',
+    'PiecewiseLinearPayoff',
+    'PayoffResult',
+    'BatchResult',
+    'evaluate_batch',
+    'Portfolio',
+    'run_sweep',
+    'sweep_grid',
     'BaseOptionsStrategy',
     'LongCall',
     'ShortCall',
@@ -1,74 +1,56 @@
-import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING, Tuple
+if TYPE_CHECKING:
+    import pandas as pd
+from .payoff_engine import CALL, PUT, build_payoff_frame
+from .legs import LONG, SHORT, LegSpec, LegTable, Position
+from .price_grid import UNIFORM, build_price_grid
+from .results import PayoffResultMixin
 
-class BaseOptionsStrategy:
-    def __init__(self, start_price: float, end_price: float, step_size: float, strike_price: float = None, premium: float = None):
+class BaseOptionsStrategy(PayoffResultMixin):
+    # Single leg of each preset, keyed on the SingleOptionsInputs fields
+    LEG_SPEC: Tuple[LegSpec, ...] = ()
+
+    def __init__(self, start_price: float, end_price: float, step_size: float, strike_price: float = None, premium: float = None,
+                 grid_mode: str = UNIFORM):
         self.start_price = start_price
         self.end_price = end_price
         self.step_size = step_size
-        self.expiration_prices = np.arange(start_price, end_price + step_size, step_size)
+        self.grid_mode = grid_mode
         self.strike_price = strike_price
         self.premium = premium
+        self.position = Position(LegTable.from_spec(self.LEG_SPEC, {'strike_price': strike_price, 'premium': premium}))
+        self.expiration_prices = build_price_grid(start_price, end_price, step_size, grid_mode, self.position.legs)
+
+    def calculate_payoff(self) -> 'pd.DataFrame':
+        # Option value is shown per contract, the sign of the position only affects the net payoff
+        value_column = 'Call Value' if self.LEG_SPEC[0].option_type == CALL else 'Put Value'
+        option_value = self.position.intrinsic_values(self.expiration_prices)[0]
+
+        return build_payoff_frame(
+            ['Expiration Price', 'Premium', value_column, 'Net Payoff'],
+            [self.expiration_prices, self.premium, option_value, self.position.payoff(self.expiration_prices)]
+        )
     
 class LongCall(BaseOptionsStrategy):
-    def calculate_payoff(self) -> pd.DataFrame:
-        payoffs = []
-        for expiration_price in self.expiration_prices:
-            call_value = max(expiration_price - self.strike_price, 0)
-            net_payoff = call_value - self.premium
-            payoffs.append((expiration_price, self.premium, call_value, net_payoff))
-        
-        return pd.DataFrame(
-            payoffs, 
-            columns=['Expiration Price', 'Premium', 'Call Value', 'Net Payoff']
-        )
+    LEG_SPEC = (LegSpec(CALL, LONG, 1, 'strike_price', 'premium'),)
+
     def calculate_bep(self) -> float:
         return self.strike_price + self.premium
     
 class ShortCall(BaseOptionsStrategy):
-    def calculate_payoff(self) -> pd.DataFrame:
-        payoffs = []
-        for expiration_price in self.expiration_prices:
-            call_value = max(expiration_price - self.strike_price, 0)
-            net_payoff = self.premium - call_value
-            payoffs.append((expiration_price, self.premium, call_value, net_payoff))
-        
-        return pd.DataFrame(
-            payoffs, 
-            columns=['Expiration Price', 'Premium', 'Call Value', 'Net Payoff']
-        )
+    LEG_SPEC = (LegSpec(CALL, SHORT, 1, 'strike_price', 'premium'),)
 
     def calculate_bep(self) -> float:
         return self.strike_price + self.premium
 
 class LongPut(BaseOptionsStrategy):
-    def calculate_payoff(self) -> pd.DataFrame:
-        payoffs = []
-        for expiration_price in self.expiration_prices:
-            put_value = max(self.strike_price - expiration_price, 0)
-            net_payoff = put_value - self.premium
-            payoffs.append((expiration_price, self.premium, put_value, net_payoff))
-        
-        return pd.DataFrame(
-            payoffs, 
-            columns=['Expiration Price', 'Premium', 'Put Value', 'Net Payoff']
-        )
+    LEG_SPEC = (LegSpec(PUT, LONG, 1, 'strike_price', 'premium'),)
 
     def calculate_bep(self) -> float:
         return self.strike_price - self.premium
 
 class ShortPut(BaseOptionsStrategy):
-    def calculate_payoff(self) -> pd.DataFrame:
-        payoffs = []
-        for expiration_price in self.expiration_prices:
-            put_value = max(self.strike_price - expiration_price, 0)
-            net_payoff = self.premium - put_value
-            payoffs.append((expiration_price, self.premium, put_value, net_payoff))
-        
-        return pd.DataFrame(
-            payoffs, 
-            columns=['Expiration Price', 'Premium', 'Put Value', 'Net Payoff']
-        )
+    LEG_SPEC = (LegSpec(PUT, SHORT, 1, 'strike_price', 'premium'),)
 
     def calculate_bep(self) -> float:
-        return self.strike_price - self.premium
\ No newline at end of file
+        return self.strike_price - self.premium
@@ -0,0 +1,62 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Mapping, Sequence, Union
+from .payoff_engine import CALL
+from .legs import LONG, LegSpec
+from .breakeven import solve_kinks, solve_break_even_points, solve_extremes
+
+# Payoffs and risk numbers of many scenarios of one strategy on a shared price grid
+@dataclass(frozen=True)
+class BatchResult:
+    expiration_prices: np.ndarray   # (n_prices,)
+    payoffs: np.ndarray             # (n_scenarios, n_prices)
+    break_even_points: np.ndarray   # (n_scenarios, max BEPs per scenario), NaN padded
+    max_profit: np.ndarray          # (n_scenarios,), np.inf when unbounded
+    max_loss: np.ndarray            # (n_scenarios,), -np.inf when unbounded
+
+def broadcast_columns(inputs: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    # Scenario columns as equal-length 1-D float arrays; a scalar column (a field held fixed) is
+    # repeated for every scenario
+    arrays = [np.atleast_1d(np.asarray(values, dtype=float)) for values in inputs.values()]
+    if any(array.ndim > 1 for array in arrays):
+        raise ValueError("Scenario columns must be scalars or 1-D arrays")
+    try:
+        arrays = np.broadcast_arrays(*arrays)
+    except ValueError as error:
+        raise ValueError("Scenario columns must be scalars or arrays of the same length") from error
+    return dict(zip(inputs, arrays))
+
+def batch_leg_arrays(leg_spec: Sequence[LegSpec], inputs: Mapping[str, np.ndarray]):
+    # Columnar inputs -> strikes and premiums shaped (n_scenarios, n_legs), leg constants shaped (n_legs,)
+    columns = broadcast_columns(inputs)
+    strikes = np.stack([columns[leg.strike_field] for leg in leg_spec], axis=-1)
+    premiums = np.stack([columns[leg.premium_field] for leg in leg_spec], axis=-1)
+    is_call = np.array([leg.option_type == CALL for leg in leg_spec])
+    signed_quantities = np.array([leg.quantity if leg.side == LONG else -leg.quantity for leg in leg_spec],
+                                 dtype=float)
+    return strikes, premiums, is_call, signed_quantities
+
+def evaluate_batch(strategy: Union[type, Sequence[LegSpec]], inputs: Mapping[str, np.ndarray],
+                   expiration_prices) -> BatchResult:
+    # `strategy` is a preset class (e.g. BullCallSpread) or its LEG_SPEC, `inputs` maps the
+    # *Inputs field names of that preset to equal-length arrays, one entry per scenario
+    leg_spec = getattr(strategy, 'LEG_SPEC', strategy)
+    strikes, premiums, is_call, signed_quantities = batch_leg_arrays(leg_spec, inputs)
+    prices = np.asarray(expiration_prices, dtype=float)
+    net_premium = premiums @ signed_quantities
+
+    # Broadcast (n_scenarios, 1) against (n_prices,); only the handful of legs is looped over
+    payoffs = np.broadcast_to(-net_premium[:, np.newaxis], (len(net_premium), len(prices))).copy()
+    for leg in range(len(leg_spec)):
+        moneyness = prices - strikes[:, leg, np.newaxis] if is_call[leg] else strikes[:, leg, np.newaxis] - prices
+        payoffs += signed_quantities[leg] * np.maximum(moneyness, 0.0)
+
+    kink_prices, kink_payoffs, slopes = solve_kinks(strikes, is_call, signed_quantities, net_premium)
+    max_profit, max_loss = solve_extremes(kink_payoffs, slopes)
+    return BatchResult(
+        expiration_prices=prices,
+        payoffs=payoffs,
+        break_even_points=solve_break_even_points(kink_prices, kink_payoffs, slopes),
+        max_profit=max_profit,
+        max_loss=max_loss
+    )
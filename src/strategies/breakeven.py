@@ -0,0 +1,80 @@
+import numpy as np
+from dataclasses import dataclass
+from .payoff_engine import CALL
+from .legs import LegTable
+
+# Exact shape of a piecewise-linear expiry payoff over prices in [0, inf)
+@dataclass(frozen=True)
+class PayoffProfile:
+    break_even_points: np.ndarray
+    max_profit: float        # np.inf when the upside is unbounded
+    max_loss: float          # Lowest payoff (negative for a loss), -np.inf when the downside is unbounded
+    kink_prices: np.ndarray  # 0 followed by the sorted strikes
+    kink_payoffs: np.ndarray
+
+def solve_kinks(strike_prices, is_call, signed_quantities, net_premium):
+    # Works on any number of leading (scenario) axes, legs on the last axis.
+    # Returns the kink prices, the payoff at each kink, the slope of each segment
+    # starting at a kink (the last one is the right tail) all shaped (..., n_legs + 1)
+    strikes, is_call, quantities = np.broadcast_arrays(
+        np.asarray(strike_prices, dtype=float), np.asarray(is_call, dtype=bool),
+        np.asarray(signed_quantities, dtype=float))
+    net_premium = np.asarray(net_premium, dtype=float)
+
+    order = np.argsort(strikes, axis=-1, kind='stable')
+    strikes = np.take_along_axis(strikes, order, axis=-1)
+    quantities = np.take_along_axis(quantities, order, axis=-1)
+    is_call = np.take_along_axis(is_call, order, axis=-1)
+    put_quantities = np.where(is_call, 0.0, quantities)
+
+    # At S = 0 only the puts are worth anything, and each put adds -q to the slope
+    payoff_at_zero = (put_quantities * strikes).sum(axis=-1) - net_premium
+    left_slope = -put_quantities.sum(axis=-1)
+
+    # Crossing a strike raises the slope by the leg's signed quantity, for calls and puts alike
+    slopes = np.concatenate([left_slope[..., np.newaxis],
+                             left_slope[..., np.newaxis] + np.cumsum(quantities, axis=-1)], axis=-1)
+    kink_prices = np.concatenate([np.zeros(strikes.shape[:-1] + (1,)), strikes], axis=-1)
+    increments = slopes[..., :-1] * np.diff(kink_prices, axis=-1)
+    kink_payoffs = np.concatenate([payoff_at_zero[..., np.newaxis],
+                                   payoff_at_zero[..., np.newaxis] + np.cumsum(increments, axis=-1)], axis=-1)
+    return kink_prices, kink_payoffs, slopes
+
+def solve_break_even_points(kink_prices, kink_payoffs, slopes) -> np.ndarray:
+    # One candidate root per segment, NaN where the payoff does not reach zero there.
+    # A zero is reported on the segment that arrives at it, so touching zeros are counted once
+    left, right = kink_payoffs[..., :-1], kink_payoffs[..., 1:]
+    crosses = ((left < 0) & (right >= 0)) | ((left > 0) & (right <= 0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        segment_roots = kink_prices[..., :-1] - left * np.diff(kink_prices, axis=-1) / (right - left)
+        tail_slope, last = slopes[..., -1], kink_payoffs[..., -1]
+        tail_root = kink_prices[..., -1] - last / tail_slope
+    segment_roots = np.where(crosses, segment_roots, np.nan)
+    tail_root = np.where((last != 0) & (np.sign(last) == -np.sign(tail_slope)), tail_root, np.nan)
+    zero_at_origin = np.where(kink_payoffs[..., 0] == 0, kink_prices[..., 0], np.nan)
+
+    roots = np.sort(np.concatenate([zero_at_origin[..., np.newaxis], segment_roots,
+                                    tail_root[..., np.newaxis]], axis=-1), axis=-1)
+    # Drop the trailing columns that are NaN for every scenario
+    width = int(np.max((~np.isnan(roots)).sum(axis=-1), initial=0))
+    return roots[..., :width]
+
+def solve_extremes(kink_payoffs, slopes):
+    # The payoff is linear between kinks, so its extremes sit on a kink or run off along the right tail
+    tail_slope = slopes[..., -1]
+    max_profit = np.where(tail_slope > 0, np.inf, kink_payoffs.max(axis=-1))
+    max_loss = np.where(tail_slope < 0, -np.inf, kink_payoffs.min(axis=-1))
+    return max_profit, max_loss
+
+def solve_payoff_profile(legs: LegTable) -> PayoffProfile:
+    # O(n_legs log n_legs) in the number of legs, no price grid involved
+    kink_prices, kink_payoffs, slopes = solve_kinks(
+        legs.strike_prices, legs.option_types == CALL, legs.signed_quantities, legs.net_premium)
+    max_profit, max_loss = solve_extremes(kink_payoffs, slopes)
+    return PayoffProfile(
+        break_even_points=solve_break_even_points(kink_prices, kink_payoffs, slopes),
+        max_profit=float(max_profit),
+        max_loss=float(max_loss),
+        kink_prices=kink_prices,
+        kink_payoffs=kink_payoffs
+    )
@@ -0,0 +1,103 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, Sequence, Union
+from .payoff_engine import CALL, PUT, intrinsic_values
+
+LONG = 'long'
+SHORT = 'short'
+
+# A single option leg, used to build a LegTable row by row
+@dataclass(frozen=True)
+class Leg:
+    option_type: str        # CALL or PUT
+    side: str               # LONG or SHORT
+    strike_price: float
+    quantity: float = 1.0
+    premium: float = 0.0    # Premium per contract, paid when long and received when short
+
+# Declarative leg of a preset strategy, naming the *Inputs fields that hold its strike and premium
+@dataclass(frozen=True)
+class LegSpec:
+    option_type: str
+    side: str
+    quantity: float
+    strike_field: str
+    premium_field: str
+
+class LegTable:
+    # Parallel arrays, one entry per leg
+    def __init__(self, option_types: Sequence[str], sides: Sequence[str], strike_prices,
+                 quantities, premiums):
+        self.option_types = np.asarray(option_types, dtype=object)
+        self.sides = np.asarray(sides, dtype=object)
+        self.strike_prices = np.asarray(strike_prices, dtype=float)
+        self.quantities = np.asarray(quantities, dtype=float)
+        self.premiums = np.asarray(premiums, dtype=float)
+
+        if not (len(self.option_types) == len(self.sides) == len(self.strike_prices)
+                == len(self.quantities) == len(self.premiums)):
+            raise ValueError("All leg arrays must have the same length")
+        if not np.isin(self.option_types, [CALL, PUT]).all():
+            raise ValueError(f"Option type must be '{CALL}' or '{PUT}'")
+        if not np.isin(self.sides, [LONG, SHORT]).all():
+            raise ValueError(f"Side must be '{LONG}' or '{SHORT}'")
+
+    @classmethod
+    def from_legs(cls, legs: Iterable[Leg]) -> 'LegTable':
+        legs = list(legs)
+        return cls(
+            [leg.option_type for leg in legs],
+            [leg.side for leg in legs],
+            [leg.strike_price for leg in legs],
+            [leg.quantity for leg in legs],
+            [leg.premium for leg in legs]
+        )
+
+    @classmethod
+    def from_spec(cls, spec: Sequence[LegSpec], inputs: Dict[str, float]) -> 'LegTable':
+        return cls(
+            [leg.option_type for leg in spec],
+            [leg.side for leg in spec],
+            [inputs[leg.strike_field] for leg in spec],
+            [leg.quantity for leg in spec],
+            [inputs[leg.premium_field] for leg in spec]
+        )
+
+    @staticmethod
+    def concatenate(tables: Sequence['LegTable']) -> 'LegTable':
+        return LegTable(
+            np.concatenate([table.option_types for table in tables]),
+            np.concatenate([table.sides for table in tables]),
+            np.concatenate([table.strike_prices for table in tables]),
+            np.concatenate([table.quantities for table in tables]),
+            np.concatenate([table.premiums for table in tables])
+        )
+
+    def __len__(self) -> int:
+        return len(self.strike_prices)
+
+    @property
+    def signed_quantities(self) -> np.ndarray:
+        # +quantity for long legs, -quantity for short legs
+        return np.where(self.sides == LONG, self.quantities, -self.quantities)
+
+    @property
+    def net_premium(self) -> float:
+        # Premiums paid on long legs less premiums received on short legs
+        return float(self.signed_quantities @ self.premiums)
+
+class Position:
+    def __init__(self, legs: Union[LegTable, Iterable[Leg]]):
+        self.legs = legs if isinstance(legs, LegTable) else LegTable.from_legs(legs)
+
+    def intrinsic_values(self, expiration_prices) -> np.ndarray:
+        # Per-contract value of each leg at expiry, shape (n_legs, n_prices)
+        return intrinsic_values(expiration_prices, self.legs.option_types, self.legs.strike_prices)
+
+    def leg_values(self, expiration_prices) -> np.ndarray:
+        # Signed value of each leg's full quantity (+ 0.0 folds -0.0 from short legs)
+        return self.legs.signed_quantities[:, np.newaxis] * self.intrinsic_values(expiration_prices) + 0.0
+
+    def payoff(self, expiration_prices) -> np.ndarray:
+        # Net payoff of the whole position as a single (n_legs,) @ (n_legs, n_prices) product
+        return self.legs.signed_quantities @ self.intrinsic_values(expiration_prices) - self.legs.net_premium
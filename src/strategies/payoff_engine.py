@@ -0,0 +1,25 @@
+import numpy as np
+from typing import TYPE_CHECKING, Sequence
+if TYPE_CHECKING:
+    import pandas as pd
+
+CALL = 'call'
+PUT = 'put'
+
+
+def intrinsic_values(expiration_prices, option_types: Sequence[str], strike_prices) -> np.ndarray:
+    # Broadcast every leg against the whole price grid at once -> shape (n_legs, n_prices)
+    prices = np.asarray(expiration_prices, dtype=float)[np.newaxis, :]
+    strikes = np.asarray(strike_prices, dtype=float)[:, np.newaxis]
+    is_call = (np.asarray(option_types) == CALL)[:, np.newaxis]
+
+    # Calls pay max(S - K, 0), puts pay max(K - S, 0)
+    return np.maximum(np.where(is_call, prices - strikes, strikes - prices), 0.0)
+
+
+def build_payoff_frame(columns: Sequence[str], values: Sequence) -> 'pd.DataFrame':
+    # pandas is imported on first use so headless NumPy callers never load it
+    import pandas as pd
+
+    # Scalars (premiums) are broadcast by pandas against the array columns
+    return pd.DataFrame(dict(zip(columns, values)))
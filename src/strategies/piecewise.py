@@ -0,0 +1,71 @@
+import numpy as np
+from typing import Dict, Tuple
+from .payoff_engine import CALL
+from .legs import LegTable
+from .breakeven import solve_kinks, solve_break_even_points, solve_extremes
+from .price_grid import uniform_grid
+
+class PiecewiseLinearPayoff:
+    # Lossless compact form of an expiry payoff: the price of each breakpoint, the payoff there and the
+    # slope of the segment that starts at it (the last slope is the right tail). Only the breakpoints
+    # where the slope changes are kept, so the size depends on the number of distinct strikes, not the grid
+    def __init__(self, breakpoints, values, slopes):
+        self.breakpoints = np.asarray(breakpoints, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        self.slopes = np.asarray(slopes, dtype=float)
+
+        if not (self.breakpoints.ndim == self.values.ndim == self.slopes.ndim == 1):
+            raise ValueError("Breakpoints, values and slopes must be one-dimensional")
+        if not (len(self.breakpoints) == len(self.values) == len(self.slopes)) or not len(self.breakpoints):
+            raise ValueError("Breakpoints, values and slopes must be non-empty and have the same length")
+        if np.any(np.diff(self.breakpoints) <= 0):
+            raise ValueError("Breakpoints must be strictly increasing")
+
+    @classmethod
+    def from_legs(cls, legs: LegTable) -> 'PiecewiseLinearPayoff':
+        kink_prices, kink_payoffs, slopes = solve_kinks(
+            legs.strike_prices, legs.option_types == CALL, legs.signed_quantities, legs.net_premium)
+        # Legs sharing a strike leave zero-length segments, keep the last kink at each price
+        distinct = np.append(np.diff(kink_prices) > 0, True)
+        kink_prices, kink_payoffs, slopes = kink_prices[distinct], kink_payoffs[distinct], slopes[distinct]
+        # A kink where the slope does not change is not a breakpoint (e.g. offsetting legs)
+        changes = np.insert(slopes[1:] != slopes[:-1], 0, True)
+        return cls(kink_prices[changes], kink_payoffs[changes] + 0.0, slopes[changes] + 0.0)
+
+    def __len__(self) -> int:
+        return len(self.breakpoints)
+
+    def __call__(self, prices) -> np.ndarray:
+        # O(log k) per price: find the segment, then follow its slope from the breakpoint.
+        # Prices below the first breakpoint extend the first segment
+        prices = np.asarray(prices, dtype=float)
+        segment = np.maximum(np.searchsorted(self.breakpoints, prices, side='right') - 1, 0)
+        return self.values[segment] + self.slopes[segment] * (prices - self.breakpoints[segment])
+
+    def expand(self, start_price: float, end_price: float, step_size: float) -> Tuple[np.ndarray, np.ndarray]:
+        # Expiration prices and payoffs on a uniform grid, identical to the strategy's own grid
+        prices = uniform_grid(start_price, end_price, step_size)
+        return prices, self(prices)
+
+    @property
+    def break_even_points(self) -> np.ndarray:
+        return solve_break_even_points(self.breakpoints, self.values, self.slopes)
+
+    @property
+    def max_profit(self) -> float:
+        return float(solve_extremes(self.values, self.slopes)[0])
+
+    @property
+    def max_loss(self) -> float:
+        return float(solve_extremes(self.values, self.slopes)[1])
+
+    def to_dict(self) -> Dict[str, list]:
+        return {
+            'breakpoints': self.breakpoints.tolist(),
+            'values': self.values.tolist(),
+            'slopes': self.slopes.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, list]) -> 'PiecewiseLinearPayoff':
+        return cls(data['breakpoints'], data['values'], data['slopes'])
@@ -0,0 +1,75 @@
+import numpy as np
+from typing import Iterable, List, Tuple
+from .legs import LONG, SHORT, LegTable, Position
+from .breakeven import PayoffProfile, solve_payoff_profile
+from .piecewise import PiecewiseLinearPayoff
+
+class Portfolio:
+    # A book of strategies on one underlying. Every leg of every position is merged into a single
+    # LegTable so the combined payoff, BEPs and Greeks are one vectorized evaluation
+    def __init__(self, positions: Iterable[Tuple[object, float]] = ()):
+        self.strategies: List[object] = []
+        self.quantities: List[float] = []
+        self._legs = None
+        self._position_ids = None
+        for strategy, quantity in positions:
+            self.add(strategy, quantity)
+
+    def add(self, strategy, quantity: float = 1.0) -> 'Portfolio':
+        # Any strategy instance with a `position`, a negative quantity sells the whole strategy
+        self.strategies.append(strategy)
+        self.quantities.append(float(quantity))
+        self._legs = None
+        return self
+
+    def __len__(self) -> int:
+        return len(self.strategies)
+
+    @property
+    def names(self) -> List[str]:
+        return [type(strategy).__name__ for strategy in self.strategies]
+
+    @property
+    def legs(self) -> LegTable:
+        if self._legs is None:
+            self._build_legs()
+        return self._legs
+
+    @property
+    def position_ids(self) -> np.ndarray:
+        # Index of the owning position for every leg of the aggregated table
+        if self._legs is None:
+            self._build_legs()
+        return self._position_ids
+
+    def _build_legs(self):
+        tables = [strategy.position.legs for strategy in self.strategies]
+        merged = LegTable.concatenate(tables) if tables else LegTable([], [], [], [], [])
+        self._position_ids = np.repeat(np.arange(len(tables)), [len(table) for table in tables])
+        signed_quantities = merged.signed_quantities * np.asarray(self.quantities, dtype=float)[self._position_ids]
+        self._legs = LegTable(merged.option_types, np.where(signed_quantities < 0, SHORT, LONG),
+                              merged.strike_prices, np.abs(signed_quantities), merged.premiums)
+
+    def payoff(self, expiration_prices) -> np.ndarray:
+        return Position(self.legs).payoff(expiration_prices)
+
+    def profile(self) -> PayoffProfile:
+        return solve_payoff_profile(self.legs)
+
+    def payoff_function(self) -> PiecewiseLinearPayoff:
+        return PiecewiseLinearPayoff.from_legs(self.legs)
+
+    def greeks(self, spot_prices, time_to_expiry, volatility, rate=0.0, dividend_yield=0.0):
+        # Imported here, src.pricing depends on this package
+        from ..pricing.greeks import position_greeks
+        return position_greeks(self.legs, spot_prices, time_to_expiry, volatility, rate, dividend_yield)
+
+    def attribution(self, expiration_prices) -> np.ndarray:
+        # Payoff of each position at expiry, shape (n_positions, n_prices); the rows sum to payoff()
+        legs = self.legs
+        prices = np.asarray(expiration_prices, dtype=float)
+        leg_payoffs = legs.signed_quantities[:, np.newaxis] * (
+            Position(legs).intrinsic_values(prices) - legs.premiums[:, np.newaxis])
+        contributions = np.zeros((len(self), len(prices)))
+        np.add.at(contributions, self.position_ids, leg_payoffs)
+        return contributions + 0.0
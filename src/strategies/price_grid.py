@@ -0,0 +1,55 @@
+import numpy as np
+from .legs import LegTable
+from .breakeven import solve_payoff_profile
+
+# Grid generation modes
+UNIFORM = 'uniform'  # Every step_size from start_price to end_price
+KINKS = 'kinks'      # Only the range endpoints, strikes and break-evens (exact for expiry payoffs)
+REFINED_KINKS = 'refined_kinks'  # The kink grid plus KINK_REFINE_POINTS points within one step either side of each kink
+
+GRID_MODES = (UNIFORM, KINKS, REFINED_KINKS)
+
+KINK_REFINE_POINTS = 4
+
+# Tolerance (in steps) for deciding whether the last step still lands on end_price
+_STEP_TOLERANCE = 1e-9
+
+def uniform_grid(start_price: float, end_price: float, step_size: float) -> np.ndarray:
+    if step_size <= 0:
+        raise ValueError("Step size must be positive")
+    # Count the steps instead of np.arange(start, end + step, step), which can emit a point past
+    # end_price when (end - start) / step is not a whole number or rounds just above one
+    count = int(np.floor((end_price - start_price) / step_size + _STEP_TOLERANCE)) + 1
+    return start_price + step_size * np.arange(max(count, 1))
+
+def insert_points(prices: np.ndarray, points) -> np.ndarray:
+    # Sorted union of the grid and the extra points (duplicates removed)
+    return np.union1d(prices, np.asarray(points, dtype=float))
+
+def kink_grid(start_price: float, end_price: float, kinks, refine: int = 0,
+              refine_width: float = None) -> np.ndarray:
+    kinks = np.asarray(kinks, dtype=float)
+    kinks = kinks[(kinks > start_price) & (kinks < end_price)]
+    prices = insert_points(np.array([start_price, end_price], dtype=float), kinks)
+
+    # Optional extra points on each side of every kink, e.g. for smooth pre-expiry curves
+    if refine > 0 and len(kinks):
+        if refine_width is None:
+            refine_width = (end_price - start_price) / 20
+        offsets = refine_width * np.arange(1, refine + 1) / refine
+        neighbours = (kinks[:, np.newaxis] + np.concatenate([-offsets, offsets])).ravel()
+        neighbours = neighbours[(neighbours > start_price) & (neighbours < end_price)]
+        prices = insert_points(prices, neighbours)
+    return prices
+
+def build_price_grid(start_price: float, end_price: float, step_size: float, grid_mode: str = UNIFORM,
+                     legs: LegTable = None) -> np.ndarray:
+    if grid_mode == UNIFORM:
+        return uniform_grid(start_price, end_price, step_size)
+    if grid_mode in (KINKS, REFINED_KINKS):
+        if legs is None:
+            raise ValueError("The kink grid needs the strategy legs")
+        kinks = np.concatenate([legs.strike_prices, solve_payoff_profile(legs).break_even_points])
+        refine = KINK_REFINE_POINTS if grid_mode == REFINED_KINKS else 0
+        return kink_grid(start_price, end_price, kinks, refine, refine_width=step_size)
+    raise ValueError(f"Unknown grid mode '{grid_mode}', expected one of {GRID_MODES}")
@@ -0,0 +1,40 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Tuple, Union
+if TYPE_CHECKING:
+    import pandas as pd
+from .breakeven import PayoffProfile, solve_payoff_profile
+
+# Everything a render needs from one strategy evaluation
+@dataclass(frozen=True)
+class PayoffResult:
+    payoff_data: 'pd.DataFrame'
+    bep: Union[float, Tuple[float, ...]]
+    max_profit: float  # Over the evaluated price grid
+    max_loss: float
+    profile: PayoffProfile  # Exact BEPs and risk numbers, independent of the grid
+
+class PayoffResultMixin:
+    def result_key(self) -> tuple:
+        # The data calculate_payoff actually evaluates: the leg arrays and the price grid. Strategies are
+        # built once from their inputs, so changing an input attribute afterwards does not move the key;
+        # the position (or a new strategy) has to change for the result to change
+        legs = self.position.legs
+        return (tuple(legs.option_types), tuple(legs.sides), legs.strike_prices.tobytes(),
+                legs.quantities.tobytes(), legs.premiums.tobytes(),
+                np.asarray(self.expiration_prices, dtype=float).tobytes())
+
+    def get_result(self) -> PayoffResult:
+        # Memoized per instance, recomputed only when the legs or the price grid change
+        key = self.result_key()
+        if getattr(self, '_cached_result_key', None) != key:
+            payoff_data = self.calculate_payoff()
+            self._cached_result = PayoffResult(
+                payoff_data=payoff_data,
+                bep=self.calculate_bep(),
+                max_profit=payoff_data['Net Payoff'].max(),
+                max_loss=payoff_data['Net Payoff'].min(),
+                profile=solve_payoff_profile(self.position.legs)
+            )
+            self._cached_result_key = key
+        return self._cached_result
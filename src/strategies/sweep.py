@@ -0,0 +1,111 @@
+import os
+import numpy as np
+from dataclasses import dataclass
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, Mapping, Optional, Sequence, Union
+from .legs import LegSpec
+from .batch import BatchResult, broadcast_columns, evaluate_batch
+
+# Scenarios handed to a worker at a time, large enough to amortise the task overhead
+DEFAULT_CHUNK_SIZE = 20_000
+
+def sweep_grid(**axes) -> Dict[str, np.ndarray]:
+    # Cartesian product of the given parameter values as equal-length columns, e.g.
+    # sweep_grid(strike_price_low=[90, 95], premium_low=np.arange(1, 5)); the last axis varies fastest
+    mesh = np.meshgrid(*[np.asarray(values, dtype=float) for values in axes.values()], indexing='ij')
+    return {name: column.ravel() for name, column in zip(axes, mesh)}
+
+@dataclass(frozen=True)
+class _SharedArray:
+    # Enough to re-attach a shared NumPy array in another process
+    name: str
+    shape: tuple
+
+    @classmethod
+    def create(cls, shape: tuple):
+        segment = SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+        return cls(segment.name, shape), segment
+
+    def attach(self):
+        segment = SharedMemory(name=self.name)
+        return segment, np.ndarray(self.shape, dtype=float, buffer=segment.buf)
+
+def _evaluate_chunk(task) -> int:
+    # Worker: evaluate one slice of scenarios and write it into its rows of the shared outputs
+    leg_spec, inputs, expiration_prices, start, outputs = task
+    result = evaluate_batch(leg_spec, inputs, expiration_prices)
+    for name, shared in outputs.items():
+        segment, array = shared.attach()
+        values = getattr(result, name)
+        if name == 'break_even_points':
+            array[start:start + len(values), :values.shape[1]] = values
+        else:
+            array[start:start + len(values)] = values
+        del array
+        segment.close()
+    return len(result.max_profit)
+
+def run_sweep(strategy: Union[type, Sequence[LegSpec]], inputs: Mapping[str, np.ndarray], expiration_prices,
+              processes: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              progress: Optional[Callable[[int, int], None]] = None) -> BatchResult:
+    # evaluate_batch sharded over a process pool. Workers write straight into shared memory, so only the
+    # input slices travel through pickling, and rows come back in input order whatever order chunks finish in.
+    # `progress(done, total)` is called after every chunk
+    leg_spec = tuple(getattr(strategy, 'LEG_SPEC', strategy))
+    prices = np.asarray(expiration_prices, dtype=float)
+    columns = broadcast_columns(inputs)
+    total = len(next(iter(columns.values()))) if columns else 0
+    processes = processes or os.cpu_count() or 1
+
+    # A position with n legs has at most n + 2 break-evens (origin, one per segment, right tail)
+    shapes = {
+        'payoffs': (total, len(prices)),
+        'break_even_points': (total, len(leg_spec) + 2),
+        'max_profit': (total,),
+        'max_loss': (total,)
+    }
+    outputs, segments = {}, []
+    pool = None
+    try:
+        for name, shape in shapes.items():
+            outputs[name], segment = _SharedArray.create(shape)
+            segments.append(segment)
+            if name == 'break_even_points':
+                np.ndarray(shape, dtype=float, buffer=segment.buf).fill(np.nan)
+
+        tasks = [(leg_spec, {name: values[start:start + chunk_size] for name, values in columns.items()},
+                  prices, start, outputs) for start in range(0, total, chunk_size)]
+        if processes > 1 and len(tasks) > 1:
+            pool = get_context().Pool(min(processes, len(tasks)))
+            chunk_counts = pool.imap_unordered(_evaluate_chunk, tasks)
+        else:
+            chunk_counts = map(_evaluate_chunk, tasks)
+
+        done = 0
+        for count in chunk_counts:
+            done += count
+            if progress is not None:
+                progress(done, total)
+
+        # Copy out of shared memory before the segments are released
+        results = {}
+        for name, segment in zip(shapes, segments):
+            results[name] = np.ndarray(shapes[name], dtype=float, buffer=segment.buf).copy()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+    break_even_points = results['break_even_points']
+    width = int(np.max((~np.isnan(break_even_points)).sum(axis=-1), initial=0))
+    return BatchResult(
+        expiration_prices=prices,
+        payoffs=results['payoffs'],
+        break_even_points=break_even_points[:, :width],
+        max_profit=results['max_profit'],
+        max_loss=results['max_loss']
+    )
@@ -1,11 +1,22 @@
+import importlib
+
 from .validators import (
     ValidationResult,
-    StrategyValidator
+    ValidationRule,
+    BatchValidationResult,
+    StrategyValidator,
+    validate_batch
 )
 
-from .formatters import DataFormatter
+from .result_cache import CachedRender, CacheStats, ResultCache
 
-from .strategy_renderer import StrategyRenderer
+from .strategy_registry import (
+    InputField,
+    StrategyDefinition,
+    StrategyRegistry,
+    STRATEGY_REGISTRY,
+    register_strategy
+)
 
 # Import Strategy Inputs
 from .strategy_inputs import (
@@ -39,14 +50,41 @@ from src.strategies.complex_strategy import (
     LongButterfly
 )
 
+# The formatter needs pandas and the renderer needs Streamlit and matplotlib, so both
+# are imported on first access and headless callers of this package never load them
+_LAZY_IMPORTS = {
+    'DataFormatter': '.formatters',
+    'StrategyRenderer': '.strategy_renderer',
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     # Validators
     'ValidationResult',
+    'ValidationRule',
+    'BatchValidationResult',
     'StrategyValidator',
+    'validate_batch',
     
     # Formatters
     'DataFormatter',
     
+    # Result Cache
+    'CachedRender',
+    'CacheStats',
+    'ResultCache',
+    
+    # Strategy Registry
+    'InputField',
+    'StrategyDefinition',
+    'StrategyRegistry',
+    'STRATEGY_REGISTRY',
+    'register_strategy',
+    
     # Strategy Inputs
     'SingleOptionsInputs',
     'BullCallSpreadInputs',
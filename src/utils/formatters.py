@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 class DataFormatter:
@@ -7,11 +8,22 @@ class DataFormatter:
     PADDING = 5  
     COLUMN_WIDTH = 180  
     SCROLLBAR_WIDTH = 25  
+    MAX_VISIBLE_ROWS = 25  # Taller tables scroll inside st.dataframe instead of growing the page
+
+    # Rows per page, only the page on screen is styled and sent to the browser
+    PAGE_SIZE = 500
+
+    # Row colour per payoff class: profit (Net Payoff > 0), loss (< 0), break-even (= 0)
+    ROW_COLOURS = np.array([
+        'background-color: rgba(0, 255, 0, 0.2)',
+        'background-color: rgba(255, 0, 0, 0.2)',
+        'background-color: rgba(173, 216, 230, 0.2)'
+    ])
 
     @staticmethod
     def calculate_table_dimensions(df: pd.DataFrame) -> tuple:
         # Calculate height based on number of rows
-        num_rows = len(df)
+        num_rows = min(len(df), DataFormatter.MAX_VISIBLE_ROWS)
         total_height = (num_rows * DataFormatter.ROW_HEIGHT) + DataFormatter.HEADER_HEIGHT + DataFormatter.PADDING
 
         # Calculate width based on number of columns
@@ -21,8 +33,20 @@ class DataFormatter:
         return total_height, total_width
 
     @staticmethod
-    def format_payoff_table(df: pd.DataFrame, strategy_name: str) -> tuple:
-        formatted_df = df.copy()
+    def page_count(df: pd.DataFrame, page_size: int = PAGE_SIZE) -> int:
+        return max(-(-len(df) // page_size), 1)
+
+    @staticmethod
+    def row_colours(net_payoff) -> np.ndarray:
+        # Colour of every row in one vectorized step
+        net_payoff = np.asarray(net_payoff, dtype=float)
+        return DataFormatter.ROW_COLOURS[np.select([net_payoff > 0, net_payoff < 0], [0, 1], default=2)]
+
+    @staticmethod
+    def format_payoff_table(df: pd.DataFrame, strategy_name: str, page: int = 0,
+                            page_size: int = PAGE_SIZE) -> tuple:
+        # Only the requested page is copied and styled
+        formatted_df = df.iloc[page * page_size:(page + 1) * page_size].copy()
 
         # Add a Total Premium column based on the strategy type
         if strategy_name in ['bull_call_spread', 'bear_put_spread']:
@@ -34,13 +58,13 @@ class DataFormatter:
                                               formatted_df['Upper Call Value'] -
                                               formatted_df['Middle Call Value'])
 
-        # Highlight based on net payoff
-        def highlight_rows(row):
-            return ['background-color: rgba(0, 255, 0, 0.2)' if row['Net Payoff'] > 0 else
-                    'background-color: rgba(255, 0, 0, 0.2)' if row['Net Payoff'] < 0 else
-                    'background-color: rgba(173, 216, 230, 0.2)' for _ in row]
+        # Highlight based on net payoff, one call for the whole frame instead of one per row
+        def highlight_rows(frame):
+            colours = DataFormatter.row_colours(frame['Net Payoff'])
+            return pd.DataFrame(np.repeat(colours[:, np.newaxis], len(frame.columns), axis=1),
+                                index=frame.index, columns=frame.columns)
         # Apply the highlighting
-        styled_df = formatted_df.style.apply(highlight_rows, axis=1)
+        styled_df = formatted_df.style.apply(highlight_rows, axis=None)
 
         height, width = DataFormatter.calculate_table_dimensions(formatted_df)
 
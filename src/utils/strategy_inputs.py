@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 # Inputs for Simple Options Strategies
-@dataclass
+@dataclass(frozen=True)
 class SingleOptionsInputs:
     strike_price: float
     premium: float
@@ -10,7 +10,7 @@ class SingleOptionsInputs:
     step_size: float
 
 # Inputs for Complex Options Strategies
-@dataclass
+@dataclass(frozen=True)
 class BullCallSpreadInputs:
     strike_price_low: float
     strike_price_high: float
@@ -20,7 +20,7 @@ class BullCallSpreadInputs:
     end_price: float
     step_size: float
 
-@dataclass
+@dataclass(frozen=True)
 class BearPutSpreadInputs:
     strike_price_high: float
     strike_price_low: float
@@ -30,7 +30,7 @@ class BearPutSpreadInputs:
     end_price: float
     step_size: float
 
-@dataclass
+@dataclass(frozen=True)
 class LongStraddleInputs:
     strike_price: float
     premium_call: float
@@ -39,7 +39,7 @@ class LongStraddleInputs:
     end_price: float
     step_size: float
 
-@dataclass
+@dataclass(frozen=True)
 class LongStrangleInputs:
     strike_price_low: float
     strike_price_high: float
@@ -49,7 +49,7 @@ class LongStrangleInputs:
     end_price: float
     step_size: float
 
-@dataclass
+@dataclass(frozen=True)
 class StripInputs:
     strike_price: float
     premium_call: float
@@ -58,7 +58,7 @@ class StripInputs:
     end_price: float
     step_size: float
 
-@dataclass
+@dataclass(frozen=True)
 class StrapInputs:
     strike_price: float
     premium_call: float
@@ -67,7 +67,7 @@ class StrapInputs:
     end_price: float
     step_size: float
 
-@dataclass
+@dataclass(frozen=True)
 class LongButterflyInputs:
     strike_price_low: float
     strike_price_middle: float
@@ -0,0 +1,249 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from src.strategies.legs import LegTable
+from src.strategies.breakeven import solve_payoff_profile
+from .validators import (
+    StrategyValidator,
+    ValidationResult,
+    ValidationRule,
+    BULL_CALL_SPREAD_RULES,
+    BEAR_PUT_SPREAD_RULES,
+    LONG_STRADDLE_RULES,
+    LONG_STRANGLE_RULES,
+    STRIP_RULES,
+    STRAP_RULES,
+    LONG_BUTTERFLY_RULES,
+    BASIC_RULES
+)
+from .strategy_inputs import (
+    SingleOptionsInputs,
+    BullCallSpreadInputs,
+    BearPutSpreadInputs,
+    LongStraddleInputs,
+    LongStrangleInputs,
+    StripInputs,
+    StrapInputs,
+    LongButterflyInputs
+)
+from src.strategies.base_strategy import LongCall, ShortCall, LongPut, ShortPut
+from src.strategies.complex_strategy import (
+    BullCallSpread,
+    BearPutSpread,
+    LongStraddle,
+    LongStrangle,
+    Strip,
+    Strap,
+    LongButterfly
+)
+
+# One sidebar input, `name` is the matching field of the strategy's *Inputs dataclass
+@dataclass(frozen=True)
+class InputField:
+    name: str
+    label: str
+    default: float
+    help: str
+    step: float = 1.0
+
+def analytic_break_even_points(legs: LegTable) -> np.ndarray:
+    return solve_payoff_profile(legs).break_even_points
+
+# Everything the app, the CLI and the batch tools need to know about a strategy, declared once
+@dataclass(frozen=True)
+class StrategyDefinition:
+    name: str                                           # Display name, e.g. "Bull Call Spread"
+    strategy_class: type
+    inputs_class: type
+    fields: Tuple[InputField, ...]                      # Sidebar order
+    validator: Callable[..., ValidationResult]
+    plotter: Union[str, type] = 'Basic_Payoff_Plotter'  # Plotter class or its name in src.visualisations
+    break_even_rule: Callable[[LegTable], np.ndarray] = analytic_break_even_points
+    rules: Tuple[ValidationRule, ...] = ()              # Same checks as `validator`, for validate_batch
+
+    @property
+    def key(self) -> str:
+        return normalize_strategy_name(self.name)
+
+def normalize_strategy_name(name: str) -> str:
+    # "Bull Call Spread" and "BullCallSpread" name the same strategy
+    return name.replace(" ", "")
+
+class StrategyRegistry:
+    def __init__(self):
+        self._definitions: Dict[str, StrategyDefinition] = {}
+
+    def register(self, definition: StrategyDefinition, replace: bool = False) -> StrategyDefinition:
+        if definition.key in self._definitions and not replace:
+            raise ValueError(f"Strategy '{definition.name}' is already registered")
+        self._definitions[definition.key] = definition
+        return definition
+
+    def get(self, name: str) -> Optional[StrategyDefinition]:
+        return self._definitions.get(normalize_strategy_name(name))
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_strategy_name(name) in self._definitions
+
+    def __iter__(self) -> Iterator[StrategyDefinition]:
+        # Registration order, which is the order of the strategy selector
+        return iter(self._definitions.values())
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    @property
+    def names(self) -> List[str]:
+        return [definition.name for definition in self._definitions.values()]
+
+STRATEGY_REGISTRY = StrategyRegistry()
+
+def register_strategy(definition: StrategyDefinition, replace: bool = False) -> StrategyDefinition:
+    # Entry point for strategies defined outside this package
+    return STRATEGY_REGISTRY.register(definition, replace)
+
+def _price_range_fields(start_price: float, end_price: float, start_label: str = "Start Expiration Price",
+                        end_label: str = "End Expiration Price",
+                        step_label: str = "Step Size") -> Tuple[InputField, ...]:
+    return (
+        InputField('start_price', start_label, start_price, "Lower bound of stock price range for analysis"),
+        InputField('end_price', end_label, end_price, "Upper bound of stock price range for analysis"),
+        InputField('step_size', step_label, 5.0, "Increment between price points in the analysis")
+    )
+
+def _single_option_fields(strike_help: str, premium_help: str) -> Tuple[InputField, ...]:
+    return (
+        InputField('strike_price', "Strike Price", 100.0, strike_help),
+        InputField('premium', "Premium", 5.0, premium_help, step=0.1)
+    ) + _price_range_fields(60.0, 140.0, start_label="Start Price", end_label="End Price")
+
+_BUILT_IN_STRATEGIES = (
+    StrategyDefinition(
+        "Long Call", LongCall, SingleOptionsInputs,
+        _single_option_fields("Price at which you can buy the underlying asset",
+                              "Price paid for the call option"),
+        StrategyValidator.validate_basic_inputs,
+        rules=BASIC_RULES
+    ),
+    StrategyDefinition(
+        "Short Call", ShortCall, SingleOptionsInputs,
+        _single_option_fields("Price at which you must sell the underlying asset if option is exercised",
+                              "Price received for selling the call option"),
+        StrategyValidator.validate_basic_inputs,
+        rules=BASIC_RULES
+    ),
+    StrategyDefinition(
+        "Long Put", LongPut, SingleOptionsInputs,
+        _single_option_fields("Price at which you can sell the underlying asset",
+                              "Price paid for the put option"),
+        StrategyValidator.validate_basic_inputs,
+        rules=BASIC_RULES
+    ),
+    StrategyDefinition(
+        "Short Put", ShortPut, SingleOptionsInputs,
+        _single_option_fields("Price at which you must buy the underlying asset if option is exercised",
+                              "Price received for selling the put option"),
+        StrategyValidator.validate_basic_inputs,
+        rules=BASIC_RULES
+    ),
+    StrategyDefinition(
+        "Bull Call Spread", BullCallSpread, BullCallSpreadInputs,
+        (
+            InputField('strike_price_low', "Call 1: Lower Strike Price (ITM)", 90.0,
+                       "Strike price of the ITM call option you're buying"),
+            InputField('strike_price_high', "Call 2: Higher Strike Price (OTM)", 110.0,
+                       "Strike price of the OTM call option you're selling"),
+            InputField('premium_high', "Call 1: Premium (ITM)", 15.0, "Premium paid for the ITM call option"),
+            InputField('premium_low', "Call 2: Premium (OTM)", 5.0, "Premium received for the OTM call option")
+        ) + _price_range_fields(80.0, 120.0),
+        StrategyValidator.validate_bull_call_spread,
+        rules=BULL_CALL_SPREAD_RULES,
+        plotter='BullCallSpreadPlotter'
+    ),
+    StrategyDefinition(
+        "Bear Put Spread", BearPutSpread, BearPutSpreadInputs,
+        (
+            InputField('strike_price_high', "Long Put Strike (Higher)", 110.0,
+                       "Strike price of the higher put option you're buying"),
+            InputField('strike_price_low', "Short Put Strike (Lower)", 90.0,
+                       "Strike price of the lower put option you're selling"),
+            InputField('premium_high', "Long Put Premium (Higher)", 15.0,
+                       "Premium paid for the higher strike put option"),
+            InputField('premium_low', "Short Put Premium (Lower)", 5.0,
+                       "Premium received for the lower strike put option")
+        ) + _price_range_fields(80.0, 120.0),
+        StrategyValidator.validate_bear_put_spread,
+        rules=BEAR_PUT_SPREAD_RULES,
+        plotter='BearPutSpreadPlotter'
+    ),
+    StrategyDefinition(
+        "Long Straddle", LongStraddle, LongStraddleInputs,
+        (
+            InputField('strike_price', "Call & Put ATM Strike Price", 100.0,
+                       "Strike price for both the call and put options (typically ATM)"),
+            InputField('premium_call', "Call Option Premium", 6.0, "Premium paid for the call option"),
+            InputField('premium_put', "Put Option Premium", 4.0, "Premium paid for the put option")
+        ) + _price_range_fields(80.0, 120.0),
+        StrategyValidator.validate_long_straddle,
+        rules=LONG_STRADDLE_RULES,
+        plotter='LongStraddlePlotter'
+    ),
+    StrategyDefinition(
+        "Long Strangle", LongStrangle, LongStrangleInputs,
+        (
+            InputField('strike_price_low', "OTM Put Strike Price", 80.0,
+                       "Strike price of the OTM put option (lower than current price)"),
+            InputField('strike_price_high', "OTM Call Strike Price", 100.0,
+                       "Strike price of the OTM call option (higher than current price)"),
+            InputField('premium_call', "OTM Call Premium", 4.0, "Premium paid for the OTM call option"),
+            InputField('premium_put', "OTM Put Premium", 6.0, "Premium paid for the OTM put option")
+        ) + _price_range_fields(60.0, 120.0),
+        StrategyValidator.validate_long_strangle,
+        rules=LONG_STRANGLE_RULES,
+        plotter='LongStranglePlotter'
+    ),
+    StrategyDefinition(
+        "Strip", Strip, StripInputs,
+        (
+            InputField('strike_price', "ATM Strike Price", 100.0,
+                       "Strike price for both the call and puts (typically ATM)"),
+            InputField('premium_call', "Single Call Premium", 8.0, "Premium paid for the single call option"),
+            InputField('premium_put', "Put Premium", 6.0, "Premium paid for each put option (you buy 2 puts)")
+        ) + _price_range_fields(60.0, 140.0, step_label="Price Step Size"),
+        StrategyValidator.validate_strip,
+        rules=STRIP_RULES,
+        plotter='StripPlotter'
+    ),
+    StrategyDefinition(
+        "Strap", Strap, StrapInputs,
+        (
+            InputField('strike_price', "ATM Strike Price", 100.0,
+                       "Strike price for both the calls and put (typically ATM)"),
+            InputField('premium_call', "Single Call Premium", 11.0,
+                       "Premium paid for each call option (you buy 2 calls)"),
+            InputField('premium_put', "Put Premium", 8.0, "Premium paid for the single put option")
+        ) + _price_range_fields(60.0, 140.0),
+        StrategyValidator.validate_strap,
+        rules=STRAP_RULES,
+        plotter='StrapPlotter'
+    ),
+    StrategyDefinition(
+        "Long Butterfly", LongButterfly, LongButterflyInputs,
+        (
+            InputField('strike_price_low', "Lower Strike (ITM)", 120.0, "Lower strike price - buy 1 ITM call"),
+            InputField('strike_price_middle', "Middle Strike (ATM)", 125.0,
+                       "Middle strike price - sell 2 ATM calls"),
+            InputField('strike_price_high', "Upper Strike (OTM)", 130.0, "Upper strike price - buy 1 OTM call"),
+            InputField('premium_low', "ITM Call Premium", 3.0, "Premium paid for the ITM call option"),
+            InputField('premium_middle', "ATM Call Premium", 4.0,
+                       "Premium received for each ATM call option (you sell 2)"),
+            InputField('premium_high', "OTM Call Premium", 6.0, "Premium paid for the OTM call option")
+        ) + _price_range_fields(90.0, 160.0),
+        StrategyValidator.validate_long_butterfly,
+        rules=LONG_BUTTERFLY_RULES,
+        plotter='LongButterflyPlotter'
+    ),
+)
+
+for _definition in _BUILT_IN_STRATEGIES:
+    register_strategy(_definition)
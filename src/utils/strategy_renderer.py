@@ -2,23 +2,14 @@ import streamlit as st
 import numpy as np
 from typing import Type, Union
 
-# Importing validators
-from src.utils.validators import StrategyValidator
+# Importing the strategy registry
+from src.utils.strategy_registry import STRATEGY_REGISTRY, StrategyDefinition
 
 # Importing formatters
 from src.utils.formatters import DataFormatter
 
-# Importing strategy inputs
-from src.utils.strategy_inputs import (
-    SingleOptionsInputs,
-    BullCallSpreadInputs,
-    BearPutSpreadInputs,
-    LongStraddleInputs,
-    LongStrangleInputs,
-    StripInputs,
-    StrapInputs,
-    LongButterflyInputs
-)
+# Importing the shared result cache
+from src.utils.result_cache import CachedRender, ResultCache
 
 # Importing base strategies
 from src.strategies.base_strategy import (
@@ -40,16 +31,14 @@ from src.strategies.complex_strategy import (
 )
 
 # Importing payoff plotters
-from src.visualisations.payoff_plots import (
-    Basic_Payoff_Plotter,
-    BullCallSpreadPlotter,
-    BearPutSpreadPlotter,
-    LongStraddlePlotter,
-    LongStranglePlotter,
-    StripPlotter,
-    StrapPlotter,
-    LongButterflyPlotter
-)
+import src.visualisations as visualisations
+from src.visualisations.payoff_plots import PreExpiryPayoffPlotter, dispose_figure
+from src.visualisations.greeks_plots import GreeksPlotter
+from src.visualisations.incremental_plots import IncrementalPayoffPlotter
+from src.visualisations.chart_backends import CHART_BACKENDS, DEFAULT_CHART_BACKEND, VEGA_LITE
+
+# Shared by every session served by this process, keyed on (strategy name, frozen *Inputs)
+RESULT_CACHE = ResultCache(max_entries=256, ttl_seconds=3600.0)
 
 class StrategyRenderer:
 
@@ -68,230 +57,21 @@ class StrategyRenderer:
         LongButterfly
     ]], strategy_name: str):
 
-        # Normalize the strategy name by removing spaces
-        normalized_strategy_name = strategy_name.replace(" ", "")
-
-        # Determine if the strategy is a multiple options strategy
-        is_multiple_options = normalized_strategy_name in ['BullCallSpread', 'BearPutSpread', 'LongStraddle', 'LongStrangle', 'Strip', 'Strap', 'LongButterfly']
-        is_single_options = normalized_strategy_name in ['LongCall', 'ShortCall', 'LongPut', 'ShortPut']
-        
-        # Get user inputs
-        inputs = None
-
-        if is_multiple_options:
-            # Manually provide default values for multiple options strategies
-            if normalized_strategy_name == 'BullCallSpread':
-                inputs = BullCallSpreadInputs(
-                    strike_price_low=st.sidebar.number_input("Call 1: Lower Strike Price (ITM)", value=90.0, step=1.0, 
-                                                            help="Strike price of the ITM call option you're buying"),
-                    strike_price_high=st.sidebar.number_input("Call 2: Higher Strike Price (OTM)", value=110.0, step=1.0,
-                                                             help="Strike price of the OTM call option you're selling"),
-                    premium_high=st.sidebar.number_input("Call 1: Premium (ITM)", value=15.0, step=1.0,
-                                                        help="Premium paid for the ITM call option"),  
-                    premium_low=st.sidebar.number_input("Call 2: Premium (OTM)", value=5.0, step=1.0,
-                                                       help="Premium received for the OTM call option"),  
-                    start_price=st.sidebar.number_input("Start Expiration Price", value=80.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Expiration Price", value=120.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis")
-                )
-            
-            elif normalized_strategy_name == 'BearPutSpread':
-                inputs = BearPutSpreadInputs(
-                    strike_price_high=st.sidebar.number_input("Long Put Strike (Higher)", value=110.0, step=1.0,
-                                                             help="Strike price of the higher put option you're buying"),
-                    strike_price_low=st.sidebar.number_input("Short Put Strike (Lower)", value=90.0, step=1.0,
-                                                            help="Strike price of the lower put option you're selling"),
-                    premium_high=st.sidebar.number_input("Long Put Premium (Higher)", value=15.0, step=1.0,
-                                                        help="Premium paid for the higher strike put option"),
-                    premium_low=st.sidebar.number_input("Short Put Premium (Lower)", value=5.0, step=1.0,
-                                                       help="Premium received for the lower strike put option"),
-                    start_price=st.sidebar.number_input("Start Expiration Price", value=80.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Expiration Price", value=120.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis")
-                )            
-            
-            elif normalized_strategy_name == 'LongStraddle':
-                inputs = LongStraddleInputs(
-                    strike_price=st.sidebar.number_input("Call & Put ATM Strike Price", value=100.0, step=1.0,
-                                                        help="Strike price for both the call and put options (typically ATM)"),
-                    premium_call=st.sidebar.number_input("Call Option Premium", value=6.0, step=1.0,
-                                                        help="Premium paid for the call option"),
-                    premium_put=st.sidebar.number_input("Put Option Premium", value=4.0, step=1.0,
-                                                       help="Premium paid for the put option"),
-                    start_price=st.sidebar.number_input("Start Expiration Price", value=80.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Expiration Price", value=120.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis")
-                )            
-            
-            elif normalized_strategy_name == 'LongStrangle':
-                inputs = LongStrangleInputs(
-                    strike_price_low=st.sidebar.number_input("OTM Put Strike Price", value=80.0, step=1.0,
-                                                           help="Strike price of the OTM put option (lower than current price)"),
-                    strike_price_high=st.sidebar.number_input("OTM Call Strike Price", value=100.0, step=1.0,
-                                                            help="Strike price of the OTM call option (higher than current price)"),
-                    premium_call=st.sidebar.number_input("OTM Call Premium", value=4.0, step=1.0,
-                                                        help="Premium paid for the OTM call option"),
-                    premium_put=st.sidebar.number_input("OTM Put Premium", value=6.0, step=1.0,
-                                                       help="Premium paid for the OTM put option"),
-                    start_price=st.sidebar.number_input("Start Expiration Price", value=60.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Expiration Price", value=120.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis")
-                )  
-
-            elif normalized_strategy_name == 'Strip':
-                inputs = StripInputs(
-                    strike_price=st.sidebar.number_input("ATM Strike Price", value=100.0, step=1.0,
-                                                        help="Strike price for both the call and puts (typically ATM)"),
-                    premium_call=st.sidebar.number_input("Single Call Premium", value=8.0, step=1.0,
-                                                        help="Premium paid for the single call option"),
-                    premium_put=st.sidebar.number_input("Put Premium", value=6.0, step=1.0,
-                                                       help="Premium paid for each put option (you buy 2 puts)"),
-                    start_price=st.sidebar.number_input("Start Expiration Price", value=60.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Expiration Price", value=140.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Price Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis"),
-                )    
-
-            elif normalized_strategy_name == 'Strap':
-                inputs = StrapInputs(
-                    strike_price=st.sidebar.number_input("ATM Strike Price", value=100.0, step=1.0,
-                                                        help="Strike price for both the calls and put (typically ATM)"),
-                    premium_call=st.sidebar.number_input("Single Call Premium", value=11.0, step=1.0,
-                                                        help="Premium paid for each call option (you buy 2 calls)"),
-                    premium_put=st.sidebar.number_input("Put Premium", value=8.0, step=1.0,
-                                                       help="Premium paid for the single put option"),
-                    start_price=st.sidebar.number_input("Start Expiration Price", value=60.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Expiration Price", value=140.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis"),
-                )     
-
-            elif normalized_strategy_name == 'LongButterfly':
-                inputs = LongButterflyInputs(
-                    strike_price_low=st.sidebar.number_input("Lower Strike (ITM)", value=120.0, step=1.0,
-                                                           help="Lower strike price - buy 1 ITM call"),
-                    strike_price_middle=st.sidebar.number_input("Middle Strike (ATM)", value=125.0, step=1.0,
-                                                              help="Middle strike price - sell 2 ATM calls"),
-                    strike_price_high=st.sidebar.number_input("Upper Strike (OTM)", value=130.0, step=1.0,
-                                                            help="Upper strike price - buy 1 OTM call"),
-                    premium_low=st.sidebar.number_input("ITM Call Premium", value=3.0, step=1.0,
-                                                       help="Premium paid for the ITM call option"),
-                    premium_middle=st.sidebar.number_input("ATM Call Premium", value=4.0, step=1.0,
-                                                         help="Premium received for each ATM call option (you sell 2)"),
-                    premium_high=st.sidebar.number_input("OTM Call Premium", value=6.0, step=1.0,
-                                                        help="Premium paid for the OTM call option"),
-                    start_price=st.sidebar.number_input("Start Expiration Price", value=90.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Expiration Price", value=160.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis")
-                )            
-            else:
-                st.error("Unknown strategy selected.")
-                return
-        
-        if is_single_options:
-
-            if normalized_strategy_name == 'LongCall':
-                inputs = SingleOptionsInputs(
-                    strike_price=st.sidebar.number_input("Strike Price", value=100.0, step=1.0,
-                                                        help="Price at which you can buy the underlying asset"),
-                    premium=st.sidebar.number_input("Premium", value=5.0, step=0.1,
-                                                   help="Price paid for the call option"),
-                    start_price=st.sidebar.number_input("Start Price", value=60.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Price", value=140.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis")
-                )
-            elif normalized_strategy_name == 'ShortCall':
-                inputs = SingleOptionsInputs(
-                    strike_price=st.sidebar.number_input("Strike Price", value=100.0, step=1.0,
-                                                        help="Price at which you must sell the underlying asset if option is exercised"),
-                    premium=st.sidebar.number_input("Premium", value=5.0, step=0.1,
-                                                   help="Price received for selling the call option"),
-                    start_price=st.sidebar.number_input("Start Price", value=60.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Price", value=140.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis")
-                )
-            elif normalized_strategy_name == 'LongPut':
-                inputs = SingleOptionsInputs(
-                    strike_price=st.sidebar.number_input("Strike Price", value=100.0, step=1.0,
-                                                        help="Price at which you can sell the underlying asset"),
-                    premium=st.sidebar.number_input("Premium", value=5.0, step=0.1,
-                                                   help="Price paid for the put option"),
-                    start_price=st.sidebar.number_input("Start Price", value=60.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Price", value=140.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis")
-                )
-            elif normalized_strategy_name == 'ShortPut':
-                inputs = SingleOptionsInputs(
-                    strike_price=st.sidebar.number_input("Strike Price", value=100.0, step=1.0,
-                                                        help="Price at which you must buy the underlying asset if option is exercised"),
-                    premium=st.sidebar.number_input("Premium", value=5.0, step=0.1,
-                                                   help="Price received for selling the put option"),
-                    start_price=st.sidebar.number_input("Start Price", value=60.0, step=1.0,
-                                                       help="Lower bound of stock price range for analysis"),
-                    end_price=st.sidebar.number_input("End Price", value=140.0, step=1.0,
-                                                     help="Upper bound of stock price range for analysis"),
-                    step_size=st.sidebar.number_input("Step Size", value=5.0, step=1.0,
-                                                     help="Increment between price points in the analysis")
-                )
-
-            else:
-                st.error("Unknown strategy selected.")
-                return
-                
-        # Error handling for unknown strategies
-        if inputs is None:
+        # One dictionary lookup replaces the per-strategy if/elif ladders
+        definition = STRATEGY_REGISTRY.get(strategy_name)
+        if definition is None:
             st.error("Unknown strategy selected.")
             return
+        normalized_strategy_name = definition.key
+
+        # Get user inputs, one widget per declared field in the declared order
+        inputs = definition.inputs_class(**{
+            field.name: st.sidebar.number_input(field.label, value=field.default, step=field.step, help=field.help)
+            for field in definition.fields
+        })
 
         # Validate inputs
-        if is_multiple_options:
-            if normalized_strategy_name == 'BullCallSpread':
-                validation_result = StrategyValidator.validate_bull_call_spread(inputs)
-            elif normalized_strategy_name == 'BearPutSpread':
-                validation_result = StrategyValidator.validate_bear_put_spread(inputs)
-            elif normalized_strategy_name == 'LongStraddle':
-                validation_result = StrategyValidator.validate_long_straddle(inputs)
-            elif normalized_strategy_name == 'LongStrangle':
-                validation_result = StrategyValidator.validate_long_strangle(inputs)
-            elif normalized_strategy_name == 'Strip':
-                validation_result = StrategyValidator.validate_strip(inputs)
-            elif normalized_strategy_name == 'Strap':
-                validation_result = StrategyValidator.validate_strap(inputs)
-            elif normalized_strategy_name == 'LongButterfly':
-                validation_result = StrategyValidator.validate_long_butterfly(inputs)
-            else:
-                st.error("Unknown strategy selected.")
-                return
-        else:
-            validation_result = StrategyValidator.validate_basic_inputs(inputs)
+        validation_result = definition.validator(inputs)
 
         if not validation_result.is_valid:
             st.error(validation_result.message)
@@ -299,18 +79,31 @@ class StrategyRenderer:
         elif validation_result.severity == "warning":
             st.warning(validation_result.message)
 
+        chart_backend = st.sidebar.selectbox(
+            "Chart Backend", options=CHART_BACKENDS, index=CHART_BACKENDS.index(DEFAULT_CHART_BACKEND),
+            help="Vega-Lite draws an interactive chart in the browser, matplotlib renders a static image on the server"
+        )
+
         try:
-            strategy = strategy_class(**inputs.__dict__)  # Unpack the dataclass to pass as keyword arguments
+            # Identical inputs from any session reuse the same table and plot
+            rendered = RESULT_CACHE.get_or_compute(
+                (normalized_strategy_name, inputs, chart_backend),
+                lambda: StrategyRenderer._render_result(strategy_class, inputs, definition, chart_backend)
+            )
         except TypeError as e:
             st.error(f"Error creating strategy instance: {e}")
             return
     
-        # After calculating results
-        payoff_data = strategy.calculate_payoff()  # Ensure this includes the new Total Premium column
-        # Get formatted data and dimensions
-        formatted_df, height, width = DataFormatter.format_payoff_table(payoff_data, strategy_name)
         # Display the table with calculated dimensions
         st.subheader(f"{strategy_name} - Net-Payoff Table")
+        # Large grids are paged so only the rows on screen are styled and sent
+        page = 0
+        page_count = DataFormatter.page_count(rendered.payoff_data)
+        if page_count > 1:
+            page = st.number_input(f"Table Page (of {page_count})", min_value=1, max_value=page_count,
+                                   value=1, step=1) - 1
+        # Get formatted data and dimensions
+        formatted_df, height, width = DataFormatter.format_payoff_table(rendered.payoff_data, strategy_name, page)
         st.dataframe(
             formatted_df,
             height=height,
@@ -319,21 +112,78 @@ class StrategyRenderer:
 
         # Display payoff plot
         st.subheader(f"{strategy_name} - Net-Payoff Graph")
-        if normalized_strategy_name == 'BullCallSpread':
-            fig, _ = BullCallSpreadPlotter.create_plot(strategy, normalized_strategy_name, figsize=(10, 5))
-        elif normalized_strategy_name == 'BearPutSpread':
-            fig, _ = BearPutSpreadPlotter.create_plot(strategy, normalized_strategy_name, figsize=(10, 5))
-        elif normalized_strategy_name == 'LongStraddle':
-            fig, _ = LongStraddlePlotter.create_plot(strategy, normalized_strategy_name, figsize=(10, 5))
-        elif normalized_strategy_name == 'LongStrangle':
-            fig, _ = LongStranglePlotter.create_plot(strategy, normalized_strategy_name, figsize=(10, 5))
-        elif normalized_strategy_name == 'Strip':
-            fig, _ = StripPlotter.create_plot(strategy, normalized_strategy_name, figsize=(10, 5))
-        elif normalized_strategy_name == 'Strap':
-            fig, _ = StrapPlotter.create_plot(strategy, normalized_strategy_name, figsize=(10, 5))
-        elif normalized_strategy_name == 'LongButterfly':
-            fig, _ = LongButterflyPlotter.create_plot(strategy, normalized_strategy_name, figsize=(10, 5))
+        if rendered.chart_spec is not None:
+            st.vega_lite_chart(rendered.chart_spec, width="stretch")
         else:
-            fig, _ = Basic_Payoff_Plotter.create_basic_payoff_plot(strategy, normalized_strategy_name, figsize=(10, 5))
+            # This session's artists are updated here, outside the shared cache, so a hit on another
+            # session's entry still moves this session's plot
+            plotter = StrategyRenderer._session_plotter(normalized_strategy_name,
+                                                        StrategyRenderer._plotter_class(definition))
+            st.image(plotter.png(rendered.strategy), width="stretch")
+
+        # Optional mark-to-market curves and Greeks before expiry, priced with Black-Scholes
+        pre_expiry = st.sidebar.expander("Pre-Expiry Analysis")
+        show_curves = pre_expiry.checkbox("Show pre-expiry payoff curves", value=False,
+                                          help="Price every leg with Black-Scholes at several times before expiration")
+        show_greeks = pre_expiry.checkbox("Show Greeks", value=False,
+                                          help="Delta, gamma, vega, theta and rho of the whole position")
+        if show_curves or show_greeks:
+            volatility = pre_expiry.number_input("Volatility (%)", value=25.0, step=1.0, min_value=0.0,
+                                                 help="Annualised volatility of the underlying")
+            rate = pre_expiry.number_input("Risk-Free Rate (%)", value=5.0, step=0.5,
+                                           help="Annualised continuously compounded risk-free rate")
+            dividend_yield = pre_expiry.number_input("Dividend Yield (%)", value=0.0, step=0.5,
+                                                     help="Annualised continuous dividend yield of the underlying")
+            days_to_expiry = pre_expiry.number_input("Days to Expiration", value=30.0, step=1.0, min_value=1.0,
+                                                     help="Calendar days until the options expire")
+
+            strategy = strategy_class(**inputs.__dict__)
+            times_to_expiry = [days_to_expiry / 365 * fraction for fraction in (1.0, 2 / 3, 1 / 3)]
+
+            if show_curves:
+                fig, _ = PreExpiryPayoffPlotter.create_plot(strategy, normalized_strategy_name, times_to_expiry,
+                                                            volatility / 100, rate / 100, dividend_yield / 100,
+                                                            figsize=(10, 5))
+                st.subheader(f"{strategy_name} - Pre-Expiry Payoff Graph")
+                st.pyplot(fig)
+                dispose_figure(fig)
+
+            if show_greeks:
+                fig, _ = GreeksPlotter.create_plot(strategy, normalized_strategy_name, times_to_expiry,
+                                                   volatility / 100, rate / 100, dividend_yield / 100,
+                                                   figsize=(10, 12))
+                st.subheader(f"{strategy_name} - Greeks")
+                st.pyplot(fig)
+                dispose_figure(fig)
 
-        st.pyplot(fig)
\ No newline at end of file
+    @staticmethod
+    def _session_plotter(normalized_strategy_name: str, plotter_class) -> IncrementalPayoffPlotter:
+        # One plotter per strategy and browser session, kept alive across reruns in st.session_state
+        plotters = st.session_state.setdefault("payoff_plotters", {})
+        if normalized_strategy_name not in plotters:
+            plotters[normalized_strategy_name] = IncrementalPayoffPlotter(normalized_strategy_name, plotter_class,
+                                                                          figsize=(10, 5))
+        return plotters[normalized_strategy_name]
+
+    @staticmethod
+    def _plotter_class(definition: StrategyDefinition):
+        # Plot hints may name a class in src.visualisations, resolved here so the registry stays headless
+        if isinstance(definition.plotter, str):
+            return getattr(visualisations, definition.plotter)
+        return definition.plotter
+
+    @staticmethod
+    def _render_result(strategy_class, inputs, definition: StrategyDefinition,
+                       chart_backend: str = DEFAULT_CHART_BACKEND) -> CachedRender:
+        normalized_strategy_name = definition.key
+        strategy = strategy_class(**inputs.__dict__)  # Unpack the dataclass to pass as keyword arguments
+        payoff_data = strategy.get_result().payoff_data  # Computed once and shared with the plotters below
+        plotter_class = StrategyRenderer._plotter_class(definition)
+
+        # Only the payoff kinks are sent, the browser draws the chart
+        if chart_backend == VEGA_LITE:
+            return CachedRender(payoff_data=payoff_data,
+                                chart_spec=plotter_class.create_chart_spec(strategy, normalized_strategy_name))
+
+        # The result is memoized on the strategy, session plotters only read it
+        return CachedRender(payoff_data=payoff_data, strategy=strategy)
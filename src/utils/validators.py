@@ -1,4 +1,6 @@
+import numpy as np
 from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Sequence, Tuple
 from .strategy_inputs import (
     SingleOptionsInputs,
     BullCallSpreadInputs,
@@ -16,131 +18,179 @@ class ValidationResult:
     message: str
     severity: str  # e.g., "error", "warning"
 
+# A single check. `violated` receives the inputs as a mapping of field name to value, either scalars
+# (one trade) or equal-length arrays (a batch), and returns True / a boolean array where the rule fails
+@dataclass(frozen=True)
+class ValidationRule:
+    code: str
+    message: str
+    violated: Callable[[Mapping], np.ndarray]
+    severity: str = "error"
+
+# Rule tables, checked in order; the scalar validators report the first failing rule
+BULL_CALL_SPREAD_RULES = (
+    ValidationRule("strike_order", "Call 1 Strike Price (Lower) must be less than Call 2 Strike Price (Higher)",
+                   lambda c: c['strike_price_low'] >= c['strike_price_high']),
+    ValidationRule("premium_order", "Call 2 Premium (Lower) must be less than Call 1 Premium (Higher)",
+                   lambda c: c['premium_low'] >= c['premium_high']),
+    ValidationRule("start_price_range", "Start Price must be less than Call 1 Strike Price (Lower)",
+                   lambda c: c['start_price'] >= c['strike_price_low']),
+    ValidationRule("end_price_range", "End Price must be greater than Call 2 Strike Price (Higher)",
+                   lambda c: c['end_price'] <= c['strike_price_high']),
+)
+
+BEAR_PUT_SPREAD_RULES = (
+    ValidationRule("strike_order", "Lower Strike (Short Put) must be less than Higher Strike (Long Put)",
+                   lambda c: c['strike_price_low'] >= c['strike_price_high']),
+    ValidationRule("premium_order", "Short Put Premium must be less than Long Put Premium",
+                   lambda c: c['premium_low'] >= c['premium_high']),
+    ValidationRule("start_price_range", "Start Price must be less than Higher Strike Price",
+                   lambda c: c['start_price'] >= c['strike_price_high']),
+    ValidationRule("end_price_range", "End Price must be greater than Lower Strike Price",
+                   lambda c: c['end_price'] <= c['strike_price_low']),
+)
+
+_CALL_PREMIUM_POSITIVE = ValidationRule("call_premium_positive", "Call Premium must be positive",
+                                        lambda c: c['premium_call'] <= 0)
+_PUT_PREMIUM_POSITIVE = ValidationRule("put_premium_positive", "Put Premium must be positive",
+                                       lambda c: c['premium_put'] <= 0)
+
+def _start_below_lower_bep(lower_bep: Callable[[Mapping], np.ndarray]) -> ValidationRule:
+    return ValidationRule("start_price_range", "Start Price should be below lower break-even point",
+                          lambda c: c['start_price'] >= lower_bep(c))
+
+def _end_above_upper_bep(upper_bep: Callable[[Mapping], np.ndarray]) -> ValidationRule:
+    return ValidationRule("end_price_range", "End Price should be above upper break-even point",
+                          lambda c: c['end_price'] <= upper_bep(c))
+
+LONG_STRADDLE_RULES = (
+    _CALL_PREMIUM_POSITIVE,
+    _PUT_PREMIUM_POSITIVE,
+    _start_below_lower_bep(lambda c: c['strike_price'] - (c['premium_call'] + c['premium_put'])),
+    _end_above_upper_bep(lambda c: c['strike_price'] + (c['premium_call'] + c['premium_put'])),
+)
+
+LONG_STRANGLE_RULES = (
+    ValidationRule("strike_order", "Put Strike must be less than Call Strike",
+                   lambda c: c['strike_price_low'] >= c['strike_price_high']),
+    _CALL_PREMIUM_POSITIVE,
+    _PUT_PREMIUM_POSITIVE,
+    _start_below_lower_bep(lambda c: c['strike_price_low'] - (c['premium_call'] + c['premium_put'])),
+    _end_above_upper_bep(lambda c: c['strike_price_high'] + (c['premium_call'] + c['premium_put'])),
+)
+
+# Strip and strap share the same break-even bounds
+_STRIP_STRAP_RULES = (
+    _CALL_PREMIUM_POSITIVE,
+    _PUT_PREMIUM_POSITIVE,
+    _start_below_lower_bep(lambda c: c['strike_price'] - ((2 * c['premium_call']) + c['premium_put'])),
+    _end_above_upper_bep(lambda c: c['strike_price'] + ((2 * c['premium_call']) + c['premium_put']) / 2),
+)
+STRIP_RULES = _STRIP_STRAP_RULES
+STRAP_RULES = _STRIP_STRAP_RULES
+
+def _butterfly_net_premium(c: Mapping) -> np.ndarray:
+    return (c['premium_low'] + c['premium_high']) - (2 * c['premium_middle'])
+
+LONG_BUTTERFLY_RULES = (
+    ValidationRule("lower_strike_order", "Lower strike must be less than middle strike",
+                   lambda c: c['strike_price_low'] >= c['strike_price_middle']),
+    ValidationRule("upper_strike_order", "Middle strike must be less than upper strike",
+                   lambda c: c['strike_price_middle'] >= c['strike_price_high']),
+    # Allow small floating point differences
+    ValidationRule("strike_spacing", "Distance between strikes must be equal",
+                   lambda c: np.abs((c['strike_price_middle'] - c['strike_price_low'])
+                                    - (c['strike_price_high'] - c['strike_price_middle'])) > 0.01),
+    ValidationRule("lower_premium_order", "ITM call premium must be less than ATM call premium",
+                   lambda c: c['premium_low'] >= c['premium_middle']),
+    ValidationRule("upper_premium_order", "ATM call premium must be less than OTM call premium",
+                   lambda c: c['premium_middle'] >= c['premium_high']),
+    _start_below_lower_bep(lambda c: c['strike_price_low'] - _butterfly_net_premium(c)),
+    _end_above_upper_bep(lambda c: c['strike_price_high'] + _butterfly_net_premium(c)),
+)
+
+BASIC_RULES = (
+    ValidationRule("positive_inputs", "Strike Price and Premium must be positive",
+                   lambda c: (c['strike_price'] <= 0) | (c['premium'] <= 0)),
+    ValidationRule("start_price_range", "Start Price must be less than Strike Price",
+                   lambda c: c['start_price'] >= c['strike_price']),
+    ValidationRule("end_price_range", "End Price must be greater than Strike Price",
+                   lambda c: c['end_price'] <= c['strike_price']),
+)
+
+def check_rules(rules: Sequence[ValidationRule], inputs) -> ValidationResult:
+    # First failing error, else the first warning, else valid
+    values = vars(inputs)
+    warning = None
+    for rule in rules:
+        if rule.violated(values):
+            if rule.severity == "error":
+                return ValidationResult(False, rule.message, rule.severity)
+            warning = warning or rule
+    if warning is not None:
+        return ValidationResult(True, warning.message, warning.severity)
+    return ValidationResult(True, "", "")
+
+# Every rule evaluated over a batch of trades, one column of `violations` per rule
+@dataclass(frozen=True)
+class BatchValidationResult:
+    rules: Tuple[ValidationRule, ...]
+    violations: np.ndarray  # (n_rows, n_rules) bool
+
+    @property
+    def is_valid(self) -> np.ndarray:
+        # Rows without any error-severity violation (warnings allowed)
+        errors = np.array([rule.severity == "error" for rule in self.rules], dtype=bool)
+        return ~(self.violations & errors).any(axis=1)
+
+    def table(self) -> Dict[str, np.ndarray]:
+        # One entry per (row, violated rule), ordered by row then by rule
+        rows, rule_index = np.nonzero(self.violations)
+        return {
+            'row': rows,
+            'code': np.array([rule.code for rule in self.rules], dtype=object)[rule_index],
+            'severity': np.array([rule.severity for rule in self.rules], dtype=object)[rule_index],
+            'message': np.array([rule.message for rule in self.rules], dtype=object)[rule_index]
+        }
+
+def validate_batch(rules: Sequence[ValidationRule], inputs: Mapping[str, np.ndarray]) -> BatchValidationResult:
+    # Columnar inputs keyed by *Inputs field name; each rule is one vectorized comparison over all rows
+    columns = {name: np.asarray(values, dtype=float) for name, values in inputs.items()}
+    n_rows = len(next(iter(columns.values()))) if columns else 0
+    violations = np.empty((n_rows, len(rules)), dtype=bool)
+    for index, rule in enumerate(rules):
+        violations[:, index] = rule.violated(columns)
+    return BatchValidationResult(tuple(rules), violations)
+
 class StrategyValidator:
     @staticmethod
     def validate_bull_call_spread(inputs: BullCallSpreadInputs) -> ValidationResult:
-        if inputs.strike_price_low >= inputs.strike_price_high:
-            return ValidationResult(False, "Call 1 Strike Price (Lower) must be less than Call 2 Strike Price (Higher)", "error")
-        if inputs.premium_low >= inputs.premium_high:
-            return ValidationResult(False, "Call 2 Premium (Lower) must be less than Call 1 Premium (Higher)", "error")
-        if inputs.start_price >= inputs.strike_price_low:
-            return ValidationResult(False, "Start Price must be less than Call 1 Strike Price (Lower)", "error")
-        if inputs.end_price <= inputs.strike_price_high:
-            return ValidationResult(False, "End Price must be greater than Call 2 Strike Price (Higher)", "error")
-        return ValidationResult(True, "", "")
+        return check_rules(BULL_CALL_SPREAD_RULES, inputs)
 
     @staticmethod
     def validate_bear_put_spread(inputs: BearPutSpreadInputs) -> ValidationResult:
-        if inputs.strike_price_low >= inputs.strike_price_high:
-            return ValidationResult(False, 
-                "Lower Strike (Short Put) must be less than Higher Strike (Long Put)","error")
-        if inputs.premium_low >= inputs.premium_high:
-            return ValidationResult(False, 
-                "Short Put Premium must be less than Long Put Premium","error")
-        if inputs.start_price >= inputs.strike_price_high:
-            return ValidationResult(False, 
-                "Start Price must be less than Higher Strike Price","error")
-        if inputs.end_price <= inputs.strike_price_low:
-            return ValidationResult(False, 
-                "End Price must be greater than Lower Strike Price","error")
-        return ValidationResult(True, "", "")
+        return check_rules(BEAR_PUT_SPREAD_RULES, inputs)
 
     @staticmethod
     def validate_long_straddle(inputs: LongStraddleInputs) -> ValidationResult:
-        if inputs.premium_call <= 0:
-            return ValidationResult(False, "Call Premium must be positive", "error")
-        if inputs.premium_put <= 0:
-            return ValidationResult(False, "Put Premium must be positive", "error")
-        if inputs.start_price >= inputs.strike_price - (inputs.premium_call + inputs.premium_put):
-            return ValidationResult(False, "Start Price should be below lower break-even point", "error")
-        if inputs.end_price <= inputs.strike_price + (inputs.premium_call + inputs.premium_put):
-            return ValidationResult(False, "End Price should be above upper break-even point", "error")
-        return ValidationResult(True, "", "")
+        return check_rules(LONG_STRADDLE_RULES, inputs)
 
     @staticmethod
     def validate_long_strangle(inputs: LongStrangleInputs) -> ValidationResult:
-        if inputs.strike_price_low >= inputs.strike_price_high:
-            return ValidationResult(False, "Put Strike must be less than Call Strike", "error")
-        if inputs.premium_call <= 0:
-            return ValidationResult(False, "Call Premium must be positive", "error")
-        if inputs.premium_put <= 0:
-            return ValidationResult(False, "Put Premium must be positive", "error")
-        total_premium = inputs.premium_call + inputs.premium_put
-        if inputs.start_price >= inputs.strike_price_low - total_premium:
-            return ValidationResult(False, "Start Price should be below lower break-even point", "error")
-        if inputs.end_price <= inputs.strike_price_high + total_premium:
-            return ValidationResult(False, "End Price should be above upper break-even point", "error")
-        return ValidationResult(True, "", "")
+        return check_rules(LONG_STRANGLE_RULES, inputs)
 
     @staticmethod
     def validate_strip(inputs: StripInputs) -> ValidationResult:
-        if inputs.premium_call <= 0:
-            return ValidationResult(False, "Call Premium must be positive", "error")
-        if inputs.premium_put <= 0:
-            return ValidationResult(False, "Put Premium must be positive", "error")
-        
-        total_premium = (2 * inputs.premium_call) + inputs.premium_put
-        lower_bep = inputs.strike_price - total_premium
-        upper_bep = inputs.strike_price + (total_premium / 2)
-        
-        if inputs.start_price >= lower_bep:
-            return ValidationResult(False, "Start Price should be below lower break-even point", "error")
-        if inputs.end_price <= upper_bep:
-            return ValidationResult(False, "End Price should be above upper break-even point", "error")
-        return ValidationResult(True, "", "")
+        return check_rules(STRIP_RULES, inputs)
 
     @staticmethod
     def validate_strap(inputs: StrapInputs) -> ValidationResult:
-        if inputs.premium_call <= 0:
-            return ValidationResult(False, "Call Premium must be positive", "error")
-        if inputs.premium_put <= 0:
-            return ValidationResult(False, "Put Premium must be positive", "error")
-        
-        total_premium = (2 * inputs.premium_call) + inputs.premium_put
-        lower_bep = inputs.strike_price - total_premium
-        upper_bep = inputs.strike_price + (total_premium / 2)
-        
-        if inputs.start_price >= lower_bep:
-            return ValidationResult(False, "Start Price should be below lower break-even point", "error")
-        if inputs.end_price <= upper_bep:
-            return ValidationResult(False, "End Price should be above upper break-even point", "error")
-        return ValidationResult(True, "", "")
+        return check_rules(STRAP_RULES, inputs)
 
     @staticmethod
     def validate_long_butterfly(inputs: LongButterflyInputs) -> ValidationResult:
-        # Check strike price order
-        if inputs.strike_price_low >= inputs.strike_price_middle:
-            return ValidationResult(False, "Lower strike must be less than middle strike", "error")
-        if inputs.strike_price_middle >= inputs.strike_price_high:
-            return ValidationResult(False, "Middle strike must be less than upper strike", "error")
-            
-        # Check equal strike price distances
-        lower_diff = inputs.strike_price_middle - inputs.strike_price_low
-        upper_diff = inputs.strike_price_high - inputs.strike_price_middle
-        if abs(lower_diff - upper_diff) > 0.01:  # Allow small floating point differences
-            return ValidationResult(False, "Distance between strikes must be equal", "error")
-        
-        # Check premium relationships
-        if inputs.premium_low >= inputs.premium_middle:
-            return ValidationResult(False, "ITM call premium must be less than ATM call premium", "error")
-        if inputs.premium_middle >= inputs.premium_high:
-            return ValidationResult(False, "ATM call premium must be less than OTM call premium", "error")
-        
-        # Check price range
-        net_premium = (inputs.premium_low + inputs.premium_high) - (2 * inputs.premium_middle)
-        if inputs.start_price >= inputs.strike_price_low - net_premium:
-            return ValidationResult(False, "Start Price should be below lower break-even point", "error")
-        if inputs.end_price <= inputs.strike_price_high + net_premium:
-            return ValidationResult(False, "End Price should be above upper break-even point", "error")
-            
-        return ValidationResult(True, "", "")
-    
+        return check_rules(LONG_BUTTERFLY_RULES, inputs)
+
     @staticmethod
     def validate_basic_inputs(inputs: SingleOptionsInputs) -> ValidationResult:
-        if inputs.strike_price <= 0 or inputs.premium <= 0:
-            return ValidationResult(False, "Strike Price and Premium must be positive", "error")
-        if inputs.start_price >= inputs.strike_price:
-            return ValidationResult(False, "Start Price must be less than Strike Price", "error")
-        if inputs.end_price <= inputs.strike_price:
-            return ValidationResult(False, "End Price must be greater than Strike Price", "error")
-        return ValidationResult(True, "", "")
\ No newline at end of file
+        return check_rules(BASIC_RULES, inputs)
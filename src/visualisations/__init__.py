@@ -7,7 +7,18 @@ from .payoff_plots import (
     LongStranglePlotter,
     StripPlotter,
     StrapPlotter,
-    LongButterflyPlotter
+    LongButterflyPlotter,
+    PreExpiryPayoffPlotter,
+    dispose_figure
+)
+from .greeks_plots import GreeksPlotter
+from .incremental_plots import IncrementalPayoffPlotter
+from .chart_backends import (
+    VEGA_LITE,
+    MATPLOTLIB,
+    CHART_BACKENDS,
+    DEFAULT_CHART_BACKEND,
+    payoff_chart_spec
 )
 
 __all__ = [
@@ -19,5 +30,14 @@ __all__ = [
     'LongStranglePlotter',
     'StripPlotter',
     'StrapPlotter',
-    'LongButterflyPlotter'
+    'LongButterflyPlotter',
+    'PreExpiryPayoffPlotter',
+    'GreeksPlotter',
+    'IncrementalPayoffPlotter',
+    'VEGA_LITE',
+    'MATPLOTLIB',
+    'CHART_BACKENDS',
+    'DEFAULT_CHART_BACKEND',
+    'payoff_chart_spec',
+    'dispose_figure'
 ]
\ No newline at end of file
@@ -0,0 +1,76 @@
+import os
+import numpy as np
+from typing import Dict, Optional
+from src.strategies.piecewise import PiecewiseLinearPayoff
+
+# Chart backends: Vega-Lite charts are drawn in the browser from a few points, matplotlib charts
+# are rasterized to PNG on the server
+VEGA_LITE = 'vega-lite'
+MATPLOTLIB = 'matplotlib'
+
+CHART_BACKENDS = (VEGA_LITE, MATPLOTLIB)
+
+# Backend used when the app does not choose one, overridable per deployment
+DEFAULT_CHART_BACKEND = os.environ.get('OPTIONS_CHART_BACKEND', VEGA_LITE)
+
+def payoff_chart_points(strategy_obj) -> Dict[str, np.ndarray]:
+    # The expiration payoff is piecewise linear, so the range ends, breakpoints and break-evens describe it exactly
+    start_price, end_price = strategy_obj.expiration_prices[0], strategy_obj.expiration_prices[-1]
+    payoff = PiecewiseLinearPayoff.from_legs(strategy_obj.position.legs)
+    break_even_points = payoff.break_even_points
+    inner = np.concatenate([payoff.breakpoints, break_even_points])
+    prices = np.union1d([start_price, end_price], inner[(inner > start_price) & (inner < end_price)])
+    return {
+        'prices': prices,
+        'payoffs': payoff(prices),
+        'break_even_points': break_even_points[(break_even_points >= start_price) & (break_even_points <= end_price)]
+    }
+
+def payoff_chart_spec(strategy_obj, title: str, y_padding: Optional[float] = None) -> dict:
+    # Vega-Lite spec of the expiration payoff chart, styled like the matplotlib plotters
+    points = payoff_chart_points(strategy_obj)
+    prices, payoffs = points['prices'], points['payoffs']
+    values = [
+        {'price': float(price), 'payoff': float(payoff), 'profit': max(float(payoff), 0.0),
+         'loss': min(float(payoff), 0.0)}
+        for price, payoff in zip(prices, payoffs)
+    ]
+    break_even_values = [{'price': float(price), 'payoff': 0.0} for price in points['break_even_points']]
+
+    x = {'field': 'price', 'type': 'quantitative', 'title': 'Stock Price at Expiration',
+         'scale': {'domain': [float(prices[0]), float(prices[-1])]}}
+    y_scale = {'zero': False}
+    if y_padding is not None:
+        padding = (payoffs.max() - payoffs.min()) * y_padding
+        y_scale = {'domain': [float(payoffs.min() - padding), float(payoffs.max() + padding)]}
+    y = {'field': 'payoff', 'type': 'quantitative', 'title': 'Profit/Loss', 'scale': y_scale}
+    tooltip = [{'field': 'price', 'type': 'quantitative', 'title': 'Price', 'format': ',.2f'},
+               {'field': 'payoff', 'type': 'quantitative', 'title': 'Net Payoff', 'format': ',.2f'}]
+
+    return {
+        '$schema': 'https://vega.github.io/schema/vega-lite/v5.json',
+        'title': title,
+        'data': {'values': values},
+        'encoding': {'x': x},
+        'layer': [
+            # Profit/Loss regions
+            {'mark': {'type': 'area', 'color': 'green', 'opacity': 0.10},
+             'encoding': {'y': {**y, 'field': 'profit'}, 'y2': {'datum': 0}}},
+            {'mark': {'type': 'area', 'color': 'red', 'opacity': 0.10},
+             'encoding': {'y': {**y, 'field': 'loss'}, 'y2': {'datum': 0}}},
+            # Zero reference line
+            {'mark': {'type': 'rule', 'color': 'red', 'strokeDash': [6, 4], 'opacity': 0.3},
+             'encoding': {'y': {'datum': 0}}},
+            # Main payoff line, drag to pan and scroll to zoom
+            {'mark': {'type': 'line', 'color': 'blue', 'strokeWidth': 2, 'point': True},
+             'encoding': {'y': y, 'tooltip': tooltip},
+             'params': [{'name': 'zoom', 'select': 'interval', 'bind': 'scales'}]},
+            # Break-even points
+            {'data': {'values': break_even_values},
+             'mark': {'type': 'point', 'color': 'green', 'filled': True, 'size': 80},
+             'encoding': {'y': y, 'tooltip': tooltip}},
+            {'data': {'values': break_even_values},
+             'mark': {'type': 'text', 'text': 'BEP', 'color': 'green', 'dy': 16},
+             'encoding': {'y': y}}
+        ]
+    }
@@ -0,0 +1,46 @@
+import numpy as np
+from matplotlib.figure import Figure
+from typing import Tuple
+from src.pricing.greeks import greeks_surface
+from src.strategies.price_grid import insert_points
+
+class GreeksPlotter:
+    CURVE_POINTS = 400
+
+    # Greek -> (axis label, scale applied for display)
+    DISPLAY = {
+        'delta': ('Delta', 1.0),
+        'gamma': ('Gamma', 1.0),
+        'vega': ('Vega (per 1% vol)', 0.01),
+        'theta': ('Theta (per day)', 1 / 365),
+        'rho': ('Rho (per 1% rate)', 0.01),
+    }
+
+    @staticmethod
+    def create_plot(strategy_obj, title: str, times_to_expiry, volatility: float, rate: float = 0.0,
+                    dividend_yield: float = 0.0, figsize=(10, 12)) -> Tuple[Figure, np.ndarray]:
+        payoff_data = strategy_obj.get_result().payoff_data
+        start_price, end_price = payoff_data['Expiration Price'].min(), payoff_data['Expiration Price'].max()
+        strikes = strategy_obj.position.legs.strike_prices
+        prices = insert_points(np.linspace(start_price, end_price, GreeksPlotter.CURVE_POINTS),
+                               strikes[(strikes > start_price) & (strikes < end_price)])
+
+        # All Greeks for every (time, price) pair in one pass
+        greeks = greeks_surface(strategy_obj.position.legs, prices, times_to_expiry, volatility, rate, dividend_yield)
+
+        fig = Figure(figsize=figsize)
+        axes = fig.subplots(len(GreeksPlotter.DISPLAY), 1, sharex=True)
+        for ax, (name, (label, scale)) in zip(axes, GreeksPlotter.DISPLAY.items()):
+            for time_to_expiry, curve in zip(times_to_expiry, getattr(greeks, name)):
+                ax.plot(prices, curve * scale, linewidth=1.5, label=f"{time_to_expiry * 365:.0f} days to expiry")
+            ax.axhline(y=0, color='red', linestyle='--', alpha=0.3)
+            ax.set_ylabel(label)
+            ax.grid(True, alpha=0.3)
+
+        # Styling
+        axes[0].set_title(title, pad=20)
+        axes[0].legend()
+        axes[-1].set_xlabel('Stock Price')
+
+        fig.tight_layout()
+        return fig, axes
@@ -0,0 +1,94 @@
+import io
+import numpy as np
+from matplotlib.figure import Figure
+from typing import Type
+from src.visualisations.payoff_plots import Basic_Payoff_Plotter
+
+class IncrementalPayoffPlotter:
+    # Stateful counterpart of the payoff plotters: the figure, axes and static artists are built once,
+    # later updates only swap the data of the payoff line, profit/loss regions and BEP markers
+    def __init__(self, title: str, plotter_class: Type[Basic_Payoff_Plotter] = Basic_Payoff_Plotter,
+                 figsize=(10, 5)):
+        self.plotter_class = plotter_class
+        self.fig = Figure(figsize=figsize)
+        self.ax = self.fig.subplots()
+        self.payoff_line, = self.ax.plot([], [], label='Net Payoff', color='blue', linewidth=2)
+        self.ax.axhline(y=0, color='red', linestyle='--', alpha=0.3)
+        self.bep_markers, = self.ax.plot([], [], 'go', markersize=8)
+        self._regions = []
+        self._annotations = []
+        self._data_key = None
+        self._png = None  # (data key, bytes) of the last encoded figure
+
+        # Styling
+        self.ax.set_title(title, pad=20)
+        self.ax.set_xlabel('Stock Price at Expiration')
+        self.ax.set_ylabel('Profit/Loss')
+        self.ax.grid(True, alpha=0.3)
+
+    def update(self, strategy_obj) -> Figure:
+        # Same inputs as the last update, the artists already show this strategy
+        data_key = strategy_obj.result_key()
+        if data_key == self._data_key:
+            return self.fig
+        first_update = self._data_key is None
+        self._data_key = data_key
+
+        result = strategy_obj.get_result()
+        prices = result.payoff_data['Expiration Price'].to_numpy()
+        net_payoff = result.payoff_data['Net Payoff'].to_numpy()
+        self.payoff_line.set_data(prices, net_payoff)
+
+        # Fill polygons and annotations cannot be reshaped in place, only these artists are rebuilt
+        for artist in self._regions + self._annotations:
+            artist.remove()
+        self._regions = [
+            self.ax.fill_between(prices, net_payoff, 0, where=net_payoff >= 0, color='green', alpha=0.10),
+            self.ax.fill_between(prices, net_payoff, 0, where=net_payoff <= 0, color='red', alpha=0.10)
+        ]
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        break_even_points = Basic_Payoff_Plotter.visible_break_even_points(result)
+        self.bep_markers.set_data(break_even_points, np.zeros_like(break_even_points))
+        self._annotations = self._annotate_break_even_points(break_even_points)
+
+        # Padded y-limits of the preset plotters
+        if self.plotter_class.Y_PADDING is not None:
+            y_padding = (result.max_profit - result.max_loss) * self.plotter_class.Y_PADDING
+            self.ax.set_ylim(result.max_loss - y_padding, result.max_profit + y_padding)
+
+        # Layout is computed once, with real tick labels, and reused by every later update
+        if first_update:
+            self.fig.tight_layout()
+        return self.fig
+
+    def png(self, strategy_obj, dpi: int = 200) -> bytes:
+        # The updated figure as PNG bytes, re-encoded only when the strategy's data changed
+        fig = self.update(strategy_obj)
+        if self._png is None or self._png[0] != self._data_key:
+            # Same savefig settings st.pyplot uses
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+            self._png = (self._data_key, buffer.getvalue())
+        return self._png[1]
+
+    def _annotate_break_even_points(self, break_even_points: np.ndarray) -> list:
+        # Label placement follows Basic_Payoff_Plotter (one BEP) and ComplexPayoffPlotter (several)
+        if len(break_even_points) == 1:
+            bep_x = break_even_points[0]
+            return [self.ax.annotate('BEP', xy=(bep_x, 0.0), xytext=(bep_x + 2, -6),
+                                     arrowprops=dict(facecolor='black', arrowstyle='->'),
+                                     fontsize=10, color='green')]
+
+        y_min, y_max = self.ax.get_ylim()
+        y_offset = -0.2 * (y_max - y_min)
+        annotations = []
+        for i, bep_x in enumerate(break_even_points):
+            x_offset, alignment = (-2, 'right') if i == 0 else (2, 'left')
+            annotations.append(self.ax.annotate(
+                'BEP', xy=(bep_x, 0.0), xytext=(bep_x + x_offset, y_offset),
+                arrowprops=dict(facecolor='black', arrowstyle='->', connectionstyle='arc3,rad=0.2'),
+                fontsize=10, color='green', horizontalalignment=alignment, verticalalignment='top'
+            ))
+        return annotations
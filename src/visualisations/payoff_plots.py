@@ -1,16 +1,35 @@
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 from typing import Tuple
+from src.pricing.black_scholes import pnl_surface
+from src.strategies.price_grid import insert_points
+from src.visualisations.chart_backends import payoff_chart_spec
+
+def dispose_figure(fig: Figure):
+    # Drop every artist as soon as the figure has been rendered instead of waiting for garbage collection
+    fig.clear()
 
 class Basic_Payoff_Plotter:
+    # Fraction of the payoff range added above and below the y-limits, None keeps matplotlib's autoscaling
+    Y_PADDING = None
+
+    @classmethod
+    def create_chart_spec(cls, strategy_obj, title: str) -> dict:
+        # Browser-rendered (Vega-Lite) version of the plot, built from the payoff kinks only
+        return payoff_chart_spec(strategy_obj, title, cls.Y_PADDING)
+
     @staticmethod
-    def create_basic_payoff_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[plt.Figure, plt.Axes]:
+    def create_basic_payoff_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[Figure, Axes]:
 
-        # Get data
-        payoff_data = strategy_obj.calculate_payoff()
-        bep = strategy_obj.calculate_bep()  # This may need to handle multiple BEPs
+        # Get data (memoized on the strategy, shared with the table and the other plotters)
+        result = strategy_obj.get_result()
+        payoff_data = result.payoff_data
         
         # Create figure
-        fig, ax = plt.subplots(figsize=figsize)
+        # Object-oriented Figure, never registered with pyplot so nothing outlives the caller's reference
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
         
         # Main payoff line
         ax.plot(payoff_data['Expiration Price'], 
@@ -26,10 +45,10 @@ class Basic_Payoff_Plotter:
                   alpha=0.3)
         
         # Handle single break-even point
-        if not isinstance(bep, tuple):  # Single BEP
-            bep_index = (payoff_data['Expiration Price'] - bep).abs().idxmin()
-            bep_x = payoff_data['Expiration Price'].iloc[bep_index]
-            bep_y = payoff_data['Net Payoff'].iloc[bep_index]
+        break_even_points = Basic_Payoff_Plotter.visible_break_even_points(result)
+        if len(break_even_points) == 1:  # Single BEP
+            # Exact BEP, the payoff is zero there by definition
+            bep_x, bep_y = break_even_points[0], 0.0
             ax.plot(bep_x, bep_y, 'go', markersize=8)  # 'go' for green circle
             ax.annotate('BEP',
                         xy=(bep_x, bep_y),
@@ -58,29 +77,34 @@ class Basic_Payoff_Plotter:
         ax.set_ylabel('Profit/Loss')
         ax.grid(True, alpha=0.3)  # More subtle grid
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig, ax  # Return only figure and axes
 
+    @staticmethod
+    def visible_break_even_points(result) -> np.ndarray:
+        # Analytic BEPs that fall inside the plotted price range
+        prices = result.payoff_data['Expiration Price']
+        break_even_points = result.profile.break_even_points
+        return break_even_points[(break_even_points >= prices.min()) & (break_even_points <= prices.max())]
+
 class ComplexPayoffPlotter(Basic_Payoff_Plotter):
     @staticmethod
-    def create_complex_payoff_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[plt.Figure, plt.Axes]:
+    def create_complex_payoff_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[Figure, Axes]:
 
         fig, ax = Basic_Payoff_Plotter.create_basic_payoff_plot(strategy_obj, title, figsize)
         
         # Get data
-        payoff_data = strategy_obj.calculate_payoff()
-        bep = strategy_obj.calculate_bep()  # This may need to handle multiple BEPs
+        result = strategy_obj.get_result()
+        break_even_points = Basic_Payoff_Plotter.visible_break_even_points(result)
         
         # Handle multiple break-even points
-        if isinstance(bep, tuple):  # If there are multiple BEPs
+        if len(break_even_points) > 1:  # If there are multiple BEPs
             # Calculate y-range of the plot
             y_min, y_max = ax.get_ylim()
             y_range = y_max - y_min
             
-            for i, be in enumerate(bep):
-                bep_index = (payoff_data['Expiration Price'] - be).abs().idxmin()
-                bep_x = payoff_data['Expiration Price'].iloc[bep_index]
-                bep_y = payoff_data['Net Payoff'].iloc[bep_index]
+            for i, bep_x in enumerate(break_even_points):
+                bep_y = 0.0  # Exact BEP, not the nearest grid point
                 ax.plot(bep_x, bep_y, 'go', markersize=8)  # 'go' for green circle
                 # For first BEP (left side), offset text to the left
                 if i == 0:
@@ -108,14 +132,16 @@ class ComplexPayoffPlotter(Basic_Payoff_Plotter):
         return fig, ax
         
 class BullCallSpreadPlotter(ComplexPayoffPlotter):
+    Y_PADDING = 0.1
+
     @staticmethod
-    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[plt.Figure, plt.Axes]:
+    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[Figure, Axes]:
         fig, ax = ComplexPayoffPlotter.create_complex_payoff_plot(strategy_obj, title, figsize)
         
         # Get the actual payoff values for y-axis range
-        payoff_data = strategy_obj.calculate_payoff()
-        max_profit = payoff_data['Net Payoff'].max()
-        max_loss = payoff_data['Net Payoff'].min()
+        result = strategy_obj.get_result()
+        max_profit = result.max_profit
+        max_loss = result.max_loss
         
         # Add some padding (e.g., 10%) to the y-axis range for better visualization
         y_padding = (max_profit - max_loss) * 0.1
@@ -127,14 +153,16 @@ class BullCallSpreadPlotter(ComplexPayoffPlotter):
         return fig, ax
 
 class BearPutSpreadPlotter(ComplexPayoffPlotter):
+    Y_PADDING = 0.1
+
     @staticmethod
-    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[plt.Figure, plt.Axes]:
+    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[Figure, Axes]:
         fig, ax = ComplexPayoffPlotter.create_complex_payoff_plot(strategy_obj, title, figsize)
         
         # Get the actual payoff values for y-axis range
-        payoff_data = strategy_obj.calculate_payoff()
-        max_profit = payoff_data['Net Payoff'].max()
-        max_loss = payoff_data['Net Payoff'].min()
+        result = strategy_obj.get_result()
+        max_profit = result.max_profit
+        max_loss = result.max_loss
         
         # Add padding for better visualization
         y_padding = (max_profit - max_loss) * 0.1
@@ -146,14 +174,16 @@ class BearPutSpreadPlotter(ComplexPayoffPlotter):
         return fig, ax
         
 class LongStraddlePlotter(ComplexPayoffPlotter):
+    Y_PADDING = 0.1
+
     @staticmethod
-    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[plt.Figure, plt.Axes]:
+    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[Figure, Axes]:
         fig, ax = ComplexPayoffPlotter.create_complex_payoff_plot(strategy_obj, title, figsize)
         
         # Get the actual payoff values for y-axis range
-        payoff_data = strategy_obj.calculate_payoff()
-        max_profit = payoff_data['Net Payoff'].max()
-        max_loss = payoff_data['Net Payoff'].min()
+        result = strategy_obj.get_result()
+        max_profit = result.max_profit
+        max_loss = result.max_loss
         
         # Add some padding for better visualization
         y_padding = (max_profit - max_loss) * 0.1
@@ -165,14 +195,16 @@ class LongStraddlePlotter(ComplexPayoffPlotter):
         return fig, ax
     
 class LongStranglePlotter(ComplexPayoffPlotter):
+    Y_PADDING = 0.1
+
     @staticmethod
-    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[plt.Figure, plt.Axes]:
+    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[Figure, Axes]:
         fig, ax = ComplexPayoffPlotter.create_complex_payoff_plot(strategy_obj, title, figsize)
         
         # Get the actual payoff values for y-axis range
-        payoff_data = strategy_obj.calculate_payoff()
-        max_profit = payoff_data['Net Payoff'].max()
-        max_loss = payoff_data['Net Payoff'].min()
+        result = strategy_obj.get_result()
+        max_profit = result.max_profit
+        max_loss = result.max_loss
         
         # Add some padding for better visualization
         y_padding = (max_profit - max_loss) * 0.1
@@ -184,14 +216,16 @@ class LongStranglePlotter(ComplexPayoffPlotter):
         return fig, ax
     
 class StripPlotter(ComplexPayoffPlotter):
+    Y_PADDING = 0.1
+
     @staticmethod
-    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[plt.Figure, plt.Axes]:
+    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[Figure, Axes]:
         fig, ax = ComplexPayoffPlotter.create_complex_payoff_plot(strategy_obj, title, figsize)
         
         # Get the actual payoff values for y-axis range
-        payoff_data = strategy_obj.calculate_payoff()
-        max_profit = payoff_data['Net Payoff'].max()
-        max_loss = payoff_data['Net Payoff'].min()
+        result = strategy_obj.get_result()
+        max_profit = result.max_profit
+        max_loss = result.max_loss
         
         # Add some padding for better visualization
         y_padding = (max_profit - max_loss) * 0.1
@@ -203,14 +237,16 @@ class StripPlotter(ComplexPayoffPlotter):
         return fig, ax
 
 class StrapPlotter(ComplexPayoffPlotter):
+    Y_PADDING = 0.1
+
     @staticmethod
-    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[plt.Figure, plt.Axes]:
+    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[Figure, Axes]:
         fig, ax = ComplexPayoffPlotter.create_complex_payoff_plot(strategy_obj, title, figsize)
         
         # Get the actual payoff values for y-axis range
-        payoff_data = strategy_obj.calculate_payoff()
-        max_profit = payoff_data['Net Payoff'].max()
-        max_loss = payoff_data['Net Payoff'].min()
+        result = strategy_obj.get_result()
+        max_profit = result.max_profit
+        max_loss = result.max_loss
         
         # Add some padding for better visualization
         y_padding = (max_profit - max_loss) * 0.1
@@ -222,14 +258,16 @@ class StrapPlotter(ComplexPayoffPlotter):
         return fig, ax
 
 class LongButterflyPlotter(ComplexPayoffPlotter):
+    Y_PADDING = 0.1
+
     @staticmethod
-    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[plt.Figure, plt.Axes]:
+    def create_plot(strategy_obj, title: str, figsize=(10, 5)) -> Tuple[Figure, Axes]:
         fig, ax = ComplexPayoffPlotter.create_complex_payoff_plot(strategy_obj, title, figsize)
         
         # Get the actual payoff values for y-axis range
-        payoff_data = strategy_obj.calculate_payoff()
-        max_profit = payoff_data['Net Payoff'].max()
-        max_loss = payoff_data['Net Payoff'].min()
+        result = strategy_obj.get_result()
+        max_profit = result.max_profit
+        max_loss = result.max_loss
         
         # Add some padding for better visualization
         y_padding = (max_profit - max_loss) * 0.1
@@ -239,3 +277,41 @@ class LongButterflyPlotter(ComplexPayoffPlotter):
         # Set y-axis limits
         ax.set_ylim(y_min, y_max)
         return fig, ax
+
+class PreExpiryPayoffPlotter:
+    # Number of prices per curve, mark-to-market curves are smooth so the table grid is too coarse
+    CURVE_POINTS = 400
+
+    @staticmethod
+    def create_plot(strategy_obj, title: str, times_to_expiry, volatility: float, rate: float = 0.0,
+                    dividend_yield: float = 0.0, figsize=(10, 5)) -> Tuple[Figure, Axes]:
+        payoff_data = strategy_obj.get_result().payoff_data
+        start_price, end_price = payoff_data['Expiration Price'].min(), payoff_data['Expiration Price'].max()
+        # Strikes are added so the expiration payoff keeps its exact kinks
+        strikes = strategy_obj.position.legs.strike_prices
+        prices = insert_points(np.linspace(start_price, end_price, PreExpiryPayoffPlotter.CURVE_POINTS),
+                               strikes[(strikes > start_price) & (strikes < end_price)])
+
+        # Every curve of the family in one (time x price) array pass
+        pnl = pnl_surface(strategy_obj.position.legs, prices, times_to_expiry, [volatility], rate, dividend_yield)[0]
+
+        # Object-oriented Figure, never registered with pyplot so nothing outlives the caller's reference
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
+        for time_to_expiry, curve in zip(times_to_expiry, pnl):
+            ax.plot(prices, curve, linewidth=1.5, alpha=0.8,
+                    label=f"{time_to_expiry * 365:.0f} days to expiry")
+
+        # Expiration payoff for reference
+        ax.plot(prices, strategy_obj.position.payoff(prices), label='At expiration', color='blue', linewidth=2)
+        ax.axhline(y=0, color='red', linestyle='--', alpha=0.3)
+
+        # Styling
+        ax.set_title(title, pad=20)
+        ax.set_xlabel('Stock Price')
+        ax.set_ylabel('Profit/Loss')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+
+        fig.tight_layout()
+        return fig, ax
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from src.strategies import BullCallSpread, LongButterfly, evaluate_batch, solve_payoff_profile
+from src.strategies.batch import broadcast_columns
+
+PRICES = np.arange(60.0, 161.0, 2.5)
+
+def per_scenario(strategy_class, inputs, index):
+    scenario = {name: float(np.broadcast_to(values, (len(inputs['premium_low']),))[index])
+                for name, values in inputs.items()}
+    return strategy_class(**scenario, start_price=PRICES[0], end_price=PRICES[-1], step_size=2.5)
+
+def test_batch_matches_per_scenario_evaluation():
+    rng = np.random.default_rng(0)
+    n = 200
+    middle = rng.uniform(90, 110, n)
+    width = rng.uniform(2, 20, n)
+    inputs = {
+        'strike_price_low': middle - width,
+        'strike_price_middle': middle,
+        'strike_price_high': middle + width,
+        'premium_low': rng.uniform(8, 12, n),
+        'premium_middle': rng.uniform(3, 6, n),
+        'premium_high': 1.0   # Scalar column, repeated for every scenario
+    }
+    result = evaluate_batch(LongButterfly, inputs, PRICES)
+    assert result.payoffs.shape == (n, len(PRICES))
+    for index in range(0, n, 17):
+        strategy = per_scenario(LongButterfly, inputs, index)
+        profile = solve_payoff_profile(strategy.position.legs)
+        np.testing.assert_allclose(result.payoffs[index], strategy.position.payoff(PRICES), atol=1e-12)
+        assert result.max_profit[index] == pytest.approx(profile.max_profit)
+        assert result.max_loss[index] == pytest.approx(profile.max_loss)
+        beps = result.break_even_points[index]
+        np.testing.assert_allclose(beps[~np.isnan(beps)], profile.break_even_points)
+
+def test_all_scalar_columns_make_one_scenario():
+    result = evaluate_batch(BullCallSpread, dict(strike_price_low=90, strike_price_high=110, premium_low=5,
+                                                 premium_high=15), PRICES)
+    assert result.payoffs.shape == (1, len(PRICES))
+
+def test_broadcast_columns_rejects_mismatched_lengths():
+    assert len(broadcast_columns({'a': [1, 2, 3], 'b': 4.0})['b']) == 3
+    with pytest.raises(ValueError):
+        broadcast_columns({'a': [1, 2, 3], 'b': [1, 2]})
+    with pytest.raises(ValueError):
+        broadcast_columns({'a': [[1, 2]]})
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from src.strategies.breakeven import solve_payoff_profile
+from src.strategies.legs import LONG, SHORT, Leg, LegTable, Position
+from src.strategies.payoff_engine import CALL, PUT
+
+def random_table(rng):
+    legs = [Leg(rng.choice([CALL, PUT]), rng.choice([LONG, SHORT]), float(rng.integers(50, 150)),
+                float(rng.integers(1, 4)), float(rng.uniform(0, 10))) for _ in range(int(rng.integers(1, 6)))]
+    return LegTable.from_legs(legs)
+
+@pytest.mark.parametrize('seed', range(20))
+def test_profile_matches_a_dense_grid(seed):
+    table = random_table(np.random.default_rng(seed))
+    profile = solve_payoff_profile(table)
+    # Every kink sits below 150, so the grid covers all of them plus a stretch of both tails
+    prices = np.linspace(0, 400, 400_001)
+    payoff = Position(table).payoff(prices)
+
+    if np.isfinite(profile.max_profit):
+        assert profile.max_profit == pytest.approx(payoff.max(), abs=1e-9)
+    else:
+        assert payoff[-1] > payoff[-2]
+    if np.isfinite(profile.max_loss):
+        assert profile.max_loss == pytest.approx(payoff.min(), abs=1e-9)
+    else:
+        assert payoff[-1] < payoff[-2]
+
+    # Every break-even is a zero of the payoff, and every sign change on the grid has one nearby
+    np.testing.assert_allclose(Position(table).payoff(profile.break_even_points), 0.0, atol=1e-9)
+    signs = np.sign(payoff)
+    changes = prices[1:][(signs[1:] != signs[:-1]) & (signs[1:] != 0) & (signs[:-1] != 0)]
+    for price in changes:
+        assert np.min(np.abs(profile.break_even_points - price), initial=np.inf) <= 1e-3
+
+def test_bull_call_spread_profile():
+    table = LegTable.from_legs([Leg(CALL, LONG, 90, 1, 15), Leg(CALL, SHORT, 110, 1, 5)])
+    profile = solve_payoff_profile(table)
+    np.testing.assert_allclose(profile.break_even_points, [100.0])
+    assert (profile.max_profit, profile.max_loss) == (10.0, -10.0)
+
+def test_unbounded_extremes():
+    assert solve_payoff_profile(LegTable.from_legs([Leg(CALL, LONG, 100, 1, 5)])).max_profit == np.inf
+    assert solve_payoff_profile(LegTable.from_legs([Leg(CALL, SHORT, 100, 1, 5)])).max_loss == -np.inf
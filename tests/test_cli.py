@@ -0,0 +1,56 @@
+import csv
+import json
+import numpy as np
+import pytest
+from cli import evaluate_scenario, main
+from src.utils.strategy_registry import STRATEGY_REGISTRY
+
+def long_call_row(**overrides):
+    row = {field.name: field.default for field in STRATEGY_REGISTRY.get('LongCall').fields}
+    return {'strategy': 'LongCall', **row, **overrides}
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as spec_file:
+        writer = csv.DictWriter(spec_file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def test_non_finite_rows_do_not_abort_the_batch(tmp_path, capsys):
+    spec = tmp_path / 'spec.csv'
+    write_csv(spec, [long_call_row(premium='nan'), long_call_row(end_price='inf'), long_call_row()])
+    assert main([str(spec)]) == 1
+    results = json.loads(capsys.readouterr().out)
+    assert [result['valid'] for result in results] == [False, False, True]
+    assert 'finite' in results[0]['message'] and 'finite' in results[1]['message']
+    valid = results[2]
+    payoff = np.maximum(np.asarray(valid['expiration_prices']) - 100.0, 0.0) - 5.0
+    np.testing.assert_allclose(valid['net_payoff'], payoff)
+    assert valid['break_even_points'] == [105.0]
+    assert valid['max_loss'] == -5.0 and valid['max_profit'] is None
+
+@pytest.mark.parametrize('overrides', [
+    {'strike_price': None},
+    {'premium': 'abc'},
+    {'step_size': 0},
+    {'grid_mode': 'bogus'},
+    {'strategy': 'NoSuchStrategy'},
+    {'start_price': 200, 'end_price': 100},
+    # The grid itself cannot be built, the ValueError is reported for this row only
+    {'step_size': 1e-300}
+])
+def test_malformed_rows_are_reported_as_invalid(overrides):
+    result = evaluate_scenario(long_call_row(**overrides))
+    assert result['valid'] is False and result['message']
+
+def test_payoff_rows_are_written_to_csv(tmp_path):
+    spec = tmp_path / 'spec.json'
+    spec.write_text(json.dumps([long_call_row(), long_call_row(strike_price=110)]))
+    output = tmp_path / 'payoffs.csv'
+    assert main([str(spec), '-o', str(output), '--grid-mode', 'kinks']) == 0
+    with open(output, newline='') as output_file:
+        rows = list(csv.DictReader(output_file))
+    assert {row['scenario'] for row in rows} == {'0', '1'}
+    for row in rows:
+        strike = 100.0 if row['scenario'] == '0' else 110.0
+        price = float(row['expiration_price'])
+        assert float(row['net_payoff']) == pytest.approx(max(price - strike, 0.0) - 5.0)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from src.pricing import black_scholes_price, option_greeks, position_greeks, greeks_surface, position_pnl
+from src.strategies import LongButterfly
+
+RATE = 0.03
+DIVIDEND_YIELD = 0.01
+
+@pytest.mark.parametrize('is_call', [True, False])
+def test_greeks_match_finite_differences(is_call):
+    spot, strike, time, vol = 105.0, 100.0, 0.75, 0.3
+    greeks = option_greeks(is_call, spot, strike, time, vol, RATE, DIVIDEND_YIELD)
+    price = lambda **bump: black_scholes_price(is_call, bump.get('spot', spot), strike, bump.get('time', time),
+                                               bump.get('vol', vol), bump.get('rate', RATE), DIVIDEND_YIELD)
+    h = 1e-4
+    assert greeks.delta == pytest.approx((price(spot=spot + h) - price(spot=spot - h)) / (2 * h), abs=1e-6)
+    assert greeks.gamma == pytest.approx((price(spot=spot + h) - 2 * price() + price(spot=spot - h)) / h ** 2,
+                                         abs=1e-4)
+    assert greeks.vega == pytest.approx((price(vol=vol + h) - price(vol=vol - h)) / (2 * h), abs=1e-5)
+    assert greeks.rho == pytest.approx((price(rate=RATE + h) - price(rate=RATE - h)) / (2 * h), abs=1e-5)
+    # Theta is per year of calendar time, i.e. minus the derivative in time to expiry
+    assert greeks.theta == pytest.approx(-(price(time=time + h) - price(time=time - h)) / (2 * h), abs=1e-5)
+
+def test_position_greeks_match_finite_differences_of_the_pnl():
+    legs = LongButterfly(90, 100, 110, 12, 6, 3, 60, 140, 1).position.legs
+    leg_vols = np.array([0.3, 0.25, 0.28])
+    spots = np.linspace(70.0, 130.0, 13)
+    h = 1e-4
+    pnl = lambda spot=spots, time=0.5: position_pnl(legs, spot, time, None, RATE, DIVIDEND_YIELD,
+                                                    leg_volatilities=leg_vols)
+    greeks = position_greeks(legs, spots, 0.5, None, RATE, DIVIDEND_YIELD, leg_volatilities=leg_vols)
+    np.testing.assert_allclose(greeks.delta, (pnl(spot=spots + h) - pnl(spot=spots - h)) / (2 * h), atol=1e-6)
+    np.testing.assert_allclose(greeks.theta, -(pnl(time=0.5 + h) - pnl(time=0.5 - h)) / (2 * h), atol=1e-5)
+
+    # The surface is the same Greeks evaluated row by row
+    times = np.array([0.1, 0.5, 1.0])
+    surface = greeks_surface(legs, spots, times, None, RATE, DIVIDEND_YIELD, leg_volatilities=leg_vols)
+    assert surface.gamma.shape == (3, len(spots))
+    np.testing.assert_allclose(surface.gamma[1], greeks.gamma)
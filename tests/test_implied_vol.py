@@ -0,0 +1,33 @@
+import numpy as np
+from src.pricing import black_scholes_price, implied_volatility, leg_implied_volatilities
+from src.strategies import LongStrangle
+from src.strategies.payoff_engine import CALL
+
+RATE = 0.03
+DIVIDEND_YIELD = 0.01
+
+def test_implied_volatility_recovers_the_pricing_vol():
+    rng = np.random.default_rng(0)
+    strikes = rng.uniform(50, 200, 20_000)
+    times = rng.uniform(0.05, 2.0, 20_000)
+    vols = rng.uniform(0.05, 1.5, 20_000)
+    is_call = rng.random(20_000) < 0.5
+    prices = black_scholes_price(is_call, 100.0, strikes, times, vols, RATE, DIVIDEND_YIELD)
+
+    solved = implied_volatility(is_call, prices, 100.0, strikes, times, RATE, DIVIDEND_YIELD)
+    # Quotes with almost no time value carry no vol information and may come back as NaN
+    identifiable = prices - black_scholes_price(is_call, 100.0, strikes, times, 0.0, RATE, DIVIDEND_YIELD) > 1e-4
+    assert np.isfinite(solved[identifiable]).all()
+    np.testing.assert_allclose(solved[identifiable], vols[identifiable], atol=1e-6)
+
+def test_implied_volatility_is_nan_outside_arbitrage_bounds():
+    # Below intrinsic, above the spot, at expiry
+    solved = implied_volatility([True, True, True], [40.0, 101.0, 5.0], 100.0, [50.0, 50.0, 100.0], [1.0, 1.0, 0.0])
+    assert np.isnan(solved).all()
+
+def test_leg_implied_volatilities_reprice_each_premium():
+    legs = LongStrangle(90, 110, 4, 5, 60, 140, 1).position.legs
+    vols = leg_implied_volatilities(legs, 100.0, 0.5, RATE, DIVIDEND_YIELD)
+    is_call = legs.option_types == CALL
+    repriced = black_scholes_price(is_call, 100.0, legs.strike_prices, 0.5, vols, RATE, DIVIDEND_YIELD)
+    np.testing.assert_allclose(repriced, legs.premiums, atol=1e-8)
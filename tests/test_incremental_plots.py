@@ -0,0 +1,16 @@
+import numpy as np
+from src.strategies import BullCallSpread
+from src.visualisations import IncrementalPayoffPlotter
+
+def test_plot_is_redrawn_only_when_the_result_key_changes():
+    plotter = IncrementalPayoffPlotter('Bull Call Spread')
+    strategy = BullCallSpread(90, 110, 5, 15, 80, 120, 5)
+    first = plotter.png(strategy)
+    # A new strategy with the same legs and grid has the same key, nothing is redrawn
+    assert BullCallSpread(90, 110, 5, 15, 80, 120, 5).result_key() == strategy.result_key()
+    assert plotter.png(BullCallSpread(90, 110, 5, 15, 80, 120, 5)) is first
+
+    moved = BullCallSpread(90, 110, 7, 15, 80, 120, 5)
+    assert moved.result_key() != strategy.result_key()
+    assert plotter.png(moved) is not first
+    np.testing.assert_allclose(plotter.payoff_line.get_ydata(), moved.get_result().payoff_data['Net Payoff'])
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from src.strategies.legs import LONG, SHORT, Leg, LegTable, Position
+from src.strategies.payoff_engine import CALL, PUT
+
+def random_legs(rng, n_legs):
+    return [Leg(rng.choice([CALL, PUT]), rng.choice([LONG, SHORT]), float(rng.uniform(50, 150)),
+                float(rng.integers(1, 4)), float(rng.uniform(0, 10))) for _ in range(n_legs)]
+
+def brute_force_payoff(legs, price):
+    total = 0.0
+    for leg in legs:
+        value = max(price - leg.strike_price, 0.0) if leg.option_type == CALL else max(leg.strike_price - price, 0.0)
+        sign = 1.0 if leg.side == LONG else -1.0
+        total += sign * leg.quantity * (value - leg.premium)
+    return total
+
+@pytest.mark.parametrize('seed', range(5))
+def test_position_payoff_matches_brute_force_on_a_dense_grid(seed):
+    rng = np.random.default_rng(seed)
+    legs = random_legs(rng, int(rng.integers(1, 7)))
+    prices = np.linspace(0, 200, 2001)
+    np.testing.assert_allclose(Position(legs).payoff(prices),
+                               [brute_force_payoff(legs, price) for price in prices], atol=1e-9)
+
+def test_leg_table_signs_and_net_premium():
+    table = LegTable.from_legs([Leg(CALL, LONG, 90, 1, 15), Leg(CALL, SHORT, 110, 2, 5)])
+    np.testing.assert_array_equal(table.signed_quantities, [1.0, -2.0])
+    assert table.net_premium == pytest.approx(5.0)
+
+def test_from_spec_and_concatenate_keep_leg_order():
+    table = LegTable.concatenate([LegTable.from_legs([Leg(PUT, LONG, 95, 1, 3)]),
+                                  LegTable.from_legs([Leg(CALL, SHORT, 105, 1, 2)])])
+    assert list(table.option_types) == [PUT, CALL]
+    np.testing.assert_array_equal(table.strike_prices, [95.0, 105.0])
+
+def test_leg_table_rejects_bad_legs():
+    with pytest.raises(ValueError):
+        LegTable(['straddle'], [LONG], [100], [1], [1])
+    with pytest.raises(ValueError):
+        LegTable([CALL], ['flat'], [100], [1], [1])
+    with pytest.raises(ValueError):
+        LegTable([CALL, PUT], [LONG], [100], [1], [1])
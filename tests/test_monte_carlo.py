@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from src.pricing import position_pnl, simulate_pnl
+from src.strategies import LongStrangle
+
+def test_monte_carlo_is_reproducible_across_process_counts():
+    legs = LongStrangle(90, 110, 4, 5, 60, 140, 1).position.legs
+    options = dict(volatility=0.25, n_paths=200_000, chunk_size=50_000, seed=42)
+    serial = simulate_pnl(legs, 100.0, 0.5, processes=1, **options)
+    parallel = simulate_pnl(legs, 100.0, 0.5, processes=2, **options)
+    assert serial.expected_pnl == parallel.expected_pnl
+    assert serial.value_at_risk == parallel.value_at_risk
+    np.testing.assert_array_equal(serial.histogram_counts, parallel.histogram_counts)
+
+def test_expected_pnl_matches_black_scholes():
+    # With zero rates the mean simulated P/L is the undiscounted Black-Scholes value less the premium
+    legs = LongStrangle(90, 110, 4, 5, 60, 140, 1).position.legs
+    result = simulate_pnl(legs, 100.0, 0.5, volatility=0.25, n_paths=400_000, chunk_size=100_000, seed=7)
+    assert result.n_paths == 400_000
+    standard_error = result.pnl_std / np.sqrt(result.n_paths)
+    assert result.expected_pnl == pytest.approx(float(position_pnl(legs, 100.0, 0.5, 0.25)), abs=4 * standard_error)
+    # The histogram covers every path and the tail risk is ordered
+    assert result.histogram_counts.sum() == result.n_paths
+    assert result.conditional_value_at_risk >= result.value_at_risk
+
+@pytest.mark.parametrize('option', [{'n_paths': 0}, {'chunk_size': 0}, {'bins': -1}])
+def test_non_positive_sizes_are_rejected(option):
+    legs = LongStrangle(90, 110, 4, 5, 60, 140, 1).position.legs
+    with pytest.raises(ValueError, match=next(iter(option))):
+        simulate_pnl(legs, 100.0, 0.5, volatility=0.25, **option)
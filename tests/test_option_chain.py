@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data import ASK, BID, MID, NATURAL, OptionChain, fill_premiums_from_chain, load_option_chain
+from src.strategies import BullCallSpread
+from src.utils.strategy_inputs import BullCallSpreadInputs
+
+def chain_frame(n_strikes=250):
+    strikes = np.arange(50.0, 50.0 + n_strikes)
+    frames = []
+    for expiry in ('2026-12-18', '2027-01-15'):
+        for option_type in ('C', 'P'):
+            bid = np.round(np.abs(strikes - 100.0) / 10 + (1.0 if option_type == 'C' else 2.0), 2)
+            frames.append(pd.DataFrame({'underlying': 'XYZ', 'expiry': expiry, 'strike': strikes,
+                                        'type': option_type, 'bid': bid, 'ask': bid + 0.1}))
+    # Shuffled, so rows of one expiry are spread over several chunks
+    return pd.concat(frames).sample(frac=1.0, random_state=0).reset_index(drop=True)
+
+def assert_same_chain(loaded, expected):
+    assert len(loaded) == len(expected)
+    for name in ('underlying', 'expiry', 'strike', 'option_type', 'bid', 'ask', 'mid'):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(expected, name))
+    assert loaded._index == expected._index
+
+def direct_chain(frame):
+    return OptionChain(frame['underlying'], frame['expiry'], frame['strike'], frame['type'], frame['bid'],
+                       frame['ask'])
+
+def test_streamed_csv_matches_a_chain_built_in_one_go(tmp_path):
+    chain_frame().to_csv(tmp_path / 'chain.csv', index=False)
+    # 1000 rows in chunks of 64, the buffers grow several times
+    assert_same_chain(load_option_chain(tmp_path / 'chain.csv', chunk_size=64),
+                      direct_chain(pd.read_csv(tmp_path / 'chain.csv')))
+
+def test_parquet_matches_csv(tmp_path):
+    pytest.importorskip('pyarrow')
+    frame = chain_frame().rename(columns={'strike': 'strike_price'})
+    frame.to_parquet(tmp_path / 'chain.parquet', row_group_size=100)
+    loaded = load_option_chain(tmp_path / 'chain.parquet', chunk_size=64, columns={'strike': 'strike_price'})
+    assert_same_chain(loaded, direct_chain(frame.rename(columns={'strike_price': 'strike'})))
+
+def test_missing_columns_are_reported(tmp_path):
+    chain_frame(10).drop(columns='ask').to_csv(tmp_path / 'chain.csv', index=False)
+    with pytest.raises(ValueError, match='ask'):
+        load_option_chain(tmp_path / 'chain.csv')
+
+def test_lookups_and_expiry_rows():
+    chain = direct_chain(chain_frame(20))
+    assert ('XYZ', '2026-12-18', 60.0, 'call') in chain
+    assert chain.quote('XYZ', '2026-12-18', 60.0, 'call', ASK) == pytest.approx(5.1)
+    assert chain.quote('XYZ', '2026-12-18', 60.0, 'put', MID) == pytest.approx(6.05)
+    rows = chain.expiry_rows('XYZ', '2027-01-15')
+    assert len(rows) == 40 and np.all(np.diff(chain.strike[rows]) >= 0)
+    with pytest.raises(KeyError):
+        chain.row('XYZ', '2026-12-18', 500.0, 'call')
+
+def test_natural_premiums_pay_the_ask_and_receive_the_bid():
+    chain = direct_chain(chain_frame(100))
+    inputs = BullCallSpreadInputs(strike_price_low=90.0, strike_price_high=110.0, premium_low=0.0,
+                                  premium_high=0.0, start_price=80.0, end_price=120.0, step_size=1.0)
+    filled = fill_premiums_from_chain(inputs, BullCallSpread, chain, 'XYZ', '2026-12-18', NATURAL)
+    # Long lower-strike call at its ask, short higher-strike call at its bid
+    assert filled.premium_high == chain.quote('XYZ', '2026-12-18', 90.0, 'call', ASK)
+    assert filled.premium_low == chain.quote('XYZ', '2026-12-18', 110.0, 'call', BID)
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from src.strategies.legs import LONG
+from src.strategies.payoff_engine import CALL, PUT, intrinsic_values
+from src.utils.strategy_registry import STRATEGY_REGISTRY
+
+STRATEGY_NAMES = STRATEGY_REGISTRY.names
+
+def default_strategy(name, **overrides):
+    definition = STRATEGY_REGISTRY.get(name)
+    inputs = {field.name: field.default for field in definition.fields}
+    inputs.update(overrides)
+    return definition.strategy_class(**inputs), inputs
+
+def brute_force_payoff(leg_spec, inputs, price):
+    # One price and one leg at a time, straight from the payoff definitions
+    total = 0.0
+    for leg in leg_spec:
+        strike, premium = inputs[leg.strike_field], inputs[leg.premium_field]
+        value = max(price - strike, 0.0) if leg.option_type == CALL else max(strike - price, 0.0)
+        sign = 1.0 if leg.side == LONG else -1.0
+        total += sign * leg.quantity * (value - premium)
+    return total
+
+def test_intrinsic_values_match_the_scalar_formulas():
+    prices = np.linspace(0, 200, 101)
+    values = intrinsic_values(prices, [CALL, PUT], [90.0, 110.0])
+    assert values.shape == (2, len(prices))
+    np.testing.assert_array_equal(values[0], [max(price - 90.0, 0.0) for price in prices])
+    np.testing.assert_array_equal(values[1], [max(110.0 - price, 0.0) for price in prices])
+
+@pytest.mark.parametrize('name', STRATEGY_NAMES)
+def test_net_payoff_matches_brute_force_evaluation(name):
+    strategy, inputs = default_strategy(name, step_size=0.25)
+    payoff_data = strategy.calculate_payoff()
+    expected = [brute_force_payoff(strategy.LEG_SPEC, inputs, price) for price in payoff_data['Expiration Price']]
+    np.testing.assert_allclose(payoff_data['Net Payoff'].to_numpy(), expected, atol=1e-12)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from src.strategies.breakeven import solve_payoff_profile
+from src.strategies.price_grid import KINKS, REFINED_KINKS, UNIFORM, uniform_grid
+from src.utils.strategy_registry import STRATEGY_REGISTRY
+
+def default_strategy(name, grid_mode):
+    definition = STRATEGY_REGISTRY.get(name)
+    return definition.strategy_class(**{field.name: field.default for field in definition.fields},
+                                     grid_mode=grid_mode)
+
+@pytest.mark.parametrize('start, end, step', [(80, 120, 5), (0, 1, 0.1), (60, 140, 3), (10, 10, 1)])
+def test_uniform_grid_stays_inside_the_range(start, end, step):
+    prices = uniform_grid(start, end, step)
+    assert prices[0] == start and prices[-1] <= end + 1e-9
+    assert end - prices[-1] < step
+    np.testing.assert_allclose(np.diff(prices), step)
+
+def test_uniform_grid_rejects_a_non_positive_step():
+    with pytest.raises(ValueError):
+        uniform_grid(80, 120, 0)
+
+@pytest.mark.parametrize('name', STRATEGY_REGISTRY.names)
+def test_kink_grid_is_exact_for_the_expiry_payoff(name):
+    # Between kinks the payoff is linear, so interpolating the kink grid reproduces a dense evaluation
+    strategy = default_strategy(name, KINKS)
+    dense = np.linspace(strategy.start_price, strategy.end_price, 10_001)
+    interpolated = np.interp(dense, strategy.expiration_prices, strategy.position.payoff(strategy.expiration_prices))
+    np.testing.assert_allclose(interpolated, strategy.position.payoff(dense), atol=1e-9)
+
+    profile = solve_payoff_profile(strategy.position.legs)
+    inside = profile.break_even_points[(profile.break_even_points > strategy.start_price)
+                                       & (profile.break_even_points < strategy.end_price)]
+    assert np.isin(inside, strategy.expiration_prices).all()
+
+@pytest.mark.parametrize('name', ['Long Butterfly', 'Bull Call Spread'])
+def test_refined_kinks_add_points_around_the_kink_grid(name):
+    kinks = default_strategy(name, KINKS).expiration_prices
+    refined = default_strategy(name, REFINED_KINKS).expiration_prices
+    assert np.isin(kinks, refined).all() and len(refined) > len(kinks)
+    assert refined[0] == kinks[0] and refined[-1] == kinks[-1]
+
+def test_butterfly_uses_the_requested_grid():
+    strategy = default_strategy('Long Butterfly', UNIFORM)
+    np.testing.assert_array_equal(strategy.get_result().payoff_data['Expiration Price'],
+                                  uniform_grid(strategy.start_price, strategy.end_price, strategy.step_size))
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from src.data import ResultStore, save_batch_result
+from src.strategies import BullCallSpread, evaluate_batch
+
+PRICES = np.arange(60.0, 141.0, 5.0)
+
+def bull_call_inputs():
+    return {'strike_price_low': np.array([85.0, 90.0, 95.0]), 'strike_price_high': np.array([105.0, 110.0, 115.0]),
+            'premium_high': np.array([9.0, 6.5, 4.0]), 'premium_low': 2.0}
+
+def test_round_trip_keeps_every_array(tmp_path):
+    inputs = bull_call_inputs()
+    result = evaluate_batch(BullCallSpread, inputs, PRICES)
+    store = ResultStore(save_batch_result(tmp_path / 'run', result, inputs, strategy='BullCallSpread'))
+
+    assert len(store) == 3 and store.strategy == 'BullCallSpread'
+    loaded = store.to_batch_result()
+    for name in ('expiration_prices', 'payoffs', 'break_even_points', 'max_profit', 'max_loss'):
+        assert isinstance(getattr(loaded, name), np.memmap)
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(result, name))
+    # The scalar column is stored once per scenario
+    np.testing.assert_array_equal(store.inputs('premium_low'), [2.0, 2.0, 2.0])
+
+    scenario = store.scenario(1)
+    assert scenario['inputs'] == {'strike_price_low': 90.0, 'strike_price_high': 110.0, 'premium_high': 6.5,
+                                  'premium_low': 2.0}
+    np.testing.assert_array_equal(scenario['payoffs'], result.payoffs[1])
+    np.testing.assert_allclose(scenario['break_even_points'], [94.5])
+
+def test_inputs_must_match_the_scenario_count(tmp_path):
+    result = evaluate_batch(BullCallSpread, bull_call_inputs(), PRICES)
+    with pytest.raises(ValueError):
+        save_batch_result(tmp_path / 'run', result, {'strike_price_low': [85.0, 90.0]})
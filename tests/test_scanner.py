@@ -0,0 +1,83 @@
+import itertools
+import numpy as np
+import pytest
+from src.data import (
+    BREAK_EVEN_DISTANCE,
+    MID,
+    PROBABILITY_OF_PROFIT,
+    REWARD_RISK,
+    OptionChain,
+    scan_strategy
+)
+from src.pricing import black_scholes_price
+from src.strategies import solve_payoff_profile
+from src.utils.strategy_registry import STRATEGY_REGISTRY
+
+SPOT, VOLATILITY, TIME_TO_EXPIRY = 100.0, 0.25, 0.5
+
+def bs_chain():
+    # One expiry priced with Black-Scholes, a 0.1 wide market; the far wings are bid at zero
+    strikes = np.arange(60.0, 160.1, 2.5)
+    is_call = np.repeat([True, False], len(strikes))
+    strikes = np.tile(strikes, 2)
+    prices = black_scholes_price(is_call, SPOT, strikes, TIME_TO_EXPIRY, VOLATILITY)
+    bid = np.where(prices < 0.05, 0.0, np.round(prices - 0.05, 2))
+    names = np.full(len(strikes), 'XYZ')
+    return OptionChain(names, np.full(len(strikes), 'E1'), strikes, np.where(is_call, 'C', 'P'), bid, np.round(prices + 0.05, 2))
+
+def scan(strategy, **options):
+    return scan_strategy(bs_chain(), 'XYZ', 'E1', strategy, spot=SPOT, volatility=VOLATILITY,
+                         time_to_expiry=TIME_TO_EXPIRY, **options)
+
+@pytest.mark.parametrize('rank_by', [REWARD_RISK, BREAK_EVEN_DISTANCE, PROBABILITY_OF_PROFIT])
+@pytest.mark.parametrize('strategy', ['Bull Call Spread', 'Bear Put Spread', 'Long Strangle', 'Long Butterfly'])
+def test_top_k_is_the_prefix_of_the_full_ranking(strategy, rank_by):
+    full = scan(strategy, rank_by=rank_by, top_k=10 ** 6)
+    top = scan(strategy, rank_by=rank_by, top_k=10)
+    assert len(full) == full.valid and len(top) == min(10, full.valid)
+    metric = getattr(full, rank_by)
+    ranked = metric[~np.isnan(metric)]
+    # Unbounded strangles score +inf on reward/risk, so the order is checked against a sort, not np.diff
+    expected = np.sort(ranked) if rank_by == BREAK_EVEN_DISTANCE else np.sort(ranked)[::-1]
+    np.testing.assert_array_equal(ranked, expected)
+    # Ties may come in another order, the scores may not
+    np.testing.assert_array_equal(getattr(top, rank_by), metric[:len(top)])
+
+def test_butterfly_candidates_match_a_brute_force_search():
+    chain = bs_chain()
+    calls = chain.expiry_rows('XYZ', 'E1')[chain.option_type[chain.expiry_rows('XYZ', 'E1')] == 'call']
+    strikes = chain.strike[calls]
+    triples = [(low, middle, high) for low, middle, high in itertools.combinations(strikes, 3)
+               if abs((middle - low) - (high - middle)) <= 0.01]
+    assert scan('Long Butterfly').candidates == len(triples)
+
+def test_candidates_are_pruned_and_priced_like_the_strategy():
+    chain = bs_chain()
+    result = scan('Bull Call Spread', top_k=10 ** 6, min_risk=0.5)
+    assert result.valid < result.candidates
+    for field in ('strike_price_low', 'strike_price_high'):
+        assert np.all(chain.bid[result.rows[field]] > 0)
+    # Reward/risk is only computed where at least min_risk is at stake
+    np.testing.assert_array_equal(np.isnan(result.reward_risk), -result.max_loss < 0.5)
+
+    definition = STRATEGY_REGISTRY.get('Bull Call Spread')
+    prices = np.linspace(1e-6, 400.0, 400_001)
+    log_prices = np.log(prices / SPOT)
+    centre, width = -0.5 * VOLATILITY ** 2 * TIME_TO_EXPIRY, VOLATILITY * np.sqrt(TIME_TO_EXPIRY)
+    density = np.exp(-0.5 * ((log_prices - centre) / width) ** 2) / (prices * width * np.sqrt(2 * np.pi))
+    for index in range(0, len(result), max(len(result) // 10, 1)):
+        strategy = definition.strategy_class(**vars(result.to_inputs(index, 60.0, 140.0, 1.0)))
+        profile = solve_payoff_profile(strategy.position.legs)
+        assert result.max_profit[index] == pytest.approx(profile.max_profit)
+        assert result.max_loss[index] == pytest.approx(profile.max_loss)
+        # Probability of profit against the lognormal density integrated on a dense grid
+        profitable = strategy.position.payoff(prices) > 0
+        assert result.probability_of_profit[index] == pytest.approx(np.trapezoid(density * profitable, prices),
+                                                                    abs=1e-3)
+
+def test_mid_side_is_the_default_and_unknown_strategies_are_rejected():
+    assert scan('Long Strangle').valid == scan('Long Strangle', side=MID).valid
+    with pytest.raises(ValueError):
+        scan('Long Call')
+    with pytest.raises(ValueError):
+        scan_strategy(bs_chain(), 'XYZ', 'E1', 'Long Strangle', rank_by=BREAK_EVEN_DISTANCE)
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from src.strategies import LongStrangle, evaluate_batch, run_sweep, sweep_grid
+
+PRICES = np.arange(50.0, 151.0, 1.0)
+
+def assert_same_result(sweep, batch):
+    np.testing.assert_array_equal(sweep.payoffs, batch.payoffs)
+    np.testing.assert_array_equal(sweep.max_profit, batch.max_profit)
+    np.testing.assert_array_equal(sweep.max_loss, batch.max_loss)
+    # Both are NaN padded, possibly to different widths
+    for swept, batched in zip(sweep.break_even_points, batch.break_even_points):
+        np.testing.assert_array_equal(swept[~np.isnan(swept)], batched[~np.isnan(batched)])
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_sweep_matches_evaluate_batch(processes):
+    inputs = sweep_grid(strike_price_low=np.arange(80.0, 100.0, 2.5), strike_price_high=np.arange(100.0, 120.0, 2.5),
+                        premium_call=np.linspace(1.0, 8.0, 7))
+    inputs['premium_put'] = 3.0  # Scalar column, held fixed across the sweep
+    progress = []
+    sweep = run_sweep(LongStrangle, inputs, PRICES, processes=processes, chunk_size=50,
+                      progress=lambda done, total: progress.append((done, total)))
+    assert_same_result(sweep, evaluate_batch(LongStrangle, inputs, PRICES))
+    total = len(inputs['premium_call'])
+    assert progress[-1] == (total, total) and len(progress) == -(-total // 50)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from src.utils import ValidationRule, validate_batch
+from src.utils.strategy_registry import STRATEGY_REGISTRY
+
+def random_columns(definition, n_rows, seed):
+    # Defaults scaled by up to +-50% and rounded, so both sides of every rule and its boundary show up
+    rng = np.random.default_rng(seed)
+    columns = {field.name: np.round(field.default * rng.uniform(0.5, 1.5, n_rows)) for field in definition.fields}
+    if 'strike_price_middle' in columns:
+        # Half the butterflies get equally spaced strikes, which random values almost never hit
+        equal = rng.random(n_rows) < 0.5
+        low, middle = columns['strike_price_low'][equal], columns['strike_price_middle'][equal]
+        columns['strike_price_high'][equal] = 2 * middle - low
+    return columns
+
+@pytest.mark.parametrize('name', STRATEGY_REGISTRY.names)
+def test_batch_validation_matches_the_scalar_validator(name):
+    definition = STRATEGY_REGISTRY.get(name)
+    columns = random_columns(definition, 500, seed=len(name))
+    batch = validate_batch(definition.rules, columns)
+    table = batch.table()
+    for row in range(500):
+        scalar = definition.validator(definition.inputs_class(**{key: float(values[row])
+                                                                 for key, values in columns.items()}))
+        assert batch.is_valid[row] == scalar.is_valid
+        messages = table['message'][table['row'] == row]
+        severities = table['severity'][table['row'] == row]
+        if not scalar.is_valid:
+            # The scalar validator reports the first failing error rule
+            assert messages[list(severities).index('error')] == scalar.message
+        elif scalar.severity == 'warning':
+            assert messages[0] == scalar.message
+        else:
+            assert len(messages) == 0
+
+def test_table_lists_every_violation_by_row_then_rule():
+    rules = (ValidationRule('positive', "x must be positive", lambda c: c['x'] <= 0),
+             ValidationRule('small', "x is large", lambda c: c['x'] > 10, severity='warning'))
+    batch = validate_batch(rules, {'x': [-1.0, 5.0, 20.0]})
+    np.testing.assert_array_equal(batch.is_valid, [False, True, True])
+    table = batch.table()
+    np.testing.assert_array_equal(table['row'], [0, 2])
+    assert list(table['code']) == ['positive', 'small']
+    assert list(table['severity']) == ['error', 'warning']
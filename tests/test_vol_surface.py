@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from src.pricing import VolSurface, black_scholes_price
+
+def smile_surface():
+    strikes, times = np.meshgrid(np.arange(80.0, 121.0, 10.0), [0.25, 0.5, 1.0])
+    vols = 0.2 + 0.05 * ((strikes - 100) / 20) ** 2
+    return VolSurface(strikes, times, vols), strikes, times, vols
+
+def test_vol_surface_returns_quoted_vols_on_its_nodes():
+    surface, strikes, times, vols = smile_surface()
+    np.testing.assert_allclose(surface(strikes, times), vols, atol=1e-12)
+
+    surface.update(100.0, 0.5, 0.4)
+    assert surface(100.0, 0.5) == pytest.approx(0.4)
+    assert surface(100.0, 0.25) == pytest.approx(0.2)
+
+def test_interpolation_is_linear_in_total_variance():
+    surface, _, _, _ = smile_surface()
+    # Halfway between two expiries at a node strike, and between two strikes on one expiry
+    variance = (0.2 ** 2 * 0.25 + 0.2 ** 2 * 0.5) / 2
+    assert surface(100.0, 0.375) == pytest.approx(np.sqrt(variance / 0.375))
+    assert surface(95.0, 0.5) == pytest.approx(np.sqrt((0.2125 ** 2 + 0.2 ** 2) / 2))
+    # Flat in strike beyond the grid, constant vol beyond the expiries
+    assert surface(200.0, 0.5) == pytest.approx(surface(120.0, 0.5))
+    assert surface(100.0, 2.0) == pytest.approx(0.2)
+
+def test_removed_quotes_are_filled_from_their_neighbours():
+    surface, _, _, _ = smile_surface()
+    surface.update(90.0, 1.0, np.nan)
+    assert surface(90.0, 1.0) == pytest.approx(np.sqrt((0.25 ** 2 + 0.2 ** 2) / 2))
+
+def test_a_rejected_update_leaves_the_surface_unchanged():
+    surface, strikes, times, vols = smile_surface()
+    # A valid re-quote of the first expiry together with every quote of the second one removed
+    with pytest.raises(ValueError):
+        surface.update(np.append(100.0, strikes[1]), np.append(0.25, times[1]), np.append(0.4, np.full(5, np.nan)))
+    # An off-grid node is rejected before anything is written
+    with pytest.raises(KeyError):
+        surface.update([100.0, 105.0], [0.25, 0.25], [0.4, 0.4])
+    np.testing.assert_allclose(surface(strikes, times), vols, atol=1e-12)
+    # The removed quotes did not stick either: re-quoting one node of that expiry keeps the others
+    surface.update(80.0, 0.5, 0.3)
+    assert surface(80.0, 0.5) == pytest.approx(0.3)
+    assert surface(100.0, 0.5) == pytest.approx(0.2)
+
+def test_from_quotes_recovers_the_pricing_vols():
+    surface, strikes, times, vols = smile_surface()
+    is_call = strikes >= 100.0
+    prices = black_scholes_price(is_call, 100.0, strikes, times, vols, 0.03)
+    rebuilt = VolSurface.from_quotes(is_call, prices, 100.0, strikes, times, rate=0.03)
+    np.testing.assert_allclose(rebuilt(strikes, times), vols, atol=1e-8)